@@ -116,3 +116,36 @@ def test_replay_pending_uploads_skips_missing_files(temp_dir):
     client = MagicMock()
     deploy._replay_pending_uploads("p", client, hf_token=None)
     client.predict.assert_not_called()
+
+
+def test_replay_pending_uploads_sends_media_in_batches(temp_dir, tmp_path):
+    from unittest.mock import MagicMock
+
+    from trackio.pending_uploads import replay_pending_uploads
+
+    for i in range(3):
+        media_path = tmp_path / f"img{i}.png"
+        media_path.write_bytes(b"png-bytes")
+        SQLiteStorage.add_pending_upload(
+            project="p",
+            space_id="user/space",
+            run_id="rid",
+            run_name="r",
+            step=i,
+            file_path=str(media_path),
+            relative_path=f"img{i}.png",
+        )
+
+    predict = MagicMock()
+    replay_pending_uploads(
+        SQLiteStorage.get_pending_uploads("p"),
+        "p",
+        predict=predict,
+        hf_token=None,
+        warn_missing=MagicMock(),
+        batch_size=2,
+    )
+
+    batch_sizes = [len(c.kwargs["uploads"]) for c in predict.call_args_list]
+    assert batch_sizes == [2, 1]
+    assert SQLiteStorage.get_pending_uploads("p") is None
@@ -0,0 +1,49 @@
+from argparse import Namespace
+
+import pytest
+
+from trackio import cli
+
+
+@pytest.mark.parametrize(
+    "handler, extra",
+    [
+        (cli._handle_get_metric, {"metric": "loss"}),
+        (cli._handle_get_snapshot, {}),
+    ],
+)
+def test_invalid_at_time_exits_before_connecting(handler, extra, monkeypatch):
+    def unexpected_remote(args):
+        raise AssertionError("remote client should not be created")
+
+    monkeypatch.setattr(cli, "_get_remote", unexpected_remote)
+    args = Namespace(
+        project="proj",
+        run="run",
+        step=None,
+        around=None,
+        window=None,
+        at_time="not-a-time",
+        json=False,
+        **extra,
+    )
+    with pytest.raises(SystemExit):
+        handler(args)
+
+
+def test_snapshot_without_a_filter_exits_before_connecting(monkeypatch):
+    def unexpected_remote(args):
+        raise AssertionError("remote client should not be created")
+
+    monkeypatch.setattr(cli, "_get_remote", unexpected_remote)
+    args = Namespace(
+        project="proj",
+        run="run",
+        step=None,
+        around=None,
+        window=None,
+        at_time=None,
+        json=False,
+    )
+    with pytest.raises(SystemExit):
+        cli._handle_get_snapshot(args)
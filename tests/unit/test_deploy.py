@@ -10,6 +10,13 @@ from trackio.bucket_storage import _list_bucket_file_paths
 from trackio.frontend_config import ResolvedFrontend
 
 
+@pytest.fixture(autouse=True)
+def _clear_deploy_caches():
+    deploy.close_clients()
+    yield
+    deploy.close_clients()
+
+
 def test_get_source_install_dependencies_includes_mcp():
     dependencies = deploy._get_source_install_dependencies().splitlines()
 
@@ -46,10 +53,13 @@ class _FakeHfApi:
     def __init__(self):
         self.uploaded_files = []
         self.uploaded_folders = []
+        self.commits = []
 
     def upload_file(self, **kwargs):
         fileobj = kwargs["path_or_fileobj"]
-        if isinstance(fileobj, io.BytesIO):
+        if isinstance(fileobj, bytes):
+            payload = fileobj.decode("utf-8")
+        elif isinstance(fileobj, io.BytesIO):
             payload = fileobj.getvalue().decode("utf-8")
         else:
             payload = fileobj.read().decode("utf-8")
@@ -63,6 +73,16 @@ class _FakeHfApi:
     def upload_folder(self, **kwargs):
         self.uploaded_folders.append(kwargs)
 
+    def create_commit(self, **kwargs):
+        self.commits.append(kwargs)
+        for operation in kwargs["operations"]:
+            self.uploaded_files.append(
+                {
+                    "path_in_repo": operation.path_in_repo,
+                    "payload": operation.path_or_fileobj.decode("utf-8"),
+                }
+            )
+
 
 def test_deploy_as_space_uploads_custom_frontend(tmp_path, monkeypatch):
     frontend_dir = tmp_path / "custom-frontend"
@@ -106,6 +126,12 @@ def test_deploy_as_space_uploads_custom_frontend(tmp_path, monkeypatch):
     assert (
         'trackio.show(frontend_dir="trackio_custom_frontend")' in app_upload["payload"]
     )
+    assert len(fake_api.commits) == 1
+    assert [item["path_in_repo"] for item in fake_api.uploaded_files] == [
+        "README.md",
+        "requirements.txt",
+        "app.py",
+    ]
 
 
 def test_deploy_as_static_space_uploads_resolved_frontend(tmp_path, monkeypatch):
@@ -197,3 +223,326 @@ def test_deploy_as_static_space_rejects_private_true(tmp_path, monkeypatch):
             private=True,
             frontend_dir=frontend_dir,
         )
+
+
+def test_submit_batches_sends_every_batch(monkeypatch):
+    monkeypatch.setattr(deploy, "SYNC_BATCH_SIZE", 2)
+    sent = []
+
+    class _Client:
+        def predict(self, api_name, logs, hf_token):
+            sent.append((api_name, [log["i"] for log in logs], hf_token))
+
+    items = [{"i": i} for i in range(5)]
+    with deploy.ThreadPoolExecutor(max_workers=3) as executor:
+        deploy._submit_batches(
+            executor, _Client(), "/bulk_log", deploy._chunked(items), "tok", "x"
+        )
+
+    assert sorted(sent) == [
+        ("/bulk_log", [0, 1], "tok"),
+        ("/bulk_log", [2, 3], "tok"),
+        ("/bulk_log", [4], "tok"),
+    ]
+
+
+def test_submit_batches_reraises_batch_failure(monkeypatch):
+    monkeypatch.setattr(deploy, "SYNC_BATCH_SIZE", 1)
+
+    class _Client:
+        def predict(self, api_name, logs, hf_token):
+            if logs[0]["i"] == 1:
+                raise ConnectionError("boom")
+
+    items = [{"i": i} for i in range(3)]
+    with deploy.ThreadPoolExecutor(max_workers=2) as executor:
+        with pytest.raises(ConnectionError, match="boom"):
+            deploy._submit_batches(
+                executor, _Client(), "/bulk_log", deploy._chunked(items), None, "x"
+            )
+
+
+def test_wait_until_space_exists_backs_off_with_jitter(monkeypatch):
+    calls = []
+    sleeps = []
+
+    class _Api:
+        def space_info(self, space_id):
+            calls.append(space_id)
+            if len(calls) < 3:
+                raise deploy.httpx.ConnectError("not yet")
+
+    monkeypatch.setattr(deploy.huggingface_hub, "HfApi", _Api)
+    monkeypatch.setattr(deploy.time, "sleep", sleeps.append)
+
+    deploy.wait_until_space_exists("abidlabs/demo-space")
+
+    assert len(calls) == 3
+    assert 0.5 <= sleeps[0] <= 1.0
+    assert 1.0 <= sleeps[1] <= 2.0
+
+
+def test_backoff_delay_never_exceeds_cap():
+    delays = [
+        deploy._backoff_delay(attempt, initial=1, cap=15)
+        for attempt in range(10)
+        for _ in range(50)
+    ]
+
+    assert max(delays) <= 15
+    assert min(delays) >= 1
+
+
+def test_upload_db_to_space_skips_prompt_without_tty(monkeypatch):
+    calls = []
+
+    class _Client:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def predict(self, *args, api_name, **kwargs):
+            calls.append(api_name)
+            return ["demo-project"]
+
+    monkeypatch.setattr(deploy, "RemoteClient", _Client)
+    monkeypatch.setattr(deploy.huggingface_hub.utils, "get_token", lambda: None)
+    monkeypatch.setattr(deploy.sys, "stdin", io.StringIO())
+    monkeypatch.setattr(
+        "builtins.input", lambda *a: pytest.fail("input() should not be called")
+    )
+
+    deploy.upload_db_to_space("demo-project", "abidlabs/demo-space")
+
+    assert calls == ["/get_all_projects"]
+
+
+def test_upload_db_to_space_prompts_in_notebook_without_tty(temp_dir, monkeypatch):
+    from trackio.sqlite_storage import SQLiteStorage
+
+    SQLiteStorage.bulk_log("demo-project", "run-1", [{"loss": 1.0}])
+    calls = []
+
+    class _Client:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def predict(self, *args, api_name, **kwargs):
+            calls.append(api_name)
+            return ["demo-project"]
+
+    monkeypatch.setattr(deploy, "RemoteClient", _Client)
+    monkeypatch.setattr(deploy.huggingface_hub.utils, "get_token", lambda: None)
+    monkeypatch.setattr(deploy.sys, "stdin", io.StringIO())
+    monkeypatch.setattr(deploy, "is_in_notebook", lambda: True)
+    monkeypatch.setattr("builtins.input", lambda *a: "y")
+
+    deploy.upload_db_to_space("demo-project", "abidlabs/demo-space")
+
+    assert calls == ["/get_all_projects", "/upload_db_to_space"]
+
+
+def test_upload_db_to_space_skips_when_prompt_hits_eof(monkeypatch):
+    calls = []
+
+    class _Client:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def predict(self, *args, api_name, **kwargs):
+            calls.append(api_name)
+            return ["demo-project"]
+
+    def closed_input(*args):
+        raise EOFError
+
+    monkeypatch.setattr(deploy, "RemoteClient", _Client)
+    monkeypatch.setattr(deploy.huggingface_hub.utils, "get_token", lambda: None)
+    monkeypatch.setattr(deploy, "is_in_notebook", lambda: True)
+    monkeypatch.setattr("builtins.input", closed_input)
+
+    deploy.upload_db_to_space("demo-project", "abidlabs/demo-space")
+
+    assert calls == ["/get_all_projects"]
+
+
+def test_upload_db_to_space_prefers_bucket_for_large_db(temp_dir, monkeypatch):
+    from trackio.sqlite_storage import SQLiteStorage
+
+    SQLiteStorage.bulk_log("demo-project", "run-1", [{"loss": 1.0}])
+    predicted = []
+    bucket_uploads = []
+
+    class _Client:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def predict(self, *args, api_name, **kwargs):
+            predicted.append(api_name)
+
+    monkeypatch.setattr(deploy, "RemoteClient", _Client)
+    monkeypatch.setattr(deploy.huggingface_hub.utils, "get_token", lambda: None)
+    monkeypatch.setattr(deploy, "_LARGE_DB_THRESHOLD", 0)
+    monkeypatch.setattr(
+        deploy, "_get_space_bucket_at_data_mount", lambda space_id: "abidlabs/bucket"
+    )
+    monkeypatch.setattr(
+        deploy,
+        "upload_db_to_bucket",
+        lambda project, bucket_id: bucket_uploads.append((project, bucket_id)),
+    )
+
+    deploy.upload_db_to_space(
+        "demo-project", "abidlabs/demo-space", force=True, prefer_hub=True
+    )
+
+    assert bucket_uploads == [("demo-project", "abidlabs/bucket")]
+    assert predicted == []
+
+
+def test_deploy_as_space_sets_space_variables_and_secret(monkeypatch):
+    fake_api = _FakeHfApi()
+    variables = {}
+    secrets = {}
+    writes = []
+
+    def add_space_variable(space_id, key, value):
+        writes.append(key)
+        variables[key] = value
+
+    def add_space_secret(space_id, key, value):
+        writes.append(key)
+        secrets[key] = value
+
+    monkeypatch.setattr(deploy.huggingface_hub, "HfApi", lambda: fake_api)
+    monkeypatch.setattr(deploy.huggingface_hub, "create_repo", lambda *a, **k: None)
+    monkeypatch.setattr(
+        deploy.huggingface_hub, "add_space_variable", add_space_variable
+    )
+    monkeypatch.setattr(deploy.huggingface_hub, "add_space_secret", add_space_secret)
+    monkeypatch.setattr(
+        deploy.huggingface_hub.utils, "disable_progress_bars", lambda: None
+    )
+    monkeypatch.setattr(deploy.huggingface_hub.utils, "get_token", lambda: "hf_tok")
+    monkeypatch.setattr(deploy, "_is_trackio_installed_from_source", lambda: False)
+    monkeypatch.setenv("TRACKIO_THEME", "soft")
+    monkeypatch.delenv("TRACKIO_PLOT_ORDER", raising=False)
+
+    with pytest.warns(FutureWarning):
+        deploy.deploy_as_space("abidlabs/demo-space", dataset_id="abidlabs/data")
+
+    assert secrets == {"HF_TOKEN": "hf_tok"}
+    assert writes == [
+        "HF_TOKEN",
+        "TRACKIO_DATASET_ID",
+        "TRACKIO_THEME",
+        "GRADIO_MCP_SERVER",
+    ]
+    assert variables["TRACKIO_DATASET_ID"] == "abidlabs/data"
+    assert variables["TRACKIO_THEME"] == "soft"
+    assert variables["GRADIO_MCP_SERVER"] == "True"
+    assert "TRACKIO_PLOT_ORDER" not in variables
+
+
+def test_sync_incremental_pending_only_skips_space_when_nothing_pending(
+    temp_dir, monkeypatch
+):
+    from trackio.sqlite_storage import SQLiteStorage
+
+    SQLiteStorage.bulk_log("demo-project", "run-1", [{"loss": 1.0}])
+    monkeypatch.setattr(
+        deploy,
+        "create_space_if_not_exists",
+        lambda *a, **k: pytest.fail("Space should not be touched"),
+    )
+
+    deploy.sync_incremental("demo-project", "abidlabs/demo-space", pending_only=True)
+
+
+def test_upload_db_to_space_reads_the_current_token(temp_dir, monkeypatch):
+    from trackio.sqlite_storage import SQLiteStorage
+
+    SQLiteStorage.bulk_log("demo-project", "run-1", [{"loss": 1.0}])
+    tokens = iter(["hf_old", None])
+    used = []
+
+    class _Client:
+        def __init__(self, space_id, hf_token=None, httpx_kwargs=None):
+            pass
+
+        def predict(self, *args, api_name, hf_token=None, **kwargs):
+            if api_name == "/upload_db_to_space":
+                used.append(hf_token)
+
+    monkeypatch.setattr(deploy, "RemoteClient", _Client)
+    monkeypatch.setattr(deploy.huggingface_hub.utils, "get_token", lambda: next(tokens))
+
+    deploy.upload_db_to_space("demo-project", "abidlabs/demo-space", force=True)
+    deploy.upload_db_to_space("demo-project", "abidlabs/demo-space", force=True)
+
+    assert used == ["hf_old", None]
+
+
+def test_get_remote_client_reuses_client_per_space_and_token(monkeypatch):
+    created = []
+
+    class _Client:
+        def __init__(self, space_id, hf_token=None, httpx_kwargs=None):
+            created.append((space_id, hf_token))
+
+    monkeypatch.setattr(deploy, "RemoteClient", _Client)
+
+    first = deploy._get_remote_client("abidlabs/demo-space", "tok")
+    assert deploy._get_remote_client("abidlabs/demo-space", "tok") is first
+    assert deploy._get_remote_client("abidlabs/demo-space", "other") is not first
+    assert created == [("abidlabs/demo-space", "tok"), ("abidlabs/demo-space", "other")]
+    assert all("tok" not in key for key in deploy._REMOTE_CLIENTS)
+
+    deploy.close_clients()
+    assert deploy._get_remote_client("abidlabs/demo-space", "tok") is not first
+
+
+def test_sync_incremental_reconnects_after_failed_send(temp_dir, monkeypatch):
+    from trackio.sqlite_storage import SQLiteStorage
+
+    SQLiteStorage.bulk_log("demo-project", "run-1", [{"loss": 1.0}])
+    created = []
+
+    class _Client:
+        def __init__(self, *args, **kwargs):
+            created.append(self)
+
+        def predict(self, *args, api_name, **kwargs):
+            if len(created) == 1:
+                raise ConnectionError("space restarted")
+            if api_name == "/get_run_summary":
+                return {"num_logs": 1}
+
+    monkeypatch.setattr(deploy, "RemoteClient", _Client)
+    monkeypatch.setattr(deploy.huggingface_hub.utils, "get_token", lambda: None)
+    monkeypatch.setattr(deploy, "create_space_if_not_exists", lambda *a, **k: None)
+    monkeypatch.setattr(deploy, "wait_until_space_exists", lambda *a, **k: None)
+
+    with pytest.raises(ConnectionError):
+        deploy.sync_incremental("demo-project", "abidlabs/demo-space")
+    assert not deploy._REMOTE_CLIENTS
+
+    deploy.sync_incremental("demo-project", "abidlabs/demo-space")
+    assert len(created) == 2
+
+
+def test_wait_until_space_running_polls_space_info(monkeypatch):
+    stages = iter(["BUILDING", "APP_STARTING", "RUNNING"])
+    sleeps = []
+
+    class _Api:
+        def space_info(self, space_id, timeout=None):
+            return SimpleNamespace(runtime=SimpleNamespace(stage=next(stages)))
+
+    monkeypatch.setattr(deploy.huggingface_hub, "HfApi", _Api)
+    monkeypatch.setattr(deploy.time, "sleep", sleeps.append)
+
+    deploy._wait_until_space_running("abidlabs/demo-space")
+
+    assert len(sleeps) == 2
+    assert 1.0 <= sleeps[0] <= 2.0
+    assert 2.0 <= sleeps[1] <= 4.0
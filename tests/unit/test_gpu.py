@@ -73,10 +73,16 @@ def mock_pynvml_env():
     gpu.pynvml = mock
     gpu._nvml_initialized = True
     gpu._energy_baseline = {}
+    gpu._handle_cache.clear()
+    gpu._power_limits.clear()
+    gpu._device_count = None
     yield mock
     gpu.pynvml = old_pynvml
     gpu._nvml_initialized = old_initialized
     gpu._energy_baseline = old_baseline
+    gpu._handle_cache.clear()
+    gpu._power_limits.clear()
+    gpu._device_count = None
 
 
 def test_get_all_gpu_count_ignores_cuda_visible_devices(mock_pynvml_env):
@@ -130,3 +136,85 @@ def test_collect_gpu_metrics_energy_baseline_tracks_physical_gpu(mock_pynvml_env
     assert first_metrics["gpu/0/energy_consumed"] == 0.0
     assert second_metrics["gpu/0/energy_consumed"] == 0.0
     assert second_metrics["gpu/2/energy_consumed"] == pytest.approx(0.6)
+
+
+def test_collect_gpu_metrics_reuses_device_handles(mock_pynvml_env):
+    gpu.collect_gpu_metrics(all_gpus=True)
+    gpu.collect_gpu_metrics(all_gpus=True)
+
+    assert mock_pynvml_env.nvmlDeviceGetHandleByIndex.call_count == 4
+    assert mock_pynvml_env.nvmlDeviceGetCount.call_count == 1
+
+
+def test_collect_gpu_metrics_uses_batched_field_values(mock_pynvml_env):
+    mock_pynvml_env.NVML_SUCCESS = 0
+    mock_pynvml_env.nvmlDeviceGetFieldValues.side_effect = lambda handle, ids: [
+        SimpleNamespace(nvmlReturn=0, valueType=3, value=SimpleNamespace(ullVal=7000)),
+        SimpleNamespace(nvmlReturn=0, valueType=3, value=SimpleNamespace(ullVal=2)),
+        SimpleNamespace(nvmlReturn=1, valueType=3, value=SimpleNamespace(ullVal=0)),
+    ]
+    mock_pynvml_env.nvmlDeviceGetTotalEccErrors.return_value = 5
+
+    metrics = gpu.collect_gpu_metrics(device=0)
+
+    assert metrics["gpu/0/energy_consumed"] == 0.0
+    assert metrics["gpu/0/corrected_memory_errors"] == 2
+    assert metrics["gpu/0/uncorrected_memory_errors"] == 5
+    mock_pynvml_env.nvmlDeviceGetTotalEnergyConsumption.assert_not_called()
+    assert mock_pynvml_env.nvmlDeviceGetTotalEccErrors.call_count == 1
+
+
+def test_collect_gpu_metrics_skips_slow_metrics(mock_pynvml_env):
+    gpu.collect_gpu_metrics(device=0)
+    mock_pynvml_env.reset_mock()
+
+    metrics = gpu.collect_gpu_metrics(device=0, include_slow=False)
+
+    assert metrics["gpu/0/power_percent"] == 50.0
+    for name in (
+        "power_limit",
+        "fan_speed",
+        "performance_state",
+        "corrected_memory_errors",
+        "uncorrected_memory_errors",
+    ):
+        assert f"gpu/0/{name}" not in metrics
+    mock_pynvml_env.nvmlDeviceGetPowerManagementLimit.assert_not_called()
+    mock_pynvml_env.nvmlDeviceGetFanSpeed.assert_not_called()
+    mock_pynvml_env.nvmlDeviceGetTotalEccErrors.assert_not_called()
+
+
+def test_gpu_monitor_logs_only_changed_metrics_between_keyframes():
+    monitor = gpu.GpuMonitor(run=MagicMock())
+    sample = {"gpu/0/utilization": 50, "gpu/0/powerLimit": 300}
+
+    assert monitor._changed_metrics(dict(sample)) == sample
+    assert monitor._changed_metrics(dict(sample)) == {}
+    assert monitor._changed_metrics({**sample, "gpu/0/utilization": 75}) == {
+        "gpu/0/utilization": 75
+    }
+    for _ in range(gpu.GPU_KEYFRAME_INTERVAL - 3):
+        monitor._changed_metrics({**sample, "gpu/0/utilization": 75})
+    assert monitor._changed_metrics({**sample, "gpu/0/utilization": 75}) == {
+        **sample,
+        "gpu/0/utilization": 75,
+    }
+
+
+def test_gpu_monitor_stops_promptly_and_drops_in_flight_sample():
+    run = MagicMock()
+    monitor = gpu.GpuMonitor(run=run, interval=60.0)
+
+    def collect(**kwargs):
+        monitor._stop_flag.set()
+        return {"gpu/0/utilization": 50}
+
+    with (
+        patch.object(gpu, "get_all_gpu_count", return_value=(1, [0])),
+        patch.object(gpu, "collect_gpu_metrics", side_effect=collect),
+    ):
+        monitor.start()
+        monitor.stop()
+
+    assert not monitor._thread.is_alive()
+    run.log_system.assert_not_called()
@@ -93,3 +93,25 @@ def test_gradio_upload_aliases_api_upload(monkeypatch, temp_dir):
     g = client.post("/gradio_api/upload", files={"files": ("a.txt", b"x")})
     assert g.status_code == 200
     assert "paths" in g.json()
+
+
+def test_file_route_answers_conditional_requests(tmp_path):
+    media = tmp_path / "image.png"
+    media.write_bytes(b"png-bytes")
+    app = create_trackio_starlette_app([], {}, allowed_file_roots=[tmp_path])
+    client = TestClient(app)
+
+    first = client.get("/file", params={"path": str(media)})
+    assert first.status_code == 200
+    assert first.content == b"png-bytes"
+
+    cached = client.get(
+        "/file",
+        params={"path": str(media)},
+        headers={"If-None-Match": first.headers["etag"]},
+    )
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    missing = client.get("/file", params={"path": str(tmp_path / "missing.png")})
+    assert missing.status_code == 404
@@ -104,7 +104,7 @@ def test_reserved_keys_are_renamed(temp_dir):
 
 
 def test_auto_log_gpu(temp_dir):
-    def fake_gpu_metrics(device=None, all_gpus=False):
+    def fake_gpu_metrics(device=None, all_gpus=False, include_slow=True):
         return {
             "gpu/0/utilization": 75,
             "gpu/0/allocated_memory": 4.5,
@@ -143,7 +143,7 @@ def test_auto_log_gpu(temp_dir):
 
 
 def test_auto_log_gpu_multi(temp_dir):
-    def fake_gpu_metrics(device=None, all_gpus=False):
+    def fake_gpu_metrics(device=None, all_gpus=False, include_slow=True):
         metrics = {
             "gpu/0/utilization": 75,
             "gpu/0/allocated_memory": 4.5,
@@ -188,6 +188,96 @@ def test_auto_log_gpu_multi(temp_dir):
     assert log["gpu/mean_utilization"] == 70
 
 
+def test_import_from_csv_skips_empty_cells_and_text_columns(temp_dir, tmp_path):
+    csv_path = tmp_path / "sparse.csv"
+    csv_path.write_text(
+        "\n".join(
+            [
+                "step,loss,eval/acc,note",
+                "0,1.5,,start",
+                "1,,,mid",
+                "2.0,0.5,0.9,end",
+            ]
+        )
+    )
+
+    trackio.import_csv(csv_path=str(csv_path), project="sparse_csv", name="run")
+
+    results = SQLiteStorage.get_logs(project="sparse_csv", run="run")
+    assert [r["step"] for r in results] == [0, 2]
+    assert results[0]["loss"] == 1.5
+    assert "eval/acc" not in results[0]
+    assert results[1]["eval/acc"] == 0.9
+    assert all("note" not in r for r in results)
+
+
+def test_import_csv_to_space_prefers_the_space_bucket(temp_dir, tmp_path, monkeypatch):
+    from trackio import deploy
+
+    uploads = []
+    monkeypatch.setattr(deploy, "create_space_if_not_exists", lambda **kwargs: None)
+    monkeypatch.setattr(deploy, "wait_until_space_exists", lambda **kwargs: None)
+    monkeypatch.setattr(
+        deploy, "upload_db_to_space", lambda **kwargs: uploads.append(kwargs)
+    )
+    csv_path = tmp_path / "metrics.csv"
+    csv_path.write_text("step,loss\n0,1.0\n")
+
+    trackio.import_csv(
+        csv_path=str(csv_path),
+        project="space_csv",
+        name="run",
+        space_id="user/space",
+    )
+
+    assert uploads == [
+        {
+            "project": "space_csv",
+            "space_id": "user/space",
+            "force": False,
+            "prefer_hub": True,
+        }
+    ]
+
+
+def test_import_from_csv_streams_rows_in_chunks(temp_dir, tmp_path, monkeypatch):
+    from trackio import imports
+
+    monkeypatch.setattr(imports, "CSV_IMPORT_CHUNK_SIZE", 2)
+    csv_path = tmp_path / "chunked.csv"
+    csv_path.write_text(
+        "\n".join(
+            [
+                "step,loss,tag",
+                "0,1.0,1",
+                "1,0.8,2",
+                "2,0.6,3",
+                "3,0.4,late-text",
+                "4,0.2,5",
+            ]
+        )
+    )
+
+    trackio.import_csv(csv_path=str(csv_path), project="chunked_csv", name="run")
+
+    results = SQLiteStorage.get_logs(project="chunked_csv", run="run")
+    assert [r["step"] for r in results] == [0, 1, 2, 3, 4]
+    assert [r["loss"] for r in results] == [1.0, 0.8, 0.6, 0.4, 0.2]
+    assert all("tag" not in r for r in results)
+
+
+def test_import_from_csv_handles_short_and_blank_rows(temp_dir, tmp_path):
+    csv_path = tmp_path / "ragged.csv"
+    csv_path.write_text("step,loss,acc\n0,1.0,0.1\n\n1\n2,0.5\n")
+
+    trackio.import_csv(csv_path=str(csv_path), project="ragged_csv", name="run")
+
+    results = SQLiteStorage.get_logs(project="ragged_csv", run="run")
+    assert [r["step"] for r in results] == [0, 2]
+    assert results[1]["loss"] == 0.5
+    assert "acc" not in results[1]
+
+
 def test_import_from_csv_without_numeric_metrics_raises(temp_dir, tmp_path):
     csv_path = tmp_path / "logs.csv"
     csv_path.write_text(
@@ -206,3 +296,18 @@ def test_import_from_csv_without_numeric_metrics_raises(temp_dir, tmp_path):
             project="test_project_no_metrics",
             name="test_run",
         )
+
+
+def test_save_copies_files_into_project_files_dir(temp_dir, tmp_path, monkeypatch):
+    from trackio.media import get_project_media_path
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "notes.txt").write_text("hello")
+
+    trackio.init(project="save_project", name="run")
+    trackio.save("notes.txt")
+    trackio.save("notes.txt")
+    trackio.finish()
+
+    files_dir = get_project_media_path("save_project", relative_path=".")
+    assert (files_dir / "notes.txt").read_text() == "hello"
@@ -10,6 +10,7 @@ import trackio
 import trackio.context_vars as context_vars
 import trackio.utils as trackio_utils
 from trackio import Api
+from trackio.compression import REQUEST_ENCODINGS
 from trackio.remote_client import RemoteClient as Client
 from trackio.sqlite_storage import SQLiteStorage
 
@@ -175,6 +176,76 @@ def test_server_url_logs_to_self_hosted_server(temp_dir):
         app.close()
 
 
+def test_bulk_ingest_writes_every_section(temp_dir):
+    project = "test_bulk_ingest"
+    app, _, _, full_url = trackio.show(block_thread=False, open_browser=False)
+
+    try:
+        client = Client(full_url, verbose=False)
+        assert client.supports("bulk_ingest")
+
+        entry = {"project": project, "run": "run-1", "run_id": "run-1"}
+        failed = client.predict(
+            api_name="/bulk_ingest",
+            logs=[{**entry, "metrics": {"loss": 0.5}, "step": 0}],
+            system_logs=[
+                {**entry, "metrics": {"cpu": 1.0}, "timestamp": "2024-01-01T00:00:00"}
+            ],
+            alerts=[
+                {
+                    **entry,
+                    "title": "spike",
+                    "text": None,
+                    "level": "warn",
+                    "step": 0,
+                    "timestamp": "2024-01-01T00:00:00",
+                }
+            ],
+            hf_token=None,
+        )
+
+        assert failed == {}
+        assert SQLiteStorage.get_logs(project=project, run="run-1")[0]["loss"] == 0.5
+        assert SQLiteStorage.get_system_logs(project=project, run="run-1")
+        assert SQLiteStorage.get_alerts(project)[0]["title"] == "spike"
+    finally:
+        app.close()
+
+
+def test_bulk_ingest_reports_only_the_failed_sections(temp_dir, monkeypatch):
+    project = "test_bulk_ingest_partial"
+    app, _, _, full_url = trackio.show(block_thread=False, open_browser=False)
+
+    def failing_bulk_alert(*args, **kwargs):
+        raise RuntimeError("alerts unavailable")
+
+    monkeypatch.setattr(SQLiteStorage, "bulk_alert", failing_bulk_alert)
+    try:
+        client = Client(full_url, verbose=False)
+        entry = {"project": project, "run": "run-1", "run_id": "run-1"}
+        failed = client.predict(
+            api_name="/bulk_ingest",
+            logs=[{**entry, "metrics": {"loss": 0.5}, "step": 0}],
+            alerts=[
+                {
+                    **entry,
+                    "title": "spike",
+                    "text": None,
+                    "level": "warn",
+                    "step": 0,
+                    "timestamp": "2024-01-01T00:00:00",
+                }
+            ],
+            hf_token=None,
+        )
+
+        assert list(failed) == ["alerts"]
+        assert "alerts unavailable" in failed["alerts"]
+        assert SQLiteStorage.get_logs(project=project, run="run-1")[0]["loss"] == 0.5
+    finally:
+        app.close()
+
+
 def test_local_dashboard_returns_400_for_missing_required_parameter(temp_dir):
     app, url, _, _ = trackio.show(block_thread=False, open_browser=False)
 
@@ -438,3 +509,77 @@ def test_local_dashboard_supports_mcp(temp_dir):
     finally:
         trackio.delete_project(project, force=True)
         app.close()
+
+
+def test_remote_client_compresses_large_request_bodies(temp_dir):
+    from trackio.compression import REQUEST_ENCODINGS, encode_request_body
+
+    project = "test_compressed_bulk_log"
+    app, url, _, full_url = trackio.show(block_thread=False, open_browser=False)
+
+    try:
+        client = Client(full_url, verbose=False)
+        assert client._client.request_encoding == REQUEST_ENCODINGS[0]
+
+        logs = [
+            {
+                "project": project,
+                "run": "run-1",
+                "metrics": {"train/loss": 1.0 / (step + 1), "train/acc": 0.5},
+                "step": step,
+            }
+            for step in range(50)
+        ]
+        client.predict(api_name="/bulk_log", logs=logs, hf_token=None)
+        assert len(SQLiteStorage.get_logs(project=project, run="run-1")) == 50
+
+        response = httpx.post(
+            f"{url.rstrip('/')}/api/get_runs_for_project",
+            content=encode_request_body(b'{"project": "x"}', "gzip"),
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+            timeout=5,
+        )
+        assert response.status_code == 200
+
+        response = httpx.post(
+            f"{url.rstrip('/')}/api/get_runs_for_project",
+            content=b'{"project": "x"}',
+            headers={"Content-Type": "application/json", "Content-Encoding": "zstd"},
+            timeout=5,
+        )
+        assert response.status_code == 415
+    finally:
+        app.close()
+
+
+@pytest.mark.parametrize("encoding", REQUEST_ENCODINGS)
+def test_decode_request_body_caps_decoded_size(encoding, monkeypatch):
+    from trackio import compression
+
+    monkeypatch.setattr(compression, "MAX_DECODED_REQUEST_SIZE", 1024)
+    small = compression.encode_request_body(b"x" * 1024, encoding)
+    assert compression.decode_request_body(small, encoding) == b"x" * 1024
+
+    bomb = compression.encode_request_body(b"x" * (1024 * 1024), encoding)
+    with pytest.raises(compression.RequestBodyTooLargeError):
+        compression.decode_request_body(bomb, encoding)
+    with pytest.raises(EOFError):
+        compression.decode_request_body(small[: len(small) // 2], encoding)
+
+
+def test_oversized_compressed_request_body_returns_413(temp_dir, monkeypatch):
+    from trackio import compression
+
+    monkeypatch.setattr(compression, "MAX_DECODED_REQUEST_SIZE", 1024)
+    app, url, _, _ = trackio.show(block_thread=False, open_browser=False)
+
+    try:
+        response = httpx.post(
+            f"{url.rstrip('/')}/api/bulk_log",
+            content=compression.encode_request_body(b" " * (1024 * 1024), "gzip"),
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+            timeout=5,
+        )
+        assert response.status_code == 413
+    finally:
+        app.close()
@@ -132,3 +132,186 @@ def test_get_project_files_resolves_dotted_project(temp_dir):
 
     found = server.get_project_files("mymodel")
     assert any(f["name"] == "weights.bin" for f in found)
+
+
+def test_step_media_dir_recreated_after_removal(image_ndarray, temp_dir):
+    import shutil
+
+    from trackio.utils import project_media_dir
+
+    first = TrackioImage(image_ndarray)
+    first._save("project", "run", 3)
+    shutil.rmtree(project_media_dir("project") / "run")
+
+    second = TrackioImage(image_ndarray)
+    second._save("project", "run", 3)
+    assert second._get_absolute_file_path().is_file()
+
+
+def test_get_project_media_path_recreates_removed_step_dir(temp_dir):
+    import shutil
+
+    from trackio.media.utils import get_project_media_path
+    from trackio.utils import project_media_dir
+
+    first = get_project_media_path(project="p", run="r", step=0)
+    shutil.rmtree(project_media_dir("p"))
+
+    second = get_project_media_path(project="p", run="r", step=0)
+    assert second == first
+    assert second.is_dir()
+
+
+def test_missing_source_file_is_not_retried(temp_dir, monkeypatch):
+    source = Path(temp_dir) / "source.png"
+    source.write_bytes(b"png")
+    image = TrackioImage(str(source))
+    source.unlink()
+    calls = []
+    original = TrackioImage._save_media
+
+    def counting_save_media(self, file_path):
+        calls.append(file_path)
+        return original(self, file_path)
+
+    monkeypatch.setattr(TrackioImage, "_save_media", counting_save_media)
+    with pytest.raises(FileNotFoundError):
+        image._save("project", "run", 0)
+    assert len(calls) == 1
+
+
+def test_image_keeps_png_native_mode(temp_dir):
+    from PIL import Image as PILImage
+
+    image = TrackioImage(np.zeros((8, 8, 3), dtype=np.uint8))
+    image._save("project", "run", 0)
+    with PILImage.open(image._get_absolute_file_path()) as saved:
+        assert saved.mode == "RGB"
+
+    cmyk = TrackioImage(PILImage.new("CMYK", (8, 8)))
+    cmyk._save("project", "run", 0)
+    with PILImage.open(cmyk._get_absolute_file_path()) as saved:
+        assert saved.mode == "RGBA"
+
+
+def test_image_from_encoded_bytes(temp_dir):
+    import io
+
+    from PIL import Image as PILImage
+
+    buffer = io.BytesIO()
+    PILImage.new("RGB", (4, 4), color="red").save(buffer, format="JPEG")
+    jpeg_bytes = buffer.getvalue()
+
+    image = TrackioImage(jpeg_bytes)
+    image._save("project", "run", 0)
+    assert image._get_relative_file_path().suffix == ".jpg"
+    assert image._get_absolute_file_path().read_bytes() == jpeg_bytes
+
+    buffer = io.BytesIO()
+    PILImage.new("RGB", (4, 4)).save(buffer, format="BMP")
+    bmp = TrackioImage(buffer.getvalue())
+    bmp._save("project", "run", 0)
+    assert bmp._get_relative_file_path().suffix == ".png"
+
+    with pytest.raises(ValueError):
+        TrackioImage(b"not an image")
+
+
+@pytest.mark.parametrize("batch", [1, 3])
+def test_video_accepts_channels_last_arrays(batch):
+    frames = np.random.randint(0, 255, (batch, 4, 3, 8, 6), dtype=np.uint8)
+
+    channels_first = TrackioVideo._process_ndarray(frames)
+    channels_last = TrackioVideo._process_ndarray(np.moveaxis(frames, 2, -1))
+
+    assert channels_first.shape[-1] == 3
+    np.testing.assert_array_equal(channels_first, channels_last)
+
+
+@pytest.mark.parametrize("shape", [(4, 3, 8, 3), (4, 1, 8, 3), (4, 4, 8, 3)])
+def test_video_reads_ambiguous_shapes_as_channels_first(shape):
+    frames = np.random.randint(0, 255, shape, dtype=np.uint8)
+
+    video = TrackioVideo._as_channels_last_batch(frames)
+
+    np.testing.assert_array_equal(video[0], np.moveaxis(frames, 1, -1))
+
+
+@pytest.mark.parametrize(
+    "frames",
+    [
+        np.zeros((4, 1, 8, 6), dtype=np.uint8),
+        np.zeros((4, 4, 8, 6), dtype=np.uint8),
+        np.zeros((2, 4, 4, 8, 6), dtype=np.uint8),
+    ],
+)
+def test_video_save_rejects_non_rgb_arrays(frames, temp_dir):
+    with pytest.raises(ValueError):
+        TrackioVideo(frames)._save("project", "run", 0)
+
+
+def test_video_reads_channels_last_when_unambiguous():
+    frames = np.random.randint(0, 255, (4, 5, 8, 3), dtype=np.uint8)
+
+    video = TrackioVideo._as_channels_last_batch(frames)
+
+    np.testing.assert_array_equal(video[0], frames)
+
+
+def test_background_image_save_uses_snapshot(temp_dir):
+    from PIL import Image as PILImage
+
+    from trackio.media.media import wait_for_media_writes
+
+    array = np.zeros((8, 8, 3), dtype=np.uint8)
+    image = TrackioImage(array)
+    image._save("project", "run", 0, background=True)
+    array[:] = 255
+    wait_for_media_writes()
+
+    with PILImage.open(image._get_absolute_file_path()) as saved:
+        assert np.asarray(saved).max() == 0
+
+
+def test_image_compress_level_override(temp_dir, monkeypatch):
+    from PIL import Image as PILImage
+
+    array = np.tile(np.arange(256, dtype=np.uint8), (64, 1))[..., None].repeat(3, 2)
+    fast = TrackioImage(array)
+    fast._save("project", "run", 0)
+    monkeypatch.setattr(TrackioImage, "COMPRESS_LEVEL", 9)
+    small = TrackioImage(array)
+    small._save("project", "run", 0)
+
+    for image in (fast, small):
+        with PILImage.open(image._get_absolute_file_path()) as saved:
+            assert np.array_equal(np.asarray(saved), array)
+    assert (
+        small._get_absolute_file_path().stat().st_size
+        <= fast._get_absolute_file_path().stat().st_size
+    )
+
+
+def test_iter_tiled_frames_matches_tiled_video():
+    video = np.random.randint(0, 255, (3, 4, 8, 6, 3), dtype=np.uint8)
+    tiled = TrackioVideo._tile_batched_videos(video)
+    streamed = [frame.copy() for frame in TrackioVideo._iter_tiled_frames(video)]
+    assert np.array_equal(np.stack(streamed), tiled)
+
+
+def test_check_ffmpeg_installed_remembers_success(monkeypatch):
+    import shutil
+
+    from trackio.media import utils as media_utils
+
+    monkeypatch.setattr(media_utils, "_ffmpeg_found", False)
+    monkeypatch.setattr(shutil, "which", lambda name: None)
+    with pytest.raises(RuntimeError):
+        media_utils.check_ffmpeg_installed()
+
+    calls = []
+    monkeypatch.setattr(shutil, "which", lambda name: calls.append(name) or "ffmpeg")
+    media_utils.check_ffmpeg_installed()
+    media_utils.check_ffmpeg_installed()
+    assert calls == ["ffmpeg"]
@@ -29,6 +29,47 @@ def test_run_log_writes_to_sqlite_locally(temp_dir):
     assert run.id is not None
 
 
+def test_local_sender_sleeps_until_woken(temp_dir, monkeypatch):
+    run = Run(url=None, project="proj", client=None, name="idle", space_id=None)
+    writes = []
+    monkeypatch.setattr(run, "_write_logs_to_sqlite", writes.append)
+    time.sleep(0.2)
+    assert run._local_sender_thread.is_alive()
+    assert not run._wake_event.is_set()
+
+    run.log({"x": 1})
+    assert run._wake_event.is_set() or writes
+
+    start = time.monotonic()
+    run.finish()
+    assert time.monotonic() - start < 5
+    assert len(writes) == 1
+
+
+def test_finish_without_logs_returns_promptly(temp_dir):
+    run = Run(url=None, project="proj", client=None, name="empty", space_id=None)
+    start = time.monotonic()
+    run.finish()
+    assert time.monotonic() - start < 5
+    assert not run._local_sender_thread.is_alive()
+
+
+def test_log_spills_to_sqlite_when_queue_is_full(temp_dir, monkeypatch):
+    monkeypatch.setattr("trackio.run.MAX_QUEUED_LOGS", 3)
+    run = Run(url=None, project="proj", client=None, name="spill", space_id=None)
+    spilled = []
+    monkeypatch.setattr(
+        run, "_write_logs_to_sqlite", lambda logs: spilled.append(len(logs))
+    )
+    for i in range(7):
+        run.log({"x": i})
+
+    assert spilled == [3, 3]
+    assert len(run._queued_logs) == 1
+    run.finish()
+    assert spilled == [3, 3, 1]
+
+
 def test_markdown_logging(temp_dir):
     run = Run(url=None, project="proj", client=None, name="run-report", space_id=None)
     run.log({"loss": 0.1, "summary": Markdown("# Training summary")})
@@ -69,6 +110,144 @@ def test_run_log_calls_client_for_spaces(temp_dir):
     assert "config" in kwargs["logs"][0]
 
 
+def test_remote_sender_uses_bulk_ingest_when_supported(temp_dir):
+    client = DummyClient()
+    client.predict.return_value = {}
+    client.supports = lambda feature: feature == "bulk_ingest"
+    run = Run(
+        url="fake_url",
+        project="proj",
+        client=client,
+        name="run1",
+        space_id="user/space",
+    )
+    run.log({"x": 1})
+    run.log_system({"cpu": 1.0})
+    run.finish()
+
+    api_names = [call.kwargs["api_name"] for call in client.predict.call_args_list]
+    assert api_names == ["/bulk_ingest"]
+    kwargs = client.predict.call_args.kwargs
+    assert [log["metrics"] for log in kwargs["logs"]] == [{"x": 1}]
+    assert len(kwargs["system_logs"]) == 1
+    assert kwargs["uploads"] == [] and kwargs["alerts"] == []
+
+
+def test_remote_sender_requeues_only_failed_bulk_ingest_sections(temp_dir, monkeypatch):
+    client = DummyClient()
+    client.predict.return_value = {"system_logs": "disk full"}
+    client.supports = lambda feature: feature == "bulk_ingest"
+    run = Run(
+        url="fake_url",
+        project="proj",
+        client=client,
+        name="run1",
+        space_id="user/space",
+    )
+    persisted = []
+    monkeypatch.setattr(
+        run, "_persist_logs_locally", lambda logs: persisted.append("logs")
+    )
+    monkeypatch.setattr(
+        run,
+        "_persist_system_logs_locally",
+        lambda logs: persisted.append("system_logs"),
+    )
+
+    assert not run._send_fused_batch(
+        client, [{"metrics": {"x": 1}}], [{"metrics": {"cpu": 1.0}}], [], []
+    )
+    assert persisted == ["system_logs"]
+    run.finish()
+
+
+def test_log_not_blocked_by_slow_remote_send(temp_dir):
+    import threading
+
+    sending = threading.Event()
+    release = threading.Event()
+
+    def slow_predict(**kwargs):
+        sending.set()
+        release.wait(timeout=5)
+
+    client = DummyClient()
+    client.predict.side_effect = slow_predict
+    run = Run(
+        url="fake_url",
+        project="proj",
+        client=client,
+        name="run1",
+        space_id="user/space",
+    )
+    run.log({"x": 1})
+    assert sending.wait(timeout=5)
+
+    start = time.monotonic()
+    run.log({"x": 2})
+    assert time.monotonic() - start < 1
+    release.set()
+    run.finish()
+    sent = [
+        log["metrics"]["x"]
+        for call in client.predict.call_args_list
+        for log in call.kwargs.get("logs", [])
+    ]
+    assert sent == [1, 2]
+
+
+def test_finish_and_artifact_calls_do_not_overlap_in_flight_send(temp_dir):
+    import threading
+
+    sending = threading.Event()
+    release = threading.Event()
+    active_lock = threading.Lock()
+    active = []
+    overlaps = []
+
+    def tracking_predict(**kwargs):
+        with active_lock:
+            if active:
+                overlaps.append((active[0], kwargs["api_name"]))
+            active.append(kwargs["api_name"])
+        try:
+            if kwargs["api_name"] == "/bulk_log" and not sending.is_set():
+                sending.set()
+                release.wait(timeout=5)
+            return {}
+        finally:
+            with active_lock:
+                active.remove(kwargs["api_name"])
+
+    client = DummyClient()
+    client.predict.side_effect = tracking_predict
+    run = Run(
+        url="fake_url",
+        project="proj",
+        client=client,
+        name="run1",
+        space_id="user/space",
+    )
+    run.log({"x": 1})
+    assert sending.wait(timeout=5)
+
+    artifact = threading.Thread(
+        target=run._artifact_log_with_retry, kwargs={"manifest": []}
+    )
+    finisher = threading.Thread(target=run.finish)
+    artifact.start()
+    finisher.start()
+    time.sleep(0.3)
+    release.set()
+    artifact.join(timeout=10)
+    finisher.join(timeout=10)
+
+    assert not artifact.is_alive() and not finisher.is_alive()
+    assert overlaps == []
+    api_names = [call.kwargs["api_name"] for call in client.predict.call_args_list]
+    assert "/artifact_log" in api_names
+
+
 def test_init_resume_modes(temp_dir):
     run = init(
         project="test-project",
@@ -310,3 +489,47 @@ def test_local_flush_failure_does_not_crash(temp_dir, monkeypatch):
 
     with pytest.warns(UserWarning, match="trackio failed to flush metric logs"):
         run.finish()
+
+
+def test_remote_hf_token_cached_until_send_fails(temp_dir, monkeypatch):
+    import huggingface_hub.utils
+
+    calls = []
+
+    def fake_get_token():
+        calls.append(1)
+        return f"token-{len(calls)}"
+
+    monkeypatch.setattr(huggingface_hub.utils, "get_token", fake_get_token)
+    client = DummyClient()
+    run = Run(
+        url="fake_url",
+        project="proj",
+        client=client,
+        name="run1",
+        space_id="user/space",
+    )
+    token = run._hf_token_for_remote()
+    calls_before = len(calls)
+    assert run._hf_token_for_remote() == token
+    assert len(calls) == calls_before
+
+    client.predict.side_effect = RuntimeError("401 Unauthorized")
+    run.log({"x": 1})
+    deadline = time.monotonic() + 5
+    while run._hf_token is not None and time.monotonic() < deadline:
+        time.sleep(0.05)
+    client.predict.side_effect = None
+    assert run._hf_token_for_remote() != token
+    run.finish()
+
+
+def test_group_entries_by_run_preserves_order():
+    from trackio.run import _group_entries_by_run
+
+    a = [{"project": "p", "run": "a", "run_id": "1", "step": i} for i in range(3)]
+    assert _group_entries_by_run(a) == {("p", "a", "1"): a}
+
+    b = {"project": "p", "run": "b", "run_id": "2", "step": 0}
+    grouped = _group_entries_by_run([a[0], b, a[1]])
+    assert grouped == {("p", "a", "1"): [a[0], a[1]], ("p", "b", "2"): [b]}
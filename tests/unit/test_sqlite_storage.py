@@ -326,6 +326,131 @@ def test_get_metric_values_respects_run_id_and_name_resolves_latest_run(temp_dir
     assert [row["value"] for row in second_by_id] == [2.0]
 
 
+def test_get_reports_filters_markdown_entries(temp_dir):
+    project = "proj_reports"
+    report = {"_type": "trackio.markdown", "_value": "# hello"}
+    SQLiteStorage.bulk_log(
+        project,
+        "run-a",
+        [
+            {"loss": 1.0, "notes": "plain string"},
+            {"summary": report, "other": {"_type": "trackio.table", "_value": []}},
+        ],
+        run_id="run-a-id",
+        timestamps=["2024-01-01T00:00:00+00:00", "2024-01-01T00:00:01+00:00"],
+    )
+    SQLiteStorage.bulk_log(
+        project,
+        "run-b",
+        [{"summary": {"_type": "trackio.markdown", "_value": "second"}}],
+        run_id="run-b-id",
+        timestamps=["2024-01-02T00:00:00+00:00"],
+    )
+
+    all_reports = SQLiteStorage.get_reports(project)
+    assert [(r["run"], r["report"], r["content"]) for r in all_reports] == [
+        ("run-a", "summary", "# hello"),
+        ("run-b", "summary", "second"),
+    ]
+    assert all_reports[0]["step"] == 1
+
+    run_b = SQLiteStorage.get_reports(project, run="run-b")
+    assert [r["content"] for r in run_b] == ["second"]
+    assert SQLiteStorage.get_reports(project, run="run-a", report_name="loss") == []
+    assert SQLiteStorage.get_reports(project, run="missing") == []
+    assert SQLiteStorage.get_reports("no_such_project") == []
+
+
+def test_run_and_metric_exists(temp_dir):
+    project = "proj_exists"
+    SQLiteStorage.bulk_log(
+        project,
+        "run-a",
+        [{"loss": 1.0}, {"acc": 0.5}],
+        run_id="run-a-id",
+    )
+
+    assert SQLiteStorage.run_exists(project, "run-a")
+    assert not SQLiteStorage.run_exists(project, "run-b")
+    assert not SQLiteStorage.run_exists("no_such_project", "run-a")
+
+    assert SQLiteStorage.metric_exists(project, "run-a", "acc")
+    assert not SQLiteStorage.metric_exists(project, "run-a", "missing")
+    assert not SQLiteStorage.metric_exists(project, "run-b", "loss")
+
+
+def test_run_exists_matches_get_runs_for_artifact_links(temp_dir):
+    project = "proj_exists_links"
+    SQLiteStorage.bulk_log(project, "renamed", [{"loss": 1.0}], run_id="id-1")
+    db_path = SQLiteStorage.get_project_db_path(project)
+    with sqlite3.connect(db_path) as conn:
+        conn.executemany(
+            "INSERT INTO run_artifact_links "
+            "(run_id, run_name, artifact_version_id, direction, created_at) "
+            "VALUES (?, ?, 1, 'output', '2024-01-01')",
+            [("id-1", "old-name"), ("id-2", "links-only")],
+        )
+
+    runs = SQLiteStorage.get_runs(project)
+    for name in ("renamed", "old-name", "links-only", "missing"):
+        assert SQLiteStorage.run_exists(project, name) == (name in runs)
+    assert not SQLiteStorage.run_exists(project, "old-name")
+
+
+def test_run_exists_on_database_without_run_ids(temp_dir):
+    db_path = SQLiteStorage.get_project_db_path("legacy")
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("""
+            CREATE TABLE metrics (
+                id INTEGER PRIMARY KEY,
+                timestamp TEXT,
+                run_name TEXT,
+                step INTEGER,
+                metrics TEXT
+            )
+        """)
+        conn.execute(
+            "INSERT INTO metrics (timestamp, run_name, step, metrics) VALUES (?, ?, ?, ?)",
+            ("2024-01-01", "old-run", 0, orjson.dumps({"loss": 0.5})),
+        )
+
+    assert SQLiteStorage.get_runs("legacy") == ["old-run"]
+    assert SQLiteStorage.run_exists("legacy", "old-run")
+    assert not SQLiteStorage.run_exists("legacy", "other-run")
+
+
+def test_get_system_metric_series(temp_dir):
+    project = "proj_system_series"
+    SQLiteStorage.bulk_log_system(
+        project,
+        "run-a",
+        [
+            {"gpu/0/util": 10.0, "gpu/0/throttled": True},
+            {"gpu/0/util": float("inf")},
+            {"cpu": 1.0},
+        ],
+        run_id="run-a-id",
+        timestamps=[
+            "2024-01-01T00:00:00+00:00",
+            "2024-01-01T00:00:01+00:00",
+            "2024-01-01T00:00:02+00:00",
+        ],
+    )
+
+    util = SQLiteStorage.get_system_metric_series(project, "run-a", "gpu/0/util")
+    assert util == [
+        {"gpu/0/util": 10.0, "timestamp": "2024-01-01T00:00:00+00:00"},
+        {"gpu/0/util": float("inf"), "timestamp": "2024-01-01T00:00:01+00:00"},
+    ]
+    throttled = SQLiteStorage.get_system_metric_series(
+        project, "run-a", "gpu/0/throttled"
+    )
+    assert throttled[0]["gpu/0/throttled"] is True
+    assert SQLiteStorage.get_system_metric_series(project, "run-a", "missing") == []
+    assert SQLiteStorage.get_system_metric_series(project, "run-b", "cpu") == []
+
+
 def test_rename_run(temp_dir):
     project = "test_project"
     old_name = "old_run"
@@ -524,3 +649,41 @@ def test_query_project_normalizes_bytes(temp_dir):
 def test_query_project_missing_project(temp_dir):
     with pytest.raises(FileNotFoundError):
         SQLiteStorage.query_project("nonexistent", "SELECT 1")
+
+
+def test_iter_all_logs_for_sync_yields_batches(temp_dir):
+    project = "sync-batches"
+    SQLiteStorage.bulk_log(project, "run-a", [{"x": i} for i in range(5)])
+
+    batches = list(SQLiteStorage.iter_all_logs_for_sync(project, batch_size=2))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [entry["step"] for batch in batches for entry in batch] == [0, 1, 2, 3, 4]
+    assert SQLiteStorage.get_all_logs_for_sync(project) == [
+        entry for batch in batches for entry in batch
+    ]
+    assert list(SQLiteStorage.iter_all_system_logs_for_sync("missing-project")) == []
+
+
+def test_bulk_log_columnar_masks_missing_cells(temp_dir):
+    import numpy as np
+
+    values = np.array([[0.5, 1.0], [float("inf"), float("nan")], [0.25, 2.0]])
+    present = np.array([[True, False], [True, True], [True, True]])
+    SQLiteStorage.bulk_log_columnar(
+        project="columnar",
+        run="run",
+        columns=["loss", "acc"],
+        values=values,
+        present=present,
+        steps=[0, 1, 2],
+        timestamps=["", "", ""],
+    )
+
+    logs = SQLiteStorage.get_logs(project="columnar", run="run")
+    assert [log["step"] for log in logs] == [0, 1, 2]
+    assert logs[0]["loss"] == 0.5
+    assert "acc" not in logs[0]
+    assert logs[1]["loss"] == float("inf")
+    assert np.isnan(logs[1]["acc"])
+    assert (logs[2]["loss"], logs[2]["acc"]) == (0.25, 2.0)
@@ -5,6 +5,7 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 
 from trackio import utils
@@ -260,3 +261,26 @@ def test_downsample_with_none_x_lim():
     result_df, result_x_lim = utils.downsample(empty_df, "x", "y", None, (2, None))
     assert result_x_lim == (2, 0)
     assert len(result_df) == 0
+
+
+def test_serialize_values_handles_plain_and_special_values():
+    metrics = {
+        "loss": 0.5,
+        "step": 3,
+        "done": True,
+        "name": "run",
+        "missing": None,
+        "bad": float("nan"),
+        "nested": {1: float("inf"), "b": (float("-inf"), 2.0)},
+        "np": np.float32(1.5),
+    }
+    assert utils.serialize_values(metrics) == {
+        "loss": 0.5,
+        "step": 3,
+        "done": True,
+        "name": "run",
+        "missing": None,
+        "bad": "NaN",
+        "nested": {"1": "Infinity", "b": ["-Infinity", 2.0]},
+        "np": 1.5,
+    }
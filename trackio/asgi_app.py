@@ -4,20 +4,30 @@ import inspect
 import json
 import logging
 import math
+import os
 import secrets
+import stat
 import tempfile
 import threading
 from collections.abc import Callable
+from email.utils import parsedate
 from pathlib import Path
 from typing import Any, get_args, get_origin
 from urllib.parse import unquote
 
 from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
 from starlette.requests import Request
 from starlette.responses import FileResponse, JSONResponse, Response, StreamingResponse
 from starlette.routing import Route
+from starlette.staticfiles import NotModifiedResponse
 
 from trackio import utils
+from trackio.compression import (
+    REQUEST_ENCODINGS,
+    RequestBodyTooLargeError,
+    decode_request_body,
+)
 from trackio.exceptions import TrackioAPIError
 from trackio.remote_client import HTTP_API_VERSION
 
@@ -143,6 +153,8 @@ async def version_handler(request: Request) -> Response:
             "version": _TRACKIO_PACKAGE_VERSION,
             "api_version": HTTP_API_VERSION,
             "api_transport": "http",
+            "request_encodings": list(REQUEST_ENCODINGS),
+            "features": ["bulk_ingest"],
             "mcp_enabled": mcp_enabled,
             "mcp_path": "/mcp" if mcp_enabled else None,
         }
@@ -289,8 +301,24 @@ async def run_api_request(request: Request, api_name: str) -> Response:
     if fn is None:
         return JSONResponse({"error": f"Unknown API: {api_name}"}, status_code=404)
 
+    raw_body = await request.body()
+    content_encoding = request.headers.get("content-encoding")
+    if content_encoding:
+        try:
+            raw_body = await run_in_threadpool(
+                decode_request_body, raw_body, content_encoding
+            )
+        except RequestBodyTooLargeError as e:
+            return JSONResponse({"error": str(e)}, status_code=413)
+        except ValueError as e:
+            return JSONResponse({"error": str(e)}, status_code=415)
+        except Exception as e:
+            return JSONResponse(
+                {"error": f"Could not decode {content_encoding} request body: {e}"},
+                status_code=400,
+            )
     try:
-        body = await request.json()
+        body = json.loads(raw_body)
     except Exception:
         body = {}
 
@@ -417,6 +445,20 @@ _DISALLOWED_FILE_SUFFIXES = frozenset(
 )
 
 
+def _is_not_modified(response: FileResponse, request: Request) -> bool:
+    if if_none_match := request.headers.get("if-none-match"):
+        etag = response.headers["etag"]
+        return etag in [
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        ]
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None:
+        return False
+    since = parsedate(if_modified_since)
+    last_modified = parsedate(response.headers["last-modified"])
+    return since is not None and last_modified is not None and since >= last_modified
+
+
 async def file_handler(request: Request) -> Response:
     fs_path = request.query_params.get("path")
     if fs_path is None:
@@ -427,9 +469,18 @@ async def file_handler(request: Request) -> Response:
     if _is_allowed_file_path(fp, (utils.ARTIFACTS_DIR.resolve(),)):
         return Response("Not found", status_code=404)
     allowed_roots = getattr(request.app.state, "allowed_file_roots", ())
-    if fp.is_file() and _is_allowed_file_path(fp, allowed_roots):
-        return FileResponse(str(fp))
-    return Response("Not found", status_code=404)
+    if not _is_allowed_file_path(fp, allowed_roots):
+        return Response("Not found", status_code=404)
+    try:
+        stat_result = os.stat(fp)
+    except OSError:
+        return Response("Not found", status_code=404)
+    if not stat.S_ISREG(stat_result.st_mode):
+        return Response("Not found", status_code=404)
+    response = FileResponse(str(fp), stat_result=stat_result)
+    if _is_not_modified(response, request):
+        return NotModifiedResponse(response.headers)
+    return response
 
 
 async def artifact_blob_handler(request: Request) -> Response:
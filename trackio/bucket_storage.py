@@ -60,7 +60,7 @@ def download_bucket_to_trackio_dir(bucket_id: str) -> None:
     )
 
 
-def upload_project_to_bucket(project: str, bucket_id: str) -> None:
+def _checkpointed_project_db_path(project: str) -> Path:
     db_path = SQLiteStorage.get_project_db_path(project)
     if not db_path.exists():
         raise FileNotFoundError(f"No database found for project '{project}'")
@@ -69,6 +69,18 @@ def upload_project_to_bucket(project: str, bucket_id: str) -> None:
         db_path, configure_pragmas=False, row_factory=None
     ) as conn:
         conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    return db_path
+
+
+def upload_db_to_bucket(project: str, bucket_id: str) -> None:
+    db_path = _checkpointed_project_db_path(project)
+    huggingface_hub.batch_bucket_files(
+        bucket_id, add=[(str(db_path), f"trackio/{db_path.name}")]
+    )
+
+
+def upload_project_to_bucket(project: str, bucket_id: str) -> None:
+    db_path = _checkpointed_project_db_path(project)
 
     files_to_add = [(str(db_path), f"trackio/{db_path.name}")]
 
@@ -2,6 +2,8 @@ import argparse
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 
 import huggingface_hub
@@ -13,7 +15,6 @@ from trackio.cli_helpers import (
     format_alerts,
     format_artifact,
     format_artifacts,
-    format_json,
     format_list,
     format_metric_values,
     format_project_summary,
@@ -23,6 +24,8 @@ from trackio.cli_helpers import (
     format_spaces,
     format_system_metric_names,
     format_system_metrics,
+    print_json,
+    print_lines,
 )
 from trackio.frontend_config import (
     TRACKIO_CONFIG_PATH,
@@ -34,6 +37,10 @@ from trackio.markdown import Markdown
 from trackio.server import get_project_summary, get_run_summary
 from trackio.sqlite_storage import SQLiteStorage
 
+_REMOTE_FETCH_MAX_WORKERS = 8
+_REMOTE_LOGS_BATCH_MAX_RUNS = 64
+_COLOR_PALETTE_SPLIT_RE = re.compile(r"\s*,\s*")
+
 
 def _get_space(args):
     return getattr(args, "space", None)
@@ -49,7 +56,7 @@ def _get_remote(args):
     return RemoteClient(space, hf_token=hf_token)
 
 
-def _handle_status():
+def _handle_status(args):
     print("Reading local Trackio projects...\n")
     projects = SQLiteStorage.get_projects()
     if not projects:
@@ -155,25 +162,95 @@ def _handle_config(args):
         return
 
 
+def _validate_project_and_run(project: str, run: str | None = None) -> None:
+    db_path = SQLiteStorage.get_project_db_path(project)
+    if not db_path.exists():
+        error_exit(f"Project '{project}' not found.")
+    if run is not None and not SQLiteStorage.run_exists(project, run):
+        error_exit(f"Run '{run}' not found in project '{project}'.")
+
+
+def _resolve_target_runs(
+    project: str, run: str | None = None, remote=None
+) -> list[str]:
+    if remote is None:
+        _validate_project_and_run(project, run)
+        return [run] if run is not None else SQLiteStorage.get_runs(project)
+    run_records = remote.predict(project, api_name="/get_runs_for_project")
+    runs = [r["name"] if isinstance(r, dict) else r for r in run_records]
+    if run is None:
+        return runs
+    if run not in runs:
+        error_exit(f"Run '{run}' not found in project '{project}'.")
+    return [run]
+
+
+def _validated_at_time(args) -> str | None:
+    at_time = getattr(args, "at_time", None)
+    if at_time is None:
+        return None
+    try:
+        datetime.fromisoformat(at_time.replace("Z", "+00:00"))
+    except ValueError:
+        error_exit(f"Invalid --at-time '{at_time}': expected an ISO 8601 timestamp.")
+    return at_time
+
+
+def _fetch_remote_run_logs(remote, project: str, runs: list[str]) -> list[list[dict]]:
+    if not runs:
+        return []
+    batches = [
+        runs[i : i + _REMOTE_LOGS_BATCH_MAX_RUNS]
+        for i in range(0, len(runs), _REMOTE_LOGS_BATCH_MAX_RUNS)
+    ]
+    try:
+        with ThreadPoolExecutor(
+            max_workers=min(_REMOTE_FETCH_MAX_WORKERS, len(batches))
+        ) as executor:
+            results = list(
+                executor.map(
+                    lambda batch: remote.predict(
+                        project,
+                        [{"run": run} for run in batch],
+                        api_name="/get_logs_batch",
+                    ),
+                    batches,
+                )
+            )
+        return [entry["logs"] for result in results for entry in result]
+    except RuntimeError as e:
+        if "does not support" not in str(e):
+            raise
+    with ThreadPoolExecutor(
+        max_workers=min(_REMOTE_FETCH_MAX_WORKERS, len(runs))
+    ) as executor:
+        return list(
+            executor.map(
+                lambda run: remote.predict(project, run, api_name="/get_logs"), runs
+            )
+        )
+
+
 def _extract_reports(
     run: str, logs: list[dict], report_name: str | None = None
 ) -> list[dict]:
+    markdown_type = Markdown.TYPE
     reports = []
     for log in logs:
-        timestamp = log.get("timestamp")
-        step = log.get("step")
-        for key, value in log.items():
-            if report_name is not None and key != report_name:
-                continue
-            if isinstance(value, dict) and value.get("_type") == Markdown.TYPE:
+        if report_name is not None:
+            items = ((report_name, log.get(report_name)),)
+        else:
+            items = log.items()
+        for key, value in items:
+            if isinstance(value, dict) and value.get("_type") == markdown_type:
                 content = value.get("_value")
                 if isinstance(content, str):
                     reports.append(
                         {
                             "run": run,
                             "report": key,
-                            "step": step,
-                            "timestamp": timestamp,
+                            "step": log.get("step"),
+                            "timestamp": log.get("timestamp"),
                             "content": content,
                         }
                     )
@@ -193,7 +270,7 @@ def _handle_query(args):
         error_exit(str(e))
 
     if args.json:
-        print(format_json(result))
+        print_json(result)
     else:
         print(format_query_result(result))
 
@@ -352,11 +429,465 @@ def _handle_list_spaces(args):
         spaces = spaces[: args.limit]
 
     if args.json:
-        print(format_json({"spaces": spaces}))
+        print_json({"spaces": spaces})
     else:
         print(format_spaces(spaces))
 
 
+def _handle_show(args):
+    color_palette = None
+    if args.color_palette:
+        color_palette = _COLOR_PALETTE_SPLIT_RE.split(args.color_palette.strip())
+    show(
+        project=args.project,
+        theme=args.theme,
+        mcp_server=args.mcp_server,
+        footer=args.footer,
+        color_palette=color_palette,
+        host=args.host,
+        frontend_dir=args.frontend,
+    )
+
+
+def _handle_freeze(args):
+    freeze(
+        space_id=args.space_id,
+        project=args.project,
+        new_space_id=args.new_space_id,
+        private=args.private,
+        frontend_dir=args.frontend,
+    )
+
+
+def _handle_list_projects(args):
+    remote = _get_remote(args)
+    if remote:
+        projects = remote.predict(api_name="/get_all_projects")
+    else:
+        projects = SQLiteStorage.get_projects()
+    if args.json:
+        print_json({"projects": projects})
+    else:
+        print_lines(format_list(projects, "Projects"))
+
+
+def _handle_list_runs(args):
+    remote = _get_remote(args)
+    runs = _resolve_target_runs(args.project, remote=remote)
+    if args.json:
+        print_json({"project": args.project, "runs": runs})
+    else:
+        print_lines(format_list(runs, f"Runs in '{args.project}'"))
+
+
+def _handle_list_metrics(args):
+    remote = _get_remote(args)
+    if remote:
+        metrics = remote.predict(
+            args.project, args.run, api_name="/get_metrics_for_run"
+        )
+    else:
+        _validate_project_and_run(args.project, args.run)
+        metrics = SQLiteStorage.get_all_metrics_for_run(args.project, args.run)
+    if args.json:
+        print_json({"project": args.project, "run": args.run, "metrics": metrics})
+    else:
+        print_lines(
+            format_list(metrics, f"Metrics for '{args.run}' in '{args.project}'")
+        )
+
+
+def _handle_list_system_metrics(args):
+    remote = _get_remote(args)
+    if remote:
+        system_metrics = remote.predict(
+            args.project, args.run, api_name="/get_system_metrics_for_run"
+        )
+    else:
+        _validate_project_and_run(args.project, args.run)
+        system_metrics = SQLiteStorage.get_all_system_metrics_for_run(
+            args.project, args.run
+        )
+    if args.json:
+        print_json(
+            {
+                "project": args.project,
+                "run": args.run,
+                "system_metrics": system_metrics,
+            }
+        )
+    else:
+        print_lines(format_system_metric_names(system_metrics))
+
+
+def _handle_list_alerts(args):
+    remote = _get_remote(args)
+    if remote:
+        alerts = remote.predict(
+            args.project,
+            args.run,
+            args.level,
+            args.since,
+            api_name="/get_alerts",
+        )
+    else:
+        _validate_project_and_run(args.project)
+        alerts = SQLiteStorage.get_alerts(
+            args.project,
+            run_name=args.run,
+            level=args.level,
+            since=args.since,
+        )
+    if args.json:
+        print_json(
+            {
+                "project": args.project,
+                "run": args.run,
+                "level": args.level,
+                "since": args.since,
+                "alerts": alerts,
+            }
+        )
+    else:
+        print_lines(format_alerts(alerts))
+
+
+def _handle_list_reports(args):
+    remote = _get_remote(args)
+    if remote:
+        target_runs = _resolve_target_runs(args.project, args.run, remote)
+        all_reports = []
+        for run_name, logs in zip(
+            target_runs,
+            _fetch_remote_run_logs(remote, args.project, target_runs),
+        ):
+            all_reports.extend(_extract_reports(run_name, logs))
+    else:
+        _validate_project_and_run(args.project, args.run)
+        all_reports = SQLiteStorage.get_reports(args.project, run=args.run)
+
+    if args.json:
+        print_json(
+            {
+                "project": args.project,
+                "run": args.run,
+                "reports": all_reports,
+            }
+        )
+    else:
+        report_lines = [
+            f"{entry['run']} | {entry['report']} | step={entry['step']} | {entry['timestamp']}"
+            for entry in all_reports
+        ]
+        if args.run:
+            print_lines(
+                format_list(
+                    report_lines,
+                    f"Reports for '{args.run}' in '{args.project}'",
+                )
+            )
+        else:
+            print_lines(format_list(report_lines, f"Reports in '{args.project}'"))
+
+
+def _handle_list_artifacts(args):
+    remote = _get_remote(args)
+    if remote:
+        artifacts = remote.predict(args.project, api_name="/get_artifacts")
+    else:
+        _validate_project_and_run(args.project)
+        artifacts = SQLiteStorage.get_artifacts(args.project)
+    if args.json:
+        print_json({"project": args.project, "artifacts": artifacts})
+    else:
+        print(format_artifacts(artifacts, args.project))
+
+
+def _handle_get_artifact(args):
+    remote = _get_remote(args)
+    if remote:
+        record = remote.predict(
+            args.project,
+            args.name,
+            args.version,
+            api_name="/get_artifact_manifest",
+        )
+    else:
+        _validate_project_and_run(args.project)
+        record = SQLiteStorage.get_artifact_manifest(
+            args.project, args.name, args.version
+        )
+    if record is None:
+        spec = f":{args.version}" if args.version else ""
+        error_exit(
+            f"Artifact '{args.name}{spec}' not found in project '{args.project}'."
+        )
+    if args.json:
+        print_json(record)
+    else:
+        print(format_artifact(record))
+
+
+def _handle_get_project(args):
+    remote = _get_remote(args)
+    if remote:
+        summary = remote.predict(args.project, api_name="/get_project_summary")
+    else:
+        _validate_project_and_run(args.project)
+        summary = get_project_summary(args.project)
+    if args.json:
+        print_json(summary)
+    else:
+        print(format_project_summary(summary))
+
+
+def _handle_get_run(args):
+    remote = _get_remote(args)
+    if remote:
+        summary = remote.predict(args.project, args.run, api_name="/get_run_summary")
+    else:
+        _validate_project_and_run(args.project, args.run)
+        summary = get_run_summary(args.project, args.run)
+    if args.json:
+        print_json(summary)
+    else:
+        print(format_run_summary(summary))
+
+
+def _handle_get_metric(args):
+    at_time = _validated_at_time(args)
+    remote = _get_remote(args)
+    if remote:
+        values = remote.predict(
+            args.project,
+            args.run,
+            args.metric,
+            args.step,
+            args.around,
+            at_time,
+            args.window,
+            api_name="/get_metric_values",
+        )
+    else:
+        _validate_project_and_run(args.project, args.run)
+        if not SQLiteStorage.metric_exists(args.project, args.run, args.metric):
+            error_exit(
+                f"Metric '{args.metric}' not found in run '{args.run}' of project '{args.project}'."
+            )
+        values = SQLiteStorage.get_metric_values(
+            args.project,
+            args.run,
+            args.metric,
+            step=args.step,
+            around_step=args.around,
+            at_time=at_time,
+            window=args.window,
+        )
+    if args.json:
+        print_json(
+            {
+                "project": args.project,
+                "run": args.run,
+                "metric": args.metric,
+                "values": values,
+            }
+        )
+    else:
+        print_lines(format_metric_values(values))
+
+
+def _handle_get_snapshot(args):
+    at_time = _validated_at_time(args)
+    if args.step is None and args.around is None and at_time is None:
+        error_exit(
+            "Provide --step, --around (with --window), or --at-time (with --window)."
+        )
+    remote = _get_remote(args)
+    if remote:
+        snapshot = remote.predict(
+            args.project,
+            args.run,
+            args.step,
+            args.around,
+            at_time,
+            args.window,
+            api_name="/get_snapshot",
+        )
+    else:
+        _validate_project_and_run(args.project, args.run)
+        snapshot = SQLiteStorage.get_snapshot(
+            args.project,
+            args.run,
+            step=args.step,
+            around_step=args.around,
+            at_time=at_time,
+            window=args.window,
+        )
+    if args.json:
+        result = {
+            "project": args.project,
+            "run": args.run,
+            "metrics": snapshot,
+        }
+        if args.step is not None:
+            result["step"] = args.step
+        if args.around is not None:
+            result["around"] = args.around
+            result["window"] = args.window
+        if at_time is not None:
+            result["at_time"] = at_time
+            result["window"] = args.window
+        print_json(result)
+    else:
+        print_lines(format_snapshot(snapshot))
+
+
+def _handle_get_system_metric(args):
+    remote = _get_remote(args)
+    if remote:
+        system_metrics = remote.predict(
+            args.project, args.run, api_name="/get_system_logs"
+        )
+        if args.metric:
+            all_system_metric_names = remote.predict(
+                args.project,
+                args.run,
+                api_name="/get_system_metrics_for_run",
+            )
+            if args.metric not in all_system_metric_names:
+                error_exit(
+                    f"System metric '{args.metric}' not found in run '{args.run}' of project '{args.project}'."
+                )
+            filtered_metrics = [
+                {k: v for k, v in entry.items() if k == "timestamp" or k == args.metric}
+                for entry in system_metrics
+                if args.metric in entry
+            ]
+            if args.json:
+                print_json(
+                    {
+                        "project": args.project,
+                        "run": args.run,
+                        "metric": args.metric,
+                        "values": filtered_metrics,
+                    }
+                )
+            else:
+                print_lines(format_system_metrics(filtered_metrics))
+        else:
+            if args.json:
+                print_json(
+                    {
+                        "project": args.project,
+                        "run": args.run,
+                        "system_metrics": system_metrics,
+                    }
+                )
+            else:
+                print_lines(format_system_metrics(system_metrics))
+    else:
+        _validate_project_and_run(args.project, args.run)
+        if args.metric:
+            filtered_metrics = SQLiteStorage.get_system_metric_series(
+                args.project, args.run, args.metric
+            )
+            if not filtered_metrics:
+                error_exit(
+                    f"System metric '{args.metric}' not found in run '{args.run}' of project '{args.project}'."
+                )
+            if args.json:
+                print_json(
+                    {
+                        "project": args.project,
+                        "run": args.run,
+                        "metric": args.metric,
+                        "values": filtered_metrics,
+                    }
+                )
+            else:
+                print_lines(format_system_metrics(filtered_metrics))
+        else:
+            system_metrics = SQLiteStorage.get_system_logs(args.project, args.run)
+            if args.json:
+                print_json(
+                    {
+                        "project": args.project,
+                        "run": args.run,
+                        "system_metrics": system_metrics,
+                    }
+                )
+            else:
+                print_lines(format_system_metrics(system_metrics))
+
+
+def _handle_get_alerts(args):
+    remote = _get_remote(args)
+    if remote:
+        alerts = remote.predict(
+            args.project,
+            args.run,
+            args.level,
+            args.since,
+            api_name="/get_alerts",
+        )
+    else:
+        _validate_project_and_run(args.project)
+        alerts = SQLiteStorage.get_alerts(
+            args.project,
+            run_name=args.run,
+            level=args.level,
+            since=args.since,
+        )
+    if args.json:
+        print_json(
+            {
+                "project": args.project,
+                "run": args.run,
+                "level": args.level,
+                "since": args.since,
+                "alerts": alerts,
+            }
+        )
+    else:
+        print_lines(format_alerts(alerts))
+
+
+def _handle_get_report(args):
+    remote = _get_remote(args)
+    if remote:
+        logs = remote.predict(args.project, args.run, api_name="/get_logs")
+        reports = _extract_reports(args.run, logs, report_name=args.report)
+    else:
+        _validate_project_and_run(args.project, args.run)
+        reports = SQLiteStorage.get_reports(
+            args.project, run=args.run, report_name=args.report
+        )
+    if not reports:
+        error_exit(
+            f"Report '{args.report}' not found in run '{args.run}' of project '{args.project}'."
+        )
+
+    if args.json:
+        print_json(
+            {
+                "project": args.project,
+                "run": args.run,
+                "report": args.report,
+                "values": reports,
+            }
+        )
+    else:
+        output = []
+        for idx, entry in enumerate(reports, start=1):
+            output.append(
+                f"Entry {idx} | step={entry['step']} | timestamp={entry['timestamp']}"
+            )
+            output.append(entry["content"])
+            if idx < len(reports):
+                output.append("-" * 80)
+        print("\n".join(output))
+
+
 def main():
     if _maybe_handle_logbook_run_argv():
         return
@@ -383,6 +914,7 @@ def main():
     ui_parser = subparsers.add_parser(
         "show", help="Show the Trackio dashboard UI for a project"
     )
+    ui_parser.set_defaults(func=_handle_show)
     ui_parser.add_argument(
         "--project", required=False, help="Project name to show in the dashboard"
     )
@@ -428,12 +960,13 @@ def main():
     subparsers.add_parser(
         "status",
         help="Show the status of all local Trackio projects, including sync status.",
-    )
+    ).set_defaults(func=_handle_status)
 
     sync_parser = subparsers.add_parser(
         "sync",
         help="Sync a local project's database to a Hugging Face Space. If the Space does not exist, it will be created.",
     )
+    sync_parser.set_defaults(func=_handle_sync)
     sync_parser.add_argument(
         "--project",
         required=False,
@@ -476,6 +1009,7 @@ def main():
         "freeze",
         help="Create a one-time static Space snapshot from a project's data.",
     )
+    freeze_parser.set_defaults(func=_handle_freeze)
     freeze_parser.add_argument(
         "--space-id",
         required=True,
@@ -506,6 +1040,7 @@ def main():
         "config",
         help="Manage persistent Trackio configuration.",
     )
+    config_parser.set_defaults(func=_handle_config)
     config_subparsers = config_parser.add_subparsers(
         dest="config_command",
         required=True,
@@ -544,6 +1079,7 @@ def main():
         "projects",
         help="List all projects",
     )
+    list_projects_parser.set_defaults(func=_handle_list_projects)
     list_projects_parser.add_argument(
         "--json",
         action="store_true",
@@ -554,6 +1090,7 @@ def main():
         "spaces",
         help="List Trackio Spaces for your Hugging Face account and organizations",
     )
+    list_spaces_parser.set_defaults(func=_handle_list_spaces)
     list_spaces_parser.add_argument(
         "--author",
         required=False,
@@ -575,6 +1112,7 @@ def main():
         "runs",
         help="List runs for a project",
     )
+    list_runs_parser.set_defaults(func=_handle_list_runs)
     list_runs_parser.add_argument(
         "--project",
         required=True,
@@ -590,6 +1128,7 @@ def main():
         "metrics",
         help="List metrics for a run",
     )
+    list_metrics_parser.set_defaults(func=_handle_list_metrics)
     list_metrics_parser.add_argument(
         "--project",
         required=True,
@@ -610,6 +1149,7 @@ def main():
         "system-metrics",
         help="List system metrics for a run",
     )
+    list_system_metrics_parser.set_defaults(func=_handle_list_system_metrics)
     list_system_metrics_parser.add_argument(
         "--project",
         required=True,
@@ -630,6 +1170,7 @@ def main():
         "alerts",
         help="List alerts for a project or run",
     )
+    list_alerts_parser.set_defaults(func=_handle_list_alerts)
     list_alerts_parser.add_argument(
         "--project",
         required=True,
@@ -643,7 +1184,8 @@ def main():
     list_alerts_parser.add_argument(
         "--level",
         required=False,
-        help="Filter by alert level (info, warn, error)",
+        choices=["info", "warn", "error"],
+        help="Filter by alert level",
     )
     list_alerts_parser.add_argument(
         "--json",
@@ -660,6 +1202,7 @@ def main():
         "reports",
         help="List markdown reports for a project or run",
     )
+    list_reports_parser.set_defaults(func=_handle_list_reports)
     list_reports_parser.add_argument(
         "--project",
         required=True,
@@ -680,6 +1223,7 @@ def main():
         "artifacts",
         help="List artifacts for a project",
     )
+    list_artifacts_parser.set_defaults(func=_handle_list_artifacts)
     list_artifacts_parser.add_argument(
         "--project",
         required=True,
@@ -701,6 +1245,7 @@ def main():
         "project",
         help="Get project summary",
     )
+    get_project_parser.set_defaults(func=_handle_get_project)
     get_project_parser.add_argument(
         "--project",
         required=True,
@@ -716,6 +1261,7 @@ def main():
         "run",
         help="Get run summary",
     )
+    get_run_parser.set_defaults(func=_handle_get_run)
     get_run_parser.add_argument(
         "--project",
         required=True,
@@ -736,6 +1282,7 @@ def main():
         "artifact",
         help="Get an artifact version (manifest, aliases, metadata)",
     )
+    get_artifact_parser.set_defaults(func=_handle_get_artifact)
     get_artifact_parser.add_argument(
         "--project",
         required=True,
@@ -761,6 +1308,7 @@ def main():
         "metric",
         help="Get metric values for a run",
     )
+    get_metric_parser.set_defaults(func=_handle_get_metric)
     get_metric_parser.add_argument(
         "--project",
         required=True,
@@ -810,6 +1358,7 @@ def main():
         "snapshot",
         help="Get all metrics at/around a step or timestamp",
     )
+    get_snapshot_parser.set_defaults(func=_handle_get_snapshot)
     get_snapshot_parser.add_argument(
         "--project",
         required=True,
@@ -854,6 +1403,7 @@ def main():
         "system-metric",
         help="Get system metric values for a run",
     )
+    get_system_metric_parser.set_defaults(func=_handle_get_system_metric)
     get_system_metric_parser.add_argument(
         "--project",
         required=True,
@@ -879,6 +1429,7 @@ def main():
         "alerts",
         help="Get alerts for a project or run",
     )
+    get_alerts_parser.set_defaults(func=_handle_get_alerts)
     get_alerts_parser.add_argument(
         "--project",
         required=True,
@@ -892,7 +1443,8 @@ def main():
     get_alerts_parser.add_argument(
         "--level",
         required=False,
-        help="Filter by alert level (info, warn, error)",
+        choices=["info", "warn", "error"],
+        help="Filter by alert level",
     )
     get_alerts_parser.add_argument(
         "--json",
@@ -909,6 +1461,7 @@ def main():
         "report",
         help="Get markdown report entries for a run",
     )
+    get_report_parser.set_defaults(func=_handle_get_report)
     get_report_parser.add_argument(
         "--project",
         required=True,
@@ -939,6 +1492,7 @@ def main():
         "project",
         help="Run a read-only SQL query against a project's SQLite database",
     )
+    query_project_parser.set_defaults(func=_handle_query)
     query_project_parser.add_argument(
         "--project",
         required=True,
@@ -969,6 +1523,7 @@ def main():
             "pass agent flags to also symlink it for specific assistants"
         ),
     )
+    skills_add_parser.set_defaults(func=_handle_skills_add)
     skills_add_parser.add_argument(
         "--cursor",
         action="store_true",
@@ -1028,6 +1583,7 @@ def main():
         "logbook",
         help="Create and publish a shareable experiment logbook",
     )
+    logbook_parser.set_defaults(func=_handle_logbook)
     logbook_sub = logbook_parser.add_subparsers(
         dest="logbook_action",
         required=True,
@@ -1298,562 +1854,11 @@ def main():
             f"The '{args.command}' command does not support --space (remote mode)."
         )
 
-    if args.command == "show":
-        color_palette = None
-        if args.color_palette:
-            color_palette = [color.strip() for color in args.color_palette.split(",")]
-        show(
-            project=args.project,
-            theme=args.theme,
-            mcp_server=args.mcp_server,
-            footer=args.footer,
-            color_palette=color_palette,
-            host=args.host,
-            frontend_dir=args.frontend,
-        )
-    elif args.command == "status":
-        _handle_status()
-    elif args.command == "sync":
-        _handle_sync(args)
-    elif args.command == "freeze":
-        freeze(
-            space_id=args.space_id,
-            project=args.project,
-            new_space_id=args.new_space_id,
-            private=args.private,
-            frontend_dir=args.frontend,
-        )
-    elif args.command == "config":
-        _handle_config(args)
-    elif args.command == "list":
-        if args.list_type == "spaces":
-            _handle_list_spaces(args)
-            return
-
-        remote = _get_remote(args)
-        if args.list_type == "projects":
-            if remote:
-                projects = remote.predict(api_name="/get_all_projects")
-            else:
-                projects = SQLiteStorage.get_projects()
-            if args.json:
-                print(format_json({"projects": projects}))
-            else:
-                print(format_list(projects, "Projects"))
-        elif args.list_type == "runs":
-            if remote:
-                run_records = remote.predict(
-                    args.project, api_name="/get_runs_for_project"
-                )
-                runs = [r["name"] if isinstance(r, dict) else r for r in run_records]
-            else:
-                db_path = SQLiteStorage.get_project_db_path(args.project)
-                if not db_path.exists():
-                    error_exit(f"Project '{args.project}' not found.")
-                runs = SQLiteStorage.get_runs(args.project)
-            if args.json:
-                print(format_json({"project": args.project, "runs": runs}))
-            else:
-                print(format_list(runs, f"Runs in '{args.project}'"))
-        elif args.list_type == "metrics":
-            if remote:
-                metrics = remote.predict(
-                    args.project, args.run, api_name="/get_metrics_for_run"
-                )
-            else:
-                db_path = SQLiteStorage.get_project_db_path(args.project)
-                if not db_path.exists():
-                    error_exit(f"Project '{args.project}' not found.")
-                runs = SQLiteStorage.get_runs(args.project)
-                if args.run not in runs:
-                    error_exit(
-                        f"Run '{args.run}' not found in project '{args.project}'."
-                    )
-                metrics = SQLiteStorage.get_all_metrics_for_run(args.project, args.run)
-            if args.json:
-                print(
-                    format_json(
-                        {"project": args.project, "run": args.run, "metrics": metrics}
-                    )
-                )
-            else:
-                print(
-                    format_list(
-                        metrics, f"Metrics for '{args.run}' in '{args.project}'"
-                    )
-                )
-        elif args.list_type == "system-metrics":
-            if remote:
-                system_metrics = remote.predict(
-                    args.project, args.run, api_name="/get_system_metrics_for_run"
-                )
-            else:
-                db_path = SQLiteStorage.get_project_db_path(args.project)
-                if not db_path.exists():
-                    error_exit(f"Project '{args.project}' not found.")
-                runs = SQLiteStorage.get_runs(args.project)
-                if args.run not in runs:
-                    error_exit(
-                        f"Run '{args.run}' not found in project '{args.project}'."
-                    )
-                system_metrics = SQLiteStorage.get_all_system_metrics_for_run(
-                    args.project, args.run
-                )
-            if args.json:
-                print(
-                    format_json(
-                        {
-                            "project": args.project,
-                            "run": args.run,
-                            "system_metrics": system_metrics,
-                        }
-                    )
-                )
-            else:
-                print(format_system_metric_names(system_metrics))
-        elif args.list_type == "alerts":
-            if remote:
-                alerts = remote.predict(
-                    args.project,
-                    args.run,
-                    args.level,
-                    args.since,
-                    api_name="/get_alerts",
-                )
-            else:
-                db_path = SQLiteStorage.get_project_db_path(args.project)
-                if not db_path.exists():
-                    error_exit(f"Project '{args.project}' not found.")
-                alerts = SQLiteStorage.get_alerts(
-                    args.project,
-                    run_name=args.run,
-                    level=args.level,
-                    since=args.since,
-                )
-            if args.json:
-                print(
-                    format_json(
-                        {
-                            "project": args.project,
-                            "run": args.run,
-                            "level": args.level,
-                            "since": args.since,
-                            "alerts": alerts,
-                        }
-                    )
-                )
-            else:
-                print(format_alerts(alerts))
-        elif args.list_type == "reports":
-            if remote:
-                run_records = remote.predict(
-                    args.project, api_name="/get_runs_for_project"
-                )
-                runs = [r["name"] if isinstance(r, dict) else r for r in run_records]
-            else:
-                db_path = SQLiteStorage.get_project_db_path(args.project)
-                if not db_path.exists():
-                    error_exit(f"Project '{args.project}' not found.")
-                runs = SQLiteStorage.get_runs(args.project)
-            if args.run and args.run not in runs:
-                error_exit(f"Run '{args.run}' not found in project '{args.project}'.")
-
-            target_runs = [args.run] if args.run else runs
-            all_reports = []
-            for run_name in target_runs:
-                if remote:
-                    logs = remote.predict(args.project, run_name, api_name="/get_logs")
-                else:
-                    logs = SQLiteStorage.get_logs(args.project, run_name)
-                all_reports.extend(_extract_reports(run_name, logs))
-
-            if args.json:
-                print(
-                    format_json(
-                        {
-                            "project": args.project,
-                            "run": args.run,
-                            "reports": all_reports,
-                        }
-                    )
-                )
-            else:
-                report_lines = [
-                    f"{entry['run']} | {entry['report']} | step={entry['step']} | {entry['timestamp']}"
-                    for entry in all_reports
-                ]
-                if args.run:
-                    print(
-                        format_list(
-                            report_lines,
-                            f"Reports for '{args.run}' in '{args.project}'",
-                        )
-                    )
-                else:
-                    print(format_list(report_lines, f"Reports in '{args.project}'"))
-        elif args.list_type == "artifacts":
-            if remote:
-                artifacts = remote.predict(args.project, api_name="/get_artifacts")
-            else:
-                db_path = SQLiteStorage.get_project_db_path(args.project)
-                if not db_path.exists():
-                    error_exit(f"Project '{args.project}' not found.")
-                artifacts = SQLiteStorage.get_artifacts(args.project)
-            if args.json:
-                print(format_json({"project": args.project, "artifacts": artifacts}))
-            else:
-                print(format_artifacts(artifacts, args.project))
-    elif args.command == "get":
-        remote = _get_remote(args)
-        if args.get_type == "artifact":
-            if remote:
-                record = remote.predict(
-                    args.project,
-                    args.name,
-                    args.version,
-                    api_name="/get_artifact_manifest",
-                )
-            else:
-                db_path = SQLiteStorage.get_project_db_path(args.project)
-                if not db_path.exists():
-                    error_exit(f"Project '{args.project}' not found.")
-                record = SQLiteStorage.get_artifact_manifest(
-                    args.project, args.name, args.version
-                )
-            if record is None:
-                spec = f":{args.version}" if args.version else ""
-                error_exit(
-                    f"Artifact '{args.name}{spec}' not found in project "
-                    f"'{args.project}'."
-                )
-            if args.json:
-                print(format_json(record))
-            else:
-                print(format_artifact(record))
-        elif args.get_type == "project":
-            if remote:
-                summary = remote.predict(args.project, api_name="/get_project_summary")
-            else:
-                db_path = SQLiteStorage.get_project_db_path(args.project)
-                if not db_path.exists():
-                    error_exit(f"Project '{args.project}' not found.")
-                summary = get_project_summary(args.project)
-            if args.json:
-                print(format_json(summary))
-            else:
-                print(format_project_summary(summary))
-        elif args.get_type == "run":
-            if remote:
-                summary = remote.predict(
-                    args.project, args.run, api_name="/get_run_summary"
-                )
-            else:
-                db_path = SQLiteStorage.get_project_db_path(args.project)
-                if not db_path.exists():
-                    error_exit(f"Project '{args.project}' not found.")
-                runs = SQLiteStorage.get_runs(args.project)
-                if args.run not in runs:
-                    error_exit(
-                        f"Run '{args.run}' not found in project '{args.project}'."
-                    )
-                summary = get_run_summary(args.project, args.run)
-            if args.json:
-                print(format_json(summary))
-            else:
-                print(format_run_summary(summary))
-        elif args.get_type == "metric":
-            at_time = getattr(args, "at_time", None)
-            if remote:
-                values = remote.predict(
-                    args.project,
-                    args.run,
-                    args.metric,
-                    args.step,
-                    args.around,
-                    at_time,
-                    args.window,
-                    api_name="/get_metric_values",
-                )
-            else:
-                db_path = SQLiteStorage.get_project_db_path(args.project)
-                if not db_path.exists():
-                    error_exit(f"Project '{args.project}' not found.")
-                runs = SQLiteStorage.get_runs(args.project)
-                if args.run not in runs:
-                    error_exit(
-                        f"Run '{args.run}' not found in project '{args.project}'."
-                    )
-                metrics = SQLiteStorage.get_all_metrics_for_run(args.project, args.run)
-                if args.metric not in metrics:
-                    error_exit(
-                        f"Metric '{args.metric}' not found in run '{args.run}' of project '{args.project}'."
-                    )
-                values = SQLiteStorage.get_metric_values(
-                    args.project,
-                    args.run,
-                    args.metric,
-                    step=args.step,
-                    around_step=args.around,
-                    at_time=at_time,
-                    window=args.window,
-                )
-            if args.json:
-                print(
-                    format_json(
-                        {
-                            "project": args.project,
-                            "run": args.run,
-                            "metric": args.metric,
-                            "values": values,
-                        }
-                    )
-                )
-            else:
-                print(format_metric_values(values))
-        elif args.get_type == "snapshot":
-            if not args.step and not args.around and not getattr(args, "at_time", None):
-                error_exit(
-                    "Provide --step, --around (with --window), or --at-time (with --window)."
-                )
-            at_time = getattr(args, "at_time", None)
-            if remote:
-                snapshot = remote.predict(
-                    args.project,
-                    args.run,
-                    args.step,
-                    args.around,
-                    at_time,
-                    args.window,
-                    api_name="/get_snapshot",
-                )
-            else:
-                db_path = SQLiteStorage.get_project_db_path(args.project)
-                if not db_path.exists():
-                    error_exit(f"Project '{args.project}' not found.")
-                runs = SQLiteStorage.get_runs(args.project)
-                if args.run not in runs:
-                    error_exit(
-                        f"Run '{args.run}' not found in project '{args.project}'."
-                    )
-                snapshot = SQLiteStorage.get_snapshot(
-                    args.project,
-                    args.run,
-                    step=args.step,
-                    around_step=args.around,
-                    at_time=at_time,
-                    window=args.window,
-                )
-            if args.json:
-                result = {
-                    "project": args.project,
-                    "run": args.run,
-                    "metrics": snapshot,
-                }
-                if args.step is not None:
-                    result["step"] = args.step
-                if args.around is not None:
-                    result["around"] = args.around
-                    result["window"] = args.window
-                if at_time is not None:
-                    result["at_time"] = at_time
-                    result["window"] = args.window
-                print(format_json(result))
-            else:
-                print(format_snapshot(snapshot))
-        elif args.get_type == "system-metric":
-            if remote:
-                system_metrics = remote.predict(
-                    args.project, args.run, api_name="/get_system_logs"
-                )
-                if args.metric:
-                    all_system_metric_names = remote.predict(
-                        args.project,
-                        args.run,
-                        api_name="/get_system_metrics_for_run",
-                    )
-                    if args.metric not in all_system_metric_names:
-                        error_exit(
-                            f"System metric '{args.metric}' not found in run '{args.run}' of project '{args.project}'."
-                        )
-                    filtered_metrics = [
-                        {
-                            k: v
-                            for k, v in entry.items()
-                            if k == "timestamp" or k == args.metric
-                        }
-                        for entry in system_metrics
-                        if args.metric in entry
-                    ]
-                    if args.json:
-                        print(
-                            format_json(
-                                {
-                                    "project": args.project,
-                                    "run": args.run,
-                                    "metric": args.metric,
-                                    "values": filtered_metrics,
-                                }
-                            )
-                        )
-                    else:
-                        print(format_system_metrics(filtered_metrics))
-                else:
-                    if args.json:
-                        print(
-                            format_json(
-                                {
-                                    "project": args.project,
-                                    "run": args.run,
-                                    "system_metrics": system_metrics,
-                                }
-                            )
-                        )
-                    else:
-                        print(format_system_metrics(system_metrics))
-            else:
-                db_path = SQLiteStorage.get_project_db_path(args.project)
-                if not db_path.exists():
-                    error_exit(f"Project '{args.project}' not found.")
-                runs = SQLiteStorage.get_runs(args.project)
-                if args.run not in runs:
-                    error_exit(
-                        f"Run '{args.run}' not found in project '{args.project}'."
-                    )
-                if args.metric:
-                    system_metrics = SQLiteStorage.get_system_logs(
-                        args.project, args.run
-                    )
-                    all_system_metric_names = (
-                        SQLiteStorage.get_all_system_metrics_for_run(
-                            args.project, args.run
-                        )
-                    )
-                    if args.metric not in all_system_metric_names:
-                        error_exit(
-                            f"System metric '{args.metric}' not found in run '{args.run}' of project '{args.project}'."
-                        )
-                    filtered_metrics = [
-                        {
-                            k: v
-                            for k, v in entry.items()
-                            if k == "timestamp" or k == args.metric
-                        }
-                        for entry in system_metrics
-                        if args.metric in entry
-                    ]
-                    if args.json:
-                        print(
-                            format_json(
-                                {
-                                    "project": args.project,
-                                    "run": args.run,
-                                    "metric": args.metric,
-                                    "values": filtered_metrics,
-                                }
-                            )
-                        )
-                    else:
-                        print(format_system_metrics(filtered_metrics))
-                else:
-                    system_metrics = SQLiteStorage.get_system_logs(
-                        args.project, args.run
-                    )
-                    if args.json:
-                        print(
-                            format_json(
-                                {
-                                    "project": args.project,
-                                    "run": args.run,
-                                    "system_metrics": system_metrics,
-                                }
-                            )
-                        )
-                    else:
-                        print(format_system_metrics(system_metrics))
-        elif args.get_type == "alerts":
-            if remote:
-                alerts = remote.predict(
-                    args.project,
-                    args.run,
-                    args.level,
-                    args.since,
-                    api_name="/get_alerts",
-                )
-            else:
-                db_path = SQLiteStorage.get_project_db_path(args.project)
-                if not db_path.exists():
-                    error_exit(f"Project '{args.project}' not found.")
-                alerts = SQLiteStorage.get_alerts(
-                    args.project,
-                    run_name=args.run,
-                    level=args.level,
-                    since=args.since,
-                )
-            if args.json:
-                print(
-                    format_json(
-                        {
-                            "project": args.project,
-                            "run": args.run,
-                            "level": args.level,
-                            "since": args.since,
-                            "alerts": alerts,
-                        }
-                    )
-                )
-            else:
-                print(format_alerts(alerts))
-        elif args.get_type == "report":
-            if remote:
-                logs = remote.predict(args.project, args.run, api_name="/get_logs")
-            else:
-                db_path = SQLiteStorage.get_project_db_path(args.project)
-                if not db_path.exists():
-                    error_exit(f"Project '{args.project}' not found.")
-                runs = SQLiteStorage.get_runs(args.project)
-                if args.run not in runs:
-                    error_exit(
-                        f"Run '{args.run}' not found in project '{args.project}'."
-                    )
-                logs = SQLiteStorage.get_logs(args.project, args.run)
-
-            reports = _extract_reports(args.run, logs, report_name=args.report)
-            if not reports:
-                error_exit(
-                    f"Report '{args.report}' not found in run '{args.run}' of project '{args.project}'."
-                )
-
-            if args.json:
-                print(
-                    format_json(
-                        {
-                            "project": args.project,
-                            "run": args.run,
-                            "report": args.report,
-                            "values": reports,
-                        }
-                    )
-                )
-            else:
-                output = []
-                for idx, entry in enumerate(reports, start=1):
-                    output.append(
-                        f"Entry {idx} | step={entry['step']} | timestamp={entry['timestamp']}"
-                    )
-                    output.append(entry["content"])
-                    if idx < len(reports):
-                        output.append("-" * 80)
-                print("\n".join(output))
-    elif args.command == "query":
-        if args.query_type == "project":
-            _handle_query(args)
-    elif args.command == "skills":
-        if args.skills_action == "add":
-            _handle_skills_add(args)
-    elif args.command == "logbook":
-        _handle_logbook(args)
-    else:
+    func = getattr(args, "func", None)
+    if func is None:
         parser.print_help()
+        return
+    func(args)
 
 
 def _logbook_cell_target(lb, proj, args):
@@ -2102,31 +2107,31 @@ def _handle_logbook(args):
             }
             if args.read_target is None and view == "trace":
                 text = lb.read_traces(proj)
-                print(
-                    format_json({"view": "trace", "text": text}) if args.json else text
-                )
+                if args.json:
+                    print_json({"view": "trace", "text": text})
+                else:
+                    print(text)
             elif args.read_target is None and view == "workspace":
                 text = lb.read_workspace_tree(proj)
-                print(
-                    format_json({"view": "workspace", "text": text})
-                    if args.json
-                    else text
-                )
+                if args.json:
+                    print_json({"view": "workspace", "text": text})
+                else:
+                    print(text)
             elif args.read_target is None:
                 if args.json:
-                    print(format_json(lb.read_logbook_data(proj, **preview_opts)))
+                    print_json(lb.read_logbook_data(proj, **preview_opts))
                 else:
                     print(lb.read_logbook(proj, **preview_opts))
             elif args.read_target == "pages":
                 pages = lb.list_pages(proj)
                 if args.json:
-                    print(format_json({"pages": pages}))
+                    print_json({"pages": pages})
                 else:
                     _print_logbook_pages(pages)
             elif args.read_target == "page":
                 page = lb.read_page_outline(proj, args.page, **preview_opts)
                 if args.json:
-                    print(format_json(page))
+                    print_json(page)
                 else:
                     _print_logbook_page_outline(page)
             elif args.read_target == "cell":
@@ -2138,7 +2143,7 @@ def _handle_logbook(args):
                     include_html=args.html,
                 )
                 if args.json:
-                    print(format_json(cell))
+                    print_json(cell)
                 else:
                     _print_logbook_cell(cell)
         elif action == "sync":
@@ -1,28 +1,36 @@
 import json
 import sys
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 from trackio import references
 
 
-def format_json(data: Any) -> str:
-    """Format data as JSON."""
-    return json.dumps(data, indent=2)
+def print_json(data: Any) -> None:
+    """Write data as JSON to stdout without building the full string first."""
+    json.dump(data, sys.stdout, indent=2)
+    sys.stdout.write("\n")
 
 
-def format_list(items: list[str], title: str | None = None) -> str:
-    """Format a list of items in human-readable format."""
+def print_lines(lines: Iterable[str]) -> None:
+    """Write lines to stdout as they are produced."""
+    write = sys.stdout.write
+    for line in lines:
+        write(line)
+        write("\n")
+
+
+def format_list(items: list[str], title: str | None = None) -> Iterator[str]:
+    """Yield the lines of a list of items in human-readable format."""
     if not items:
-        return f"No {title.lower() if title else 'items'} found."
+        yield f"No {title.lower() if title else 'items'} found."
+        return
 
-    output = []
     if title:
-        output.append(f"{title}:")
+        yield f"{title}:"
 
     for item in items:
-        output.append(f"  - {item}")
-
-    return "\n".join(output)
+        yield f"  - {item}"
 
 
 def format_artifacts(artifacts: list[dict], project: str | None = None) -> str:
@@ -136,73 +144,70 @@ def format_run_summary(summary: dict) -> str:
     return "\n".join(output)
 
 
-def format_metric_values(values: list[dict]) -> str:
-    """Format metric values in human-readable format."""
+def format_metric_values(values: list[dict]) -> Iterator[str]:
+    """Yield the lines of metric values in human-readable format."""
     if not values:
-        return "No metric values found."
+        yield "No metric values found."
+        return
 
-    output = [f"Found {len(values)} value(s):\n"]
-    output.append("Step | Timestamp | Value")
-    output.append("-" * 50)
+    yield f"Found {len(values)} value(s):\n"
+    yield "Step | Timestamp | Value"
+    yield "-" * 50
 
     for value in values:
         step = value.get("step", "N/A")
         timestamp = value.get("timestamp", "N/A")
         val = value.get("value", "N/A")
-        output.append(f"{step} | {timestamp} | {val}")
-
-    return "\n".join(output)
+        yield f"{step} | {timestamp} | {val}"
 
 
-def format_system_metrics(metrics: list[dict]) -> str:
-    """Format system metrics in human-readable format."""
+def format_system_metrics(metrics: list[dict]) -> Iterator[str]:
+    """Yield the lines of system metrics in human-readable format."""
     if not metrics:
-        return "No system metrics found."
+        yield "No system metrics found."
+        return
 
-    output = [f"Found {len(metrics)} system metric entry/entries:\n"]
+    yield f"Found {len(metrics)} system metric entry/entries:\n"
 
     for i, entry in enumerate(metrics):
         timestamp = entry.get("timestamp", "N/A")
-        output.append(f"\nEntry {i + 1} (Timestamp: {timestamp}):")
+        yield f"\nEntry {i + 1} (Timestamp: {timestamp}):"
         for key, value in entry.items():
             if key != "timestamp":
-                output.append(f"  {key}: {value}")
-
-    return "\n".join(output)
+                yield f"  {key}: {value}"
 
 
-def format_system_metric_names(names: list[str]) -> str:
-    """Format system metric names in human-readable format."""
+def format_system_metric_names(names: list[str]) -> Iterator[str]:
+    """Yield the lines of system metric names in human-readable format."""
     return format_list(names, "System Metrics")
 
 
-def format_snapshot(snapshot: dict[str, list[dict]]) -> str:
-    """Format a metrics snapshot in human-readable format."""
+def format_snapshot(snapshot: dict[str, list[dict]]) -> Iterator[str]:
+    """Yield the lines of a metrics snapshot in human-readable format."""
     if not snapshot:
-        return "No metrics found in the specified range."
+        yield "No metrics found in the specified range."
+        return
 
-    output = []
     for metric_name, values in sorted(snapshot.items()):
-        output.append(f"\n{metric_name}:")
-        output.append("  Step | Timestamp | Value")
-        output.append("  " + "-" * 48)
+        yield f"\n{metric_name}:"
+        yield "  Step | Timestamp | Value"
+        yield "  " + "-" * 48
         for v in values:
             step = v.get("step", "N/A")
             ts = v.get("timestamp", "N/A")
             val = v.get("value", "N/A")
-            output.append(f"  {step} | {ts} | {val}")
-
-    return "\n".join(output)
+            yield f"  {step} | {ts} | {val}"
 
 
-def format_alerts(alerts: list[dict]) -> str:
-    """Format alerts in human-readable format."""
+def format_alerts(alerts: list[dict]) -> Iterator[str]:
+    """Yield the lines of alerts in human-readable format."""
     if not alerts:
-        return "No alerts found."
+        yield "No alerts found."
+        return
 
-    output = [f"Found {len(alerts)} alert(s):\n"]
-    output.append("Timestamp | Run | Level | Title | Text | Step")
-    output.append("-" * 80)
+    yield f"Found {len(alerts)} alert(s):\n"
+    yield "Timestamp | Run | Level | Title | Text | Step"
+    yield "-" * 80
 
     for a in alerts:
         ts = a.get("timestamp", "N/A")
@@ -211,9 +216,7 @@ def format_alerts(alerts: list[dict]) -> str:
         title = a.get("title", "")
         text = a.get("text", "") or ""
         step = a.get("step", "N/A")
-        output.append(f"{ts} | {run} | {level} | {title} | {text} | {step}")
-
-    return "\n".join(output)
+        yield f"{ts} | {run} | {level} | {title} | {text} | {step}"
 
 
 def format_query_result(result: dict[str, Any]) -> str:
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import gzip
 import io
+import zlib
 from typing import NoReturn
 
 from starlette.datastructures import Headers, MutableHeaders
@@ -15,6 +16,9 @@ except ImportError:
     brotli = None
     HAS_BROTLI = False
 
+REQUEST_ENCODINGS = ("br", "gzip") if HAS_BROTLI else ("gzip",)
+MAX_DECODED_REQUEST_SIZE = 256 * 1024 * 1024
+
 COMPRESSIBLE_CONTENT_TYPES = (
     "application/json",
     "application/javascript",
@@ -26,6 +30,10 @@ COMPRESSIBLE_CONTENT_TYPES = (
 )
 
 
+class RequestBodyTooLargeError(Exception):
+    """Raised when a compressed request body expands past the decode limit."""
+
+
 class CompressionMiddleware:
     """Negotiates Brotli, then gzip, then identity based on Accept-Encoding.
 
@@ -165,5 +173,42 @@ class _BrotliResponder(_CompressionResponder):
         return data
 
 
+def encode_request_body(body: bytes, encoding: str) -> bytes:
+    """Compress an outgoing request body with one of `REQUEST_ENCODINGS`."""
+    if encoding == "br" and HAS_BROTLI:
+        return brotli.compress(body, quality=5)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=6)
+    raise ValueError(f"Unsupported request encoding: {encoding!r}")
+
+
+def decode_request_body(body: bytes, encoding: str) -> bytes:
+    """Undo a request `Content-Encoding`; raises `ValueError` if unsupported.
+
+    Output is capped at `MAX_DECODED_REQUEST_SIZE` bytes so a small, highly
+    compressed body cannot exhaust memory; `RequestBodyTooLargeError` is raised
+    when the cap is hit.
+    """
+    encoding = encoding.strip().lower()
+    if encoding in ("", "identity"):
+        return body
+    limit = MAX_DECODED_REQUEST_SIZE
+    if encoding == "br" and HAS_BROTLI:
+        decompressor = brotli.Decompressor()
+        data = decompressor.process(body, output_buffer_limit=limit + 1)
+        finished = decompressor.is_finished()
+    elif encoding == "gzip":
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        data = decompressor.decompress(body, limit + 1)
+        finished = decompressor.eof
+    else:
+        raise ValueError(f"Unsupported request encoding: {encoding!r}")
+    if len(data) > limit:
+        raise RequestBodyTooLargeError(f"Decoded request body exceeds {limit} bytes")
+    if not finished:
+        raise EOFError("Compressed request body ended before the end of the stream")
+    return data
+
+
 async def _unattached_send(message: Message) -> NoReturn:
     raise RuntimeError("send awaitable not set")
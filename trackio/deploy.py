@@ -1,12 +1,17 @@
+import hashlib
 import importlib.metadata
-import io
 import json as json_mod
 import os
+import random
+import sys
 import tempfile
 import threading
 import time
 import warnings
-from collections import Counter
+from collections import Counter, deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from importlib.resources import files
 from pathlib import Path
 
@@ -14,7 +19,7 @@ import httpx
 import huggingface_hub
 from gradio_client import handle_file
 from httpx import ReadTimeout
-from huggingface_hub import Volume
+from huggingface_hub import CommitOperationAdd, Volume
 from huggingface_hub.errors import (
     BucketNotFoundError,
     HfHubHTTPError,
@@ -25,6 +30,7 @@ import trackio
 from trackio.bucket_storage import (
     create_bucket_if_not_exists,
     export_from_bucket_for_static,
+    upload_db_to_bucket,
     upload_project_to_bucket,
     upload_project_to_bucket_for_static,
 )
@@ -35,6 +41,7 @@ from trackio.remote_client import RemoteClient
 from trackio.sqlite_storage import SQLiteStorage
 from trackio.utils import (
     get_or_create_project_hash,
+    is_in_notebook,
     on_spaces,
     preprocess_space_and_dataset_ids,
     project_artifacts_dir,
@@ -48,6 +55,10 @@ _BOLD_ORANGE = "\033[1m\033[38;5;208m"
 _RESET = "\033[0m"
 
 
+def _backoff_delay(attempt: int, initial: float, cap: float) -> float:
+    return min(cap, random.uniform(1, 2) * initial * 2**attempt)
+
+
 def raise_if_space_is_frozen_for_logging(space_id: str) -> None:
     try:
         info = huggingface_hub.HfApi().space_info(space_id)
@@ -70,12 +81,30 @@ def _readme_linked_hub_yaml(dataset_id: str | None) -> str:
 
 
 _CUSTOM_SPACE_FRONTEND_DIR = "trackio_custom_frontend"
-
-
-def _space_app_py(frontend_dir: str | None = None) -> str:
+_SPACE_SOURCE_IGNORE_PATTERNS = [
+    "README.md",
+    "CHANGELOG.md",
+    "frontend/node_modules/**",
+    "frontend/src/**",
+    "frontend/.gitignore",
+    "frontend/index.html",
+    "frontend/package.json",
+    "frontend/package-lock.json",
+    "frontend/vite.config.js",
+    "frontend/svelte.config.js",
+    "frontend/eslint.config.js",
+    "**/__pycache__/**",
+    "*.pyc",
+]
+
+
+_DEFAULT_SPACE_APP_PY = b"import trackio\ntrackio.show()\n"
+
+
+def _space_app_py(frontend_dir: str | None = None) -> bytes:
     if frontend_dir is None:
-        return "import trackio\ntrackio.show()\n"
-    return f'import trackio\ntrackio.show(frontend_dir="{frontend_dir}")\n'
+        return _DEFAULT_SPACE_APP_PY
+    return f'import trackio\ntrackio.show(frontend_dir="{frontend_dir}")\n'.encode()
 
 
 def _upload_frontend_folder(
@@ -287,6 +316,54 @@ def resolve_auto_bucket_id(
     return bucket_id
 
 
+_REMOTE_CLIENTS: dict[tuple[str, str | None], RemoteClient] = {}
+_REMOTE_CLIENTS_LOCK = threading.Lock()
+
+
+def _remote_client_key(space_id: str, hf_token: str | None) -> tuple[str, str | None]:
+    token_hash = hashlib.sha256(hf_token.encode()).hexdigest() if hf_token else None
+    return (space_id, token_hash)
+
+
+def _get_remote_client(space_id: str, hf_token: str | None) -> RemoteClient:
+    """Return a shared `RemoteClient` for `space_id`, keyed on a hash of the
+    token so repeated syncs skip the Space handshake."""
+    key = _remote_client_key(space_id, hf_token)
+    with _REMOTE_CLIENTS_LOCK:
+        client = _REMOTE_CLIENTS.get(key)
+        if client is None:
+            client = RemoteClient(
+                space_id,
+                hf_token=hf_token,
+                httpx_kwargs={"timeout": 90},
+            )
+            _REMOTE_CLIENTS[key] = client
+        return client
+
+
+def _discard_remote_client(
+    space_id: str, hf_token: str | None, client: RemoteClient
+) -> None:
+    """Forget `client` after a failed request so the next call reconnects, e.g.
+    after the Space restarted or the token was rotated."""
+    key = _remote_client_key(space_id, hf_token)
+    with _REMOTE_CLIENTS_LOCK:
+        if _REMOTE_CLIENTS.get(key) is client:
+            del _REMOTE_CLIENTS[key]
+
+
+def close_clients() -> None:
+    """Drop every cached Space client so the next sync reconnects."""
+    with _REMOTE_CLIENTS_LOCK:
+        _REMOTE_CLIENTS.clear()
+
+
+@lru_cache(maxsize=1)
+def _trackio_path():
+    return files("trackio")
+
+
+@lru_cache(maxsize=1)
 def _get_source_install_dependencies() -> str:
     """Get trackio dependencies from pyproject.toml for source installs."""
     try:
@@ -294,10 +371,8 @@ def _get_source_install_dependencies() -> str:
     except ModuleNotFoundError:
         import tomli as tomllib  # noqa: PLC0415
 
-    trackio_path = files("trackio")
-    pyproject_path = Path(trackio_path).parent / "pyproject.toml"
-    with open(pyproject_path, "rb") as f:
-        pyproject = tomllib.load(f)
+    pyproject_path = Path(_trackio_path()).parent / "pyproject.toml"
+    pyproject = tomllib.loads(pyproject_path.read_text(encoding="utf-8"))
     deps = pyproject["project"]["dependencies"]
     spaces_deps = (
         pyproject["project"].get("optional-dependencies", {}).get("spaces", [])
@@ -306,10 +381,12 @@ def _get_source_install_dependencies() -> str:
     return "\n".join(deps + spaces_deps + mcp_deps)
 
 
+@lru_cache(maxsize=1)
 def _get_space_install_requirement() -> str:
     return f"trackio[spaces,mcp]=={trackio.__version__}"
 
 
+@lru_cache(maxsize=1)
 def _is_trackio_installed_from_source() -> bool:
     """Check if trackio is installed from source/editable install vs PyPI."""
     try:
@@ -353,7 +430,7 @@ def deploy_as_space(
     if dataset_id is not None:
         warn_dataset_persistence_deprecated()
 
-    trackio_path = files("trackio")
+    trackio_path = _trackio_path()
 
     hf_api = huggingface_hub.HfApi()
 
@@ -391,32 +468,17 @@ def deploy_as_space(
 
     with open(Path(trackio_path, "README.md"), "r", encoding="utf-8") as f:
         readme_content = f.read()
-        readme_content = readme_content.replace("sdk_version: {GRADIO_VERSION}\n", "")
-        readme_content = readme_content.replace("{APP_FILE}", "app.py")
-        readme_content = readme_content.replace(
-            "{LINKED_HUB_METADATA}", _readme_linked_hub_yaml(dataset_id)
-        )
-        readme_buffer = io.BytesIO(readme_content.encode("utf-8"))
-        hf_api.upload_file(
-            path_or_fileobj=readme_buffer,
-            path_in_repo="README.md",
-            repo_id=space_id,
-            repo_type="space",
-        )
+    readme_content = readme_content.replace("sdk_version: {GRADIO_VERSION}\n", "")
+    readme_content = readme_content.replace("{APP_FILE}", "app.py")
+    readme_content = readme_content.replace(
+        "{LINKED_HUB_METADATA}", _readme_linked_hub_yaml(dataset_id)
+    )
 
     if is_source_install:
         requirements_content = _get_source_install_dependencies()
     else:
         requirements_content = _get_space_install_requirement()
 
-    requirements_buffer = io.BytesIO(requirements_content.encode("utf-8"))
-    hf_api.upload_file(
-        path_or_fileobj=requirements_buffer,
-        path_in_repo="requirements.txt",
-        repo_id=space_id,
-        repo_type="space",
-    )
-
     huggingface_hub.utils.disable_progress_bars()
 
     if is_source_install:
@@ -433,18 +495,7 @@ def deploy_as_space(
             repo_type="space",
             folder_path=trackio_path,
             path_in_repo="trackio",
-            ignore_patterns=[
-                "README.md",
-                "frontend/node_modules/**",
-                "frontend/src/**",
-                "frontend/.gitignore",
-                "frontend/package.json",
-                "frontend/package-lock.json",
-                "frontend/vite.config.js",
-                "frontend/svelte.config.js",
-                "**/__pycache__/**",
-                "*.pyc",
-            ],
+            ignore_patterns=_SPACE_SOURCE_IGNORE_PATTERNS,
         )
 
     if resolved_frontend.is_custom:
@@ -459,33 +510,38 @@ def deploy_as_space(
     app_file_content = _space_app_py(
         _CUSTOM_SPACE_FRONTEND_DIR if resolved_frontend.is_custom else None
     )
-    app_file_buffer = io.BytesIO(app_file_content.encode("utf-8"))
-    hf_api.upload_file(
-        path_or_fileobj=app_file_buffer,
-        path_in_repo="app.py",
+    hf_api.create_commit(
         repo_id=space_id,
         repo_type="space",
+        operations=[
+            CommitOperationAdd(
+                path_in_repo="README.md",
+                path_or_fileobj=readme_content.encode("utf-8"),
+            ),
+            CommitOperationAdd(
+                path_in_repo="requirements.txt",
+                path_or_fileobj=requirements_content.encode("utf-8"),
+            ),
+            CommitOperationAdd(path_in_repo="app.py", path_or_fileobj=app_file_content),
+        ],
+        commit_message="Deploy Trackio dashboard",
     )
 
     if hf_token := huggingface_hub.utils.get_token():
         huggingface_hub.add_space_secret(space_id, "HF_TOKEN", hf_token)
     if bucket_id is not None:
         _ensure_bucket_mounted_at_data(space_id, bucket_id, hf_api)
-    elif dataset_id is not None:
-        huggingface_hub.add_space_variable(space_id, "TRACKIO_DATASET_ID", dataset_id)
-    if logo_light_url := os.environ.get("TRACKIO_LOGO_LIGHT_URL"):
-        huggingface_hub.add_space_variable(
-            space_id, "TRACKIO_LOGO_LIGHT_URL", logo_light_url
-        )
-    if logo_dark_url := os.environ.get("TRACKIO_LOGO_DARK_URL"):
-        huggingface_hub.add_space_variable(
-            space_id, "TRACKIO_LOGO_DARK_URL", logo_dark_url
-        )
-    if plot_order := os.environ.get("TRACKIO_PLOT_ORDER"):
-        huggingface_hub.add_space_variable(space_id, "TRACKIO_PLOT_ORDER", plot_order)
-    if theme := os.environ.get("TRACKIO_THEME"):
-        huggingface_hub.add_space_variable(space_id, "TRACKIO_THEME", theme)
-    huggingface_hub.add_space_variable(space_id, "GRADIO_MCP_SERVER", "True")
+    space_variables = {
+        "TRACKIO_DATASET_ID": dataset_id if bucket_id is None else None,
+        "TRACKIO_LOGO_LIGHT_URL": os.environ.get("TRACKIO_LOGO_LIGHT_URL"),
+        "TRACKIO_LOGO_DARK_URL": os.environ.get("TRACKIO_LOGO_DARK_URL"),
+        "TRACKIO_PLOT_ORDER": os.environ.get("TRACKIO_PLOT_ORDER"),
+        "TRACKIO_THEME": os.environ.get("TRACKIO_THEME"),
+        "GRADIO_MCP_SERVER": "True",
+    }
+    for key, value in space_variables.items():
+        if value:
+            huggingface_hub.add_space_variable(space_id, key, value)
 
 
 def create_space_if_not_exists(
@@ -616,7 +672,7 @@ def _warn_if_space_build_fails(space_id: str, timeout: int = 600) -> None:
 def _wait_until_space_running(space_id: str, timeout: int = 300) -> None:
     hf_api = huggingface_hub.HfApi()
     start = time.time()
-    delay = 2
+    attempt = 0
     request_timeout = 45.0
     failure_stages = frozenset(
         ("NO_APP_FILE", "CONFIG_ERROR", "BUILD_ERROR", "RUNTIME_ERROR")
@@ -637,8 +693,8 @@ def _wait_until_space_running(space_id: str, timeout: int = 300) -> None:
             raise
         except (huggingface_hub.utils.HfHubHTTPError, httpx.RequestError):
             pass
-        time.sleep(delay)
-        delay = min(delay * 1.5, 15)
+        time.sleep(_backoff_delay(attempt, initial=1, cap=15))
+        attempt += 1
     raise TimeoutError(
         f"Space {space_id} did not reach RUNNING within {timeout}s. "
         "Check status and build logs on the Hub."
@@ -659,18 +715,21 @@ def wait_until_space_exists(
         `TimeoutError`: If waiting for the Space takes longer than expected.
     """
     hf_api = huggingface_hub.HfApi()
-    delay = 1
-    for _ in range(30):
+    for attempt in range(30):
         try:
             hf_api.space_info(space_id)
             return
         except (huggingface_hub.utils.HfHubHTTPError, httpx.RequestError):
-            time.sleep(delay)
-            delay = min(delay * 2, 60)
+            time.sleep(_backoff_delay(attempt, initial=0.5, cap=60))
     raise TimeoutError("Waiting for space to exist took longer than expected")
 
 
-def upload_db_to_space(project: str, space_id: str, force: bool = False) -> None:
+_LARGE_DB_THRESHOLD = 50 * 1024 * 1024
+
+
+def upload_db_to_space(
+    project: str, space_id: str, force: bool = False, prefer_hub: bool = False
+) -> None:
     """
     Uploads the database of a local Trackio project to a Hugging Face Space.
 
@@ -684,39 +743,133 @@ def upload_db_to_space(project: str, space_id: str, force: bool = False) -> None
             The ID of the Space to upload to.
         force (`bool`, *optional*, defaults to `False`):
             If `True`, overwrites the existing database without prompting. If `False`,
-            prompts for confirmation.
+            prompts for confirmation, or skips the upload when there is no terminal
+            or notebook to answer the prompt.
+        prefer_hub (`bool`, *optional*, defaults to `False`):
+            If `True` and the database is larger than 50 MB, writes it directly into
+            the bucket mounted at `/data` on the Space through the Hub instead of
+            sending it through the Space's upload endpoint. Falls back to the
+            endpoint when the Space has no bucket mounted.
     """
     db_path = SQLiteStorage.get_project_db_path(project)
-    client = RemoteClient(
-        space_id,
-        hf_token=huggingface_hub.utils.get_token(),
-        httpx_kwargs={"timeout": 90},
-    )
+    hf_token = huggingface_hub.utils.get_token()
+    client = _get_remote_client(space_id, hf_token)
 
     if not force:
         try:
             existing_projects = client.predict(api_name="/get_all_projects")
             if project in existing_projects:
-                response = input(
-                    f"Database for project '{project}' already exists on Space '{space_id}'. "
-                    f"Overwrite it? (y/N): "
+                interactive = is_in_notebook() or (
+                    sys.stdin is not None and sys.stdin.isatty()
                 )
+                response = None
+                if interactive:
+                    try:
+                        response = input(
+                            f"Database for project '{project}' already exists on Space '{space_id}'. "
+                            f"Overwrite it? (y/N): "
+                        )
+                    except EOFError:
+                        pass
+                if response is None:
+                    print(
+                        f"* Database for project '{project}' already exists on Space "
+                        f"'{space_id}'. Not overwriting it from a non-interactive "
+                        "session; pass force=True to overwrite."
+                    )
+                    return
                 if response.lower() not in ["y", "yes"]:
                     print("* Upload cancelled.")
                     return
         except Exception as e:
+            _discard_remote_client(space_id, hf_token, client)
             print(f"* Warning: Could not check if project exists on Space: {e}")
             print("* Proceeding with upload...")
 
-    client.predict(
-        api_name="/upload_db_to_space",
-        project=project,
-        uploaded_db=handle_file(db_path),
-        hf_token=huggingface_hub.utils.get_token(),
-    )
+    if prefer_hub and db_path.stat().st_size > _LARGE_DB_THRESHOLD:
+        bucket_id = _get_space_bucket_at_data_mount(space_id)
+        if bucket_id is not None:
+            upload_db_to_bucket(project, bucket_id)
+            return
+
+    try:
+        client.predict(
+            api_name="/upload_db_to_space",
+            project=project,
+            uploaded_db=handle_file(db_path),
+            hf_token=hf_token,
+        )
+    except Exception:
+        _discard_remote_client(space_id, hf_token, client)
+        raise
 
 
 SYNC_BATCH_SIZE = 500
+SYNC_MAX_WORKERS = 8
+
+
+def _chunked(items: list[dict]) -> Iterator[list[dict]]:
+    for i in range(0, len(items), SYNC_BATCH_SIZE):
+        yield items[i : i + SYNC_BATCH_SIZE]
+
+
+def _count_runs(
+    batches: Iterable[list[dict]], run_counts: Counter[str]
+) -> Iterator[list[dict]]:
+    for batch in batches:
+        run_counts.update(log["run"] for log in batch)
+        yield batch
+
+
+def _submit_batches(
+    executor: ThreadPoolExecutor,
+    client: "RemoteClient",
+    api_name: str,
+    batches: Iterable[list[dict]],
+    hf_token: str | None,
+    label: str,
+    total: int | None = None,
+) -> None:
+    """Send each batch in `batches` to `api_name` concurrently.
+
+    Batches are pulled lazily and at most `2 * SYNC_MAX_WORKERS` are in flight,
+    so reading the next batch overlaps with sending the previous ones. Waits for
+    every batch before returning; if any batch fails, the queued ones are
+    cancelled and the error is re-raised so the caller does not clear the
+    corresponding pending rows.
+    """
+    in_flight: deque[tuple[int, Future]] = deque()
+    sent = 0
+
+    def _finish_oldest() -> None:
+        nonlocal sent
+        size, future = in_flight.popleft()
+        future.result()
+        sent += size
+        progress = f"{sent}/{total}" if total is not None else f"{sent}"
+        print(f"  Syncing {label}: {progress}...")
+
+    try:
+        for batch in batches:
+            if len(in_flight) >= 2 * SYNC_MAX_WORKERS:
+                _finish_oldest()
+            in_flight.append(
+                (
+                    len(batch),
+                    executor.submit(
+                        client.predict,
+                        api_name=api_name,
+                        logs=batch,
+                        hf_token=hf_token,
+                    ),
+                )
+            )
+        while in_flight:
+            _finish_oldest()
+    except BaseException:
+        for _, future in in_flight:
+            future.cancel()
+        raise
 
 
 def _replay_pending_uploads(
@@ -764,7 +917,11 @@ def sync_incremental(
         space_id: The HF Space ID to sync to.
         private: Whether to make the Space private if creating.
         pending_only: If True, only sync rows tagged with space_id (pending data).
+            Returns without contacting the Space when there is nothing pending.
     """
+    if pending_only and not SQLiteStorage.has_pending_data(project):
+        print(f"* No unsynced data for project '{project}'.")
+        return
     print(
         f"* Syncing project '{project}' to: {SPACE_URL.format(space_id=space_id)} (please wait...)"
     )
@@ -773,62 +930,67 @@ def sync_incremental(
     hf_token = huggingface_hub.utils.get_token()
     expected_run_counts: Counter[str] = Counter()
 
-    client = RemoteClient(
-        space_id,
-        hf_token=hf_token,
-        httpx_kwargs={"timeout": 90},
-    )
-
-    if pending_only:
-        pending_logs = SQLiteStorage.get_pending_logs(project)
-        if pending_logs:
-            logs = pending_logs["logs"]
-            expected_run_counts.update(log["run"] for log in logs)
-            for i in range(0, len(logs), SYNC_BATCH_SIZE):
-                batch = logs[i : i + SYNC_BATCH_SIZE]
-                print(
-                    f"  Syncing metrics: {min(i + SYNC_BATCH_SIZE, len(logs))}/{len(logs)}..."
-                )
-                client.predict(api_name="/bulk_log", logs=batch, hf_token=hf_token)
-            SQLiteStorage.clear_pending_logs(project, pending_logs["ids"])
-
-        pending_sys = SQLiteStorage.get_pending_system_logs(project)
-        if pending_sys:
-            logs = pending_sys["logs"]
-            for i in range(0, len(logs), SYNC_BATCH_SIZE):
-                batch = logs[i : i + SYNC_BATCH_SIZE]
-                print(
-                    f"  Syncing system metrics: {min(i + SYNC_BATCH_SIZE, len(logs))}/{len(logs)}..."
-                )
-                client.predict(
-                    api_name="/bulk_log_system", logs=batch, hf_token=hf_token
-                )
-            SQLiteStorage.clear_pending_system_logs(project, pending_sys["ids"])
+    client = _get_remote_client(space_id, hf_token)
 
-        _replay_pending_uploads(project, client, hf_token)
-    else:
-        all_logs = SQLiteStorage.get_all_logs_for_sync(project)
-        if all_logs:
-            expected_run_counts.update(log["run"] for log in all_logs)
-            for i in range(0, len(all_logs), SYNC_BATCH_SIZE):
-                batch = all_logs[i : i + SYNC_BATCH_SIZE]
-                print(
-                    f"  Syncing metrics: {min(i + SYNC_BATCH_SIZE, len(all_logs))}/{len(all_logs)}..."
-                )
-                client.predict(api_name="/bulk_log", logs=batch, hf_token=hf_token)
+    try:
+        with ThreadPoolExecutor(max_workers=SYNC_MAX_WORKERS) as executor:
+            if pending_only:
+                pending_logs = SQLiteStorage.get_pending_logs(project)
+                if pending_logs:
+                    logs = pending_logs["logs"]
+                    expected_run_counts.update(log["run"] for log in logs)
+                    _submit_batches(
+                        executor,
+                        client,
+                        "/bulk_log",
+                        _chunked(logs),
+                        hf_token,
+                        "metrics",
+                        total=len(logs),
+                    )
+                    SQLiteStorage.clear_pending_logs(project, pending_logs["ids"])
+
+                pending_sys = SQLiteStorage.get_pending_system_logs(project)
+                if pending_sys:
+                    _submit_batches(
+                        executor,
+                        client,
+                        "/bulk_log_system",
+                        _chunked(pending_sys["logs"]),
+                        hf_token,
+                        "system metrics",
+                        total=len(pending_sys["logs"]),
+                    )
+                    SQLiteStorage.clear_pending_system_logs(project, pending_sys["ids"])
 
-        all_sys_logs = SQLiteStorage.get_all_system_logs_for_sync(project)
-        if all_sys_logs:
-            for i in range(0, len(all_sys_logs), SYNC_BATCH_SIZE):
-                batch = all_sys_logs[i : i + SYNC_BATCH_SIZE]
-                print(
-                    f"  Syncing system metrics: {min(i + SYNC_BATCH_SIZE, len(all_sys_logs))}/{len(all_sys_logs)}..."
+                _replay_pending_uploads(project, client, hf_token)
+            else:
+                _submit_batches(
+                    executor,
+                    client,
+                    "/bulk_log",
+                    _count_runs(
+                        SQLiteStorage.iter_all_logs_for_sync(project, SYNC_BATCH_SIZE),
+                        expected_run_counts,
+                    ),
+                    hf_token,
+                    "metrics",
                 )
-                client.predict(
-                    api_name="/bulk_log_system", logs=batch, hf_token=hf_token
+                _submit_batches(
+                    executor,
+                    client,
+                    "/bulk_log_system",
+                    SQLiteStorage.iter_all_system_logs_for_sync(
+                        project, SYNC_BATCH_SIZE
+                    ),
+                    hf_token,
+                    "system metrics",
                 )
 
-    _wait_for_remote_sync(client, project, expected_run_counts)
+        _wait_for_remote_sync(client, project, expected_run_counts)
+    except Exception:
+        _discard_remote_client(space_id, hf_token, client)
+        raise
     SQLiteStorage.set_project_metadata(project, "space_id", space_id)
     print(
         f"* Synced successfully to space: {_BOLD_ORANGE}{SPACE_URL.format(space_id=space_id)}{_RESET}"
@@ -840,21 +1002,22 @@ def _build_remote_client_with_retry(
     timeout: int = 360,
     verbose: bool = False,
 ) -> RemoteClient:
+    hf_token = huggingface_hub.utils.get_token()
     deadline = time.time() + timeout
-    delay = 2
+    attempt = 0
     last_error: Exception | None = None
     while time.time() < deadline:
         try:
             return RemoteClient(
                 space_id,
-                hf_token=huggingface_hub.utils.get_token(),
+                hf_token=hf_token,
                 verbose=verbose,
                 httpx_kwargs={"timeout": 90},
             )
         except (ValueError, ConnectionError) as e:
             last_error = e
-            time.sleep(delay)
-            delay = min(delay * 1.5, 15)
+            time.sleep(_backoff_delay(attempt, initial=1, cap=15))
+            attempt += 1
     raise ConnectionError(
         f"Could not connect to Space '{space_id}' within {timeout}s: {last_error}"
     )
@@ -1010,7 +1173,7 @@ def deploy_as_static_space(
     _retry_hf_write(
         "Static Space README upload",
         lambda: hf_api.upload_file(
-            path_or_fileobj=io.BytesIO(readme_content.encode("utf-8")),
+            path_or_fileobj=readme_content.encode("utf-8"),
             path_in_repo="README.md",
             repo_id=space_id,
             repo_type="space",
@@ -1048,7 +1211,7 @@ def deploy_as_static_space(
     _retry_hf_write(
         "Static Space config upload",
         lambda: hf_api.upload_file(
-            path_or_fileobj=io.BytesIO(json_mod.dumps(config).encode("utf-8")),
+            path_or_fileobj=json_mod.dumps(config).encode("utf-8"),
             path_in_repo="config.json",
             repo_id=space_id,
             repo_type="space",
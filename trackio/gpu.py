@@ -1,6 +1,7 @@
 import os
 import threading
 import warnings
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -11,6 +12,39 @@ PYNVML_AVAILABLE = False
 _nvml_initialized = False
 _nvml_lock = threading.Lock()
 _energy_baseline: dict[int, float] = {}
+_handle_cache: dict[int, Any] = {}
+_device_count: int | None = None
+_power_limits: dict[int, float] = {}
+_GPU_METRIC_NAMES = (
+    "utilization",
+    "memory_utilization",
+    "allocated_memory",
+    "total_memory",
+    "memory_usage",
+    "power",
+    "power_limit",
+    "power_percent",
+    "temp",
+    "sm_clock",
+    "memory_clock",
+    "fan_speed",
+    "performance_state",
+    "energy_consumed",
+    "pcie_tx",
+    "pcie_rx",
+    "throttle_thermal",
+    "throttle_power",
+    "throttle_hw_slowdown",
+    "throttle_apps",
+    "corrected_memory_errors",
+    "uncorrected_memory_errors",
+)
+_FIELD_VALUE_METRICS = (
+    ("NVML_FI_DEV_TOTAL_ENERGY_CONSUMPTION", "energy_mj"),
+    ("NVML_FI_DEV_ECC_SBE_VOL_TOTAL", "corrected_memory_errors"),
+    ("NVML_FI_DEV_ECC_DBE_VOL_TOTAL", "uncorrected_memory_errors"),
+)
+_FIELD_VALUE_ATTRS = {0: "dVal", 1: "uiVal", 2: "ulVal", 3: "ullVal", 4: "sllVal"}
 
 
 def _ensure_pynvml():
@@ -31,19 +65,67 @@ def _ensure_pynvml():
 
 
 def _init_nvml() -> bool:
-    global _nvml_initialized
+    global _nvml_initialized, _device_count
+    if _nvml_initialized:
+        return True
     with _nvml_lock:
         if _nvml_initialized:
             return True
         try:
             nvml = _ensure_pynvml()
             nvml.nvmlInit()
+            _handle_cache.clear()
+            _power_limits.clear()
+            _device_count = None
             _nvml_initialized = True
             return True
         except Exception:
             return False
 
 
+@lru_cache(maxsize=None)
+def _gpu_metric_keys(logical_idx: int) -> dict[str, str]:
+    return {name: f"gpu/{logical_idx}/{name}" for name in _GPU_METRIC_NAMES}
+
+
+def _get_device_count() -> int:
+    global _device_count
+    if _device_count is None:
+        _device_count = pynvml.nvmlDeviceGetCount()
+    return _device_count
+
+
+def _get_handle(physical_idx: int) -> Any:
+    handle = _handle_cache.get(physical_idx)
+    if handle is None:
+        handle = pynvml.nvmlDeviceGetHandleByIndex(physical_idx)
+        _handle_cache[physical_idx] = handle
+    return handle
+
+
+def _get_field_values(handle: Any) -> dict[str, Any]:
+    """
+    Read the counters in `_FIELD_VALUE_METRICS` with a single
+    `nvmlDeviceGetFieldValues` call. Fields the driver cannot report are left
+    out so callers can fall back to the dedicated NVML getter.
+    """
+    get_field_values = getattr(pynvml, "nvmlDeviceGetFieldValues", None)
+    if get_field_values is None:
+        return {}
+    try:
+        field_ids = [getattr(pynvml, name) for name, _ in _FIELD_VALUE_METRICS]
+        fields = get_field_values(handle, field_ids)
+    except Exception:
+        return {}
+
+    values = {}
+    for (_, key), field in zip(_FIELD_VALUE_METRICS, fields):
+        attr = _FIELD_VALUE_ATTRS.get(field.valueType)
+        if field.nvmlReturn == pynvml.NVML_SUCCESS and attr is not None:
+            values[key] = getattr(field.value, attr)
+    return values
+
+
 def get_gpu_count() -> tuple[int, list[int]]:
     """
     Get the number of GPUs visible to this process and their physical indices.
@@ -68,7 +150,7 @@ def get_gpu_count() -> tuple[int, list[int]]:
             pass
 
     try:
-        total = pynvml.nvmlDeviceGetCount()
+        total = _get_device_count()
         return total, list(range(total))
     except Exception:
         return 0, []
@@ -87,7 +169,7 @@ def get_all_gpu_count() -> tuple[int, list[int]]:
         return 0, []
 
     try:
-        total = pynvml.nvmlDeviceGetCount()
+        total = _get_device_count()
         return total, list(range(total))
     except Exception:
         return 0, []
@@ -116,7 +198,9 @@ def reset_energy_baseline():
     _energy_baseline = {}
 
 
-def collect_gpu_metrics(device: int | None = None, all_gpus: bool = False) -> dict:
+def collect_gpu_metrics(
+    device: int | None = None, all_gpus: bool = False, include_slow: bool = True
+) -> dict:
     """
     Collect GPU metrics for visible GPUs.
 
@@ -128,13 +212,13 @@ def collect_gpu_metrics(device: int | None = None, all_gpus: bool = False) -> di
         all_gpus: If True and device is None, collect metrics for ALL physical GPUs
                   on the machine, ignoring CUDA_VISIBLE_DEVICES. Used by GpuMonitor
                   to report system-wide GPU metrics in distributed training.
+        include_slow: If False, skip metrics that rarely change during a run (power
+                      limit, fan speed, performance state, and ECC error counts).
+                      `power_percent` keeps using the last power limit read.
 
     Returns:
         Dictionary of GPU metrics. Keys use device indices (gpu/0/, gpu/1/, etc.).
     """
-    if not _init_nvml():
-        return {}
-
     if all_gpus and device is None:
         gpu_count, visible_gpus = get_all_gpu_count()
     else:
@@ -149,6 +233,7 @@ def collect_gpu_metrics(device: int | None = None, all_gpus: bool = False) -> di
     else:
         gpu_indices = list(enumerate(visible_gpus))
 
+    nvml = pynvml
     metrics = {}
     total_util = 0.0
     total_mem_used_gib = 0.0
@@ -157,143 +242,152 @@ def collect_gpu_metrics(device: int | None = None, all_gpus: bool = False) -> di
     valid_util_count = 0
 
     for logical_idx, physical_idx in gpu_indices:
-        prefix = f"gpu/{logical_idx}"
+        keys = _gpu_metric_keys(logical_idx)
         try:
-            handle = pynvml.nvmlDeviceGetHandleByIndex(physical_idx)
+            handle = _get_handle(physical_idx)
+            field_values = _get_field_values(handle)
 
             try:
-                util = pynvml.nvmlDeviceGetUtilizationRates(handle)
-                metrics[f"{prefix}/utilization"] = util.gpu
-                metrics[f"{prefix}/memory_utilization"] = util.memory
+                util = nvml.nvmlDeviceGetUtilizationRates(handle)
+                metrics[keys["utilization"]] = util.gpu
+                metrics[keys["memory_utilization"]] = util.memory
                 total_util += util.gpu
                 valid_util_count += 1
             except Exception:
                 pass
 
             try:
-                mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
+                mem = nvml.nvmlDeviceGetMemoryInfo(handle)
                 mem_used_gib = mem.used / (1024**3)
                 mem_total_gib = mem.total / (1024**3)
-                metrics[f"{prefix}/allocated_memory"] = mem_used_gib
-                metrics[f"{prefix}/total_memory"] = mem_total_gib
+                metrics[keys["allocated_memory"]] = mem_used_gib
+                metrics[keys["total_memory"]] = mem_total_gib
                 if mem.total > 0:
-                    metrics[f"{prefix}/memory_usage"] = mem.used / mem.total
+                    metrics[keys["memory_usage"]] = mem.used / mem.total
                 total_mem_used_gib += mem_used_gib
             except Exception:
                 pass
 
             try:
-                power_mw = pynvml.nvmlDeviceGetPowerUsage(handle)
+                power_mw = nvml.nvmlDeviceGetPowerUsage(handle)
                 power_w = power_mw / 1000.0
-                metrics[f"{prefix}/power"] = power_w
+                metrics[keys["power"]] = power_w
                 total_power += power_w
             except Exception:
                 pass
 
             try:
-                power_limit_mw = pynvml.nvmlDeviceGetPowerManagementLimit(handle)
-                power_limit_w = power_limit_mw / 1000.0
-                metrics[f"{prefix}/power_limit"] = power_limit_w
-                if power_limit_w > 0 and f"{prefix}/power" in metrics:
-                    metrics[f"{prefix}/power_percent"] = (
-                        metrics[f"{prefix}/power"] / power_limit_w
+                if include_slow or physical_idx not in _power_limits:
+                    power_limit_mw = nvml.nvmlDeviceGetPowerManagementLimit(handle)
+                    _power_limits[physical_idx] = power_limit_mw / 1000.0
+                    metrics[keys["power_limit"]] = _power_limits[physical_idx]
+                power_limit_w = _power_limits[physical_idx]
+                if power_limit_w > 0 and keys["power"] in metrics:
+                    metrics[keys["power_percent"]] = (
+                        metrics[keys["power"]] / power_limit_w
                     ) * 100
             except Exception:
                 pass
 
             try:
-                temp = pynvml.nvmlDeviceGetTemperature(
-                    handle, pynvml.NVML_TEMPERATURE_GPU
-                )
-                metrics[f"{prefix}/temp"] = temp
+                temp = nvml.nvmlDeviceGetTemperature(handle, nvml.NVML_TEMPERATURE_GPU)
+                metrics[keys["temp"]] = temp
                 max_temp = max(max_temp, temp)
             except Exception:
                 pass
 
             try:
-                sm_clock = pynvml.nvmlDeviceGetClockInfo(handle, pynvml.NVML_CLOCK_SM)
-                metrics[f"{prefix}/sm_clock"] = sm_clock
+                sm_clock = nvml.nvmlDeviceGetClockInfo(handle, nvml.NVML_CLOCK_SM)
+                metrics[keys["sm_clock"]] = sm_clock
             except Exception:
                 pass
 
             try:
-                mem_clock = pynvml.nvmlDeviceGetClockInfo(handle, pynvml.NVML_CLOCK_MEM)
-                metrics[f"{prefix}/memory_clock"] = mem_clock
+                mem_clock = nvml.nvmlDeviceGetClockInfo(handle, nvml.NVML_CLOCK_MEM)
+                metrics[keys["memory_clock"]] = mem_clock
             except Exception:
                 pass
 
-            try:
-                fan_speed = pynvml.nvmlDeviceGetFanSpeed(handle)
-                metrics[f"{prefix}/fan_speed"] = fan_speed
-            except Exception:
-                pass
+            if include_slow:
+                try:
+                    fan_speed = nvml.nvmlDeviceGetFanSpeed(handle)
+                    metrics[keys["fan_speed"]] = fan_speed
+                except Exception:
+                    pass
 
-            try:
-                pstate = pynvml.nvmlDeviceGetPerformanceState(handle)
-                metrics[f"{prefix}/performance_state"] = pstate
-            except Exception:
-                pass
+                try:
+                    pstate = nvml.nvmlDeviceGetPerformanceState(handle)
+                    metrics[keys["performance_state"]] = pstate
+                except Exception:
+                    pass
 
             try:
-                energy_mj = pynvml.nvmlDeviceGetTotalEnergyConsumption(handle)
+                energy_mj = field_values.get("energy_mj")
+                if energy_mj is None:
+                    energy_mj = nvml.nvmlDeviceGetTotalEnergyConsumption(handle)
                 if physical_idx not in _energy_baseline:
                     _energy_baseline[physical_idx] = energy_mj
                 energy_consumed_mj = energy_mj - _energy_baseline[physical_idx]
-                metrics[f"{prefix}/energy_consumed"] = energy_consumed_mj / 1000.0
+                metrics[keys["energy_consumed"]] = energy_consumed_mj / 1000.0
             except Exception:
                 pass
 
             try:
-                pcie_tx = pynvml.nvmlDeviceGetPcieThroughput(
-                    handle, pynvml.NVML_PCIE_UTIL_TX_BYTES
+                pcie_tx = nvml.nvmlDeviceGetPcieThroughput(
+                    handle, nvml.NVML_PCIE_UTIL_TX_BYTES
                 )
-                pcie_rx = pynvml.nvmlDeviceGetPcieThroughput(
-                    handle, pynvml.NVML_PCIE_UTIL_RX_BYTES
+                pcie_rx = nvml.nvmlDeviceGetPcieThroughput(
+                    handle, nvml.NVML_PCIE_UTIL_RX_BYTES
                 )
-                metrics[f"{prefix}/pcie_tx"] = pcie_tx / 1024.0
-                metrics[f"{prefix}/pcie_rx"] = pcie_rx / 1024.0
+                metrics[keys["pcie_tx"]] = pcie_tx / 1024.0
+                metrics[keys["pcie_rx"]] = pcie_rx / 1024.0
             except Exception:
                 pass
 
             try:
-                throttle = pynvml.nvmlDeviceGetCurrentClocksThrottleReasons(handle)
-                metrics[f"{prefix}/throttle_thermal"] = int(
-                    bool(throttle & pynvml.nvmlClocksThrottleReasonSwThermalSlowdown)
+                throttle = nvml.nvmlDeviceGetCurrentClocksThrottleReasons(handle)
+                metrics[keys["throttle_thermal"]] = int(
+                    bool(throttle & nvml.nvmlClocksThrottleReasonSwThermalSlowdown)
                 )
-                metrics[f"{prefix}/throttle_power"] = int(
-                    bool(throttle & pynvml.nvmlClocksThrottleReasonSwPowerCap)
+                metrics[keys["throttle_power"]] = int(
+                    bool(throttle & nvml.nvmlClocksThrottleReasonSwPowerCap)
                 )
-                metrics[f"{prefix}/throttle_hw_slowdown"] = int(
-                    bool(throttle & pynvml.nvmlClocksThrottleReasonHwSlowdown)
+                metrics[keys["throttle_hw_slowdown"]] = int(
+                    bool(throttle & nvml.nvmlClocksThrottleReasonHwSlowdown)
                 )
-                metrics[f"{prefix}/throttle_apps"] = int(
+                metrics[keys["throttle_apps"]] = int(
                     bool(
                         throttle
-                        & pynvml.nvmlClocksThrottleReasonApplicationsClocksSetting
+                        & nvml.nvmlClocksThrottleReasonApplicationsClocksSetting
                     )
                 )
             except Exception:
                 pass
 
-            try:
-                ecc_corrected = pynvml.nvmlDeviceGetTotalEccErrors(
-                    handle,
-                    pynvml.NVML_MEMORY_ERROR_TYPE_CORRECTED,
-                    pynvml.NVML_VOLATILE_ECC,
-                )
-                metrics[f"{prefix}/corrected_memory_errors"] = ecc_corrected
-            except Exception:
-                pass
-
-            try:
-                ecc_uncorrected = pynvml.nvmlDeviceGetTotalEccErrors(
-                    handle,
-                    pynvml.NVML_MEMORY_ERROR_TYPE_UNCORRECTED,
-                    pynvml.NVML_VOLATILE_ECC,
-                )
-                metrics[f"{prefix}/uncorrected_memory_errors"] = ecc_uncorrected
-            except Exception:
-                pass
+            if include_slow:
+                try:
+                    ecc_corrected = field_values.get("corrected_memory_errors")
+                    if ecc_corrected is None:
+                        ecc_corrected = nvml.nvmlDeviceGetTotalEccErrors(
+                            handle,
+                            nvml.NVML_MEMORY_ERROR_TYPE_CORRECTED,
+                            nvml.NVML_VOLATILE_ECC,
+                        )
+                    metrics[keys["corrected_memory_errors"]] = ecc_corrected
+                except Exception:
+                    pass
+
+                try:
+                    ecc_uncorrected = field_values.get("uncorrected_memory_errors")
+                    if ecc_uncorrected is None:
+                        ecc_uncorrected = nvml.nvmlDeviceGetTotalEccErrors(
+                            handle,
+                            nvml.NVML_MEMORY_ERROR_TYPE_UNCORRECTED,
+                            nvml.NVML_VOLATILE_ECC,
+                        )
+                    metrics[keys["uncorrected_memory_errors"]] = ecc_uncorrected
+                except Exception:
+                    pass
 
         except Exception:
             continue
@@ -310,12 +404,17 @@ def collect_gpu_metrics(device: int | None = None, all_gpus: bool = False) -> di
     return metrics
 
 
+GPU_KEYFRAME_INTERVAL = 6
+
+
 class GpuMonitor:
     def __init__(self, run: "Run", interval: float = 10.0):
         self._run = run
         self._interval = interval
         self._stop_flag = threading.Event()
         self._thread: "threading.Thread | None" = None
+        self._last_metrics: dict = {}
+        self._ticks = 0
 
     def start(self):
         count, _ = get_all_gpu_count()
@@ -337,14 +436,36 @@ class GpuMonitor:
     def _monitor_loop(self):
         while not self._stop_flag.is_set():
             try:
-                metrics = collect_gpu_metrics(all_gpus=True)
-                if metrics:
-                    self._run.log_system(metrics)
+                metrics = collect_gpu_metrics(
+                    all_gpus=True,
+                    include_slow=self._ticks % GPU_KEYFRAME_INTERVAL == 0,
+                )
+                changed = self._changed_metrics(metrics) if metrics else {}
+                if changed and not self._stop_flag.is_set():
+                    self._run.log_system(changed)
             except Exception:
                 pass
 
             self._stop_flag.wait(timeout=self._interval)
 
+    def _changed_metrics(self, metrics: dict) -> dict:
+        """
+        Returns the metrics whose values differ from the previous sample. Every
+        `GPU_KEYFRAME_INTERVAL` samples the full set is returned instead.
+        """
+        if self._ticks % GPU_KEYFRAME_INTERVAL == 0:
+            changed = metrics
+        else:
+            last = self._last_metrics
+            changed = {
+                key: value
+                for key, value in metrics.items()
+                if key not in last or last[key] != value
+            }
+        self._ticks += 1
+        self._last_metrics = metrics
+        return changed
+
 
 def log_gpu(run: "Run | None" = None, device: int | None = None) -> dict:
     """
@@ -1,10 +1,81 @@
 import csv
 import os
+from collections.abc import Iterator
+from itertools import islice
 from pathlib import Path
 
+import numpy as np
+
 from trackio import deploy, utils
 from trackio.sqlite_storage import SQLiteStorage
 
+CSV_IMPORT_CHUNK_SIZE = 10_000
+
+
+def _read_csv_header(csv_path: Path) -> list[str]:
+    with csv_path.open(newline="", encoding="utf-8") as csv_file:
+        header = next(csv.reader(csv_file), [])
+    column_mapping = utils.simplify_column_names(header)
+    return [column_mapping[name] for name in header]
+
+
+def _iter_csv_blocks(
+    csv_path: Path, width: int, chunk_size: int
+) -> Iterator[np.ndarray]:
+    with csv_path.open(newline="", encoding="utf-8") as csv_file:
+        reader = csv.reader(csv_file)
+        next(reader, None)
+        while rows := list(islice(reader, chunk_size)):
+            rows = [
+                row if len(row) == width else (row + [""] * width)[:width]
+                for row in rows
+                if row
+            ]
+            if rows:
+                yield np.array(rows, dtype=object).reshape(len(rows), width)
+
+
+def _numeric_csv_columns(block: np.ndarray, indices: list[int]) -> list[int]:
+    if not indices:
+        return []
+    cells = block[:, indices]
+    filled = np.where(cells != "", cells, "nan")
+    try:
+        filled.astype(np.float64)
+        return indices
+    except ValueError:
+        pass
+
+    numeric_indices = []
+    for position, index in enumerate(indices):
+        try:
+            filled[:, position].astype(np.float64)
+        except ValueError:
+            continue
+        numeric_indices.append(index)
+    return numeric_indices
+
+
+def _csv_block_to_columns(
+    block: np.ndarray,
+    numeric_indices: list[int],
+    step_index: int,
+    timestamp_index: int | None,
+) -> tuple[np.ndarray, np.ndarray, list[int], list[str]]:
+    cells = block[:, numeric_indices]
+    present = cells != ""
+    keep = np.flatnonzero(present.any(axis=1))
+    values = np.where(present[keep], cells[keep], "nan").astype(np.float64)
+    steps = block[keep, step_index].astype(np.float64)
+    if not np.isfinite(steps).all():
+        raise ValueError("CSV 'step' column must contain finite numbers")
+    timestamps = (
+        block[keep, timestamp_index].tolist()
+        if timestamp_index is not None
+        else [""] * len(keep)
+    )
+    return values, present[keep], steps.astype(np.int64).tolist(), timestamps
+
 
 def import_csv(
     csv_path: str | Path,
@@ -58,87 +129,73 @@ def import_csv(
     if not csv_path.exists():
         raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
-    with csv_path.open(newline="", encoding="utf-8") as csv_file:
-        reader = csv.DictReader(csv_file)
-        source_columns = reader.fieldnames or []
-        rows = list(reader)
-
-    if not rows:
+    header = _read_csv_header(csv_path)
+    width = len(header)
+    column_indices = {column: i for i, column in enumerate(header)}
+    numeric_indices = None
+    for block in _iter_csv_blocks(csv_path, width, CSV_IMPORT_CHUNK_SIZE):
+        if numeric_indices is None:
+            step_column = next((c for c in column_indices if c.lower() == "step"), None)
+            if step_column is None:
+                raise ValueError("CSV file must contain a 'step' or 'Step' column")
+            numeric_indices = [
+                index
+                for column, index in column_indices.items()
+                if column not in (step_column, "timestamp")
+            ]
+        numeric_indices = _numeric_csv_columns(block, numeric_indices)
+
+    if numeric_indices is None:
         raise ValueError("CSV file is empty")
 
-    column_mapping = utils.simplify_column_names(source_columns)
-    normalized_rows = [
-        {column_mapping[key]: value for key, value in row.items()} for row in rows
-    ]
-    columns = list(normalized_rows[0].keys())
-
-    step_column = None
-    for col in columns:
-        if col.lower() == "step":
-            step_column = col
-            break
-
-    if step_column is None:
-        raise ValueError("CSV file must contain a 'step' or 'Step' column")
-
     if name is None:
         name = csv_path.stem
 
-    metrics_list = []
-    steps = []
-    timestamps = []
-
-    numeric_columns = []
-    for column in columns:
-        if column == step_column:
-            continue
-        if column == "timestamp":
-            continue
-
-        try:
-            for row in normalized_rows:
-                value = row[column]
-                if value in ("", None):
-                    continue
-                float(value)
-        except (ValueError, TypeError):
-            continue
-        numeric_columns.append(column)
-
-    for row in normalized_rows:
-        metrics = {}
-        for column in numeric_columns:
-            value = row[column]
-            if value not in ("", None):
-                metrics[column] = float(value)
-
-        if metrics:
-            metrics_list.append(metrics)
-            steps.append(int(float(row[step_column])))
-
-            if "timestamp" in row and row["timestamp"] not in ("", None):
-                timestamps.append(str(row["timestamp"]))
-            else:
-                timestamps.append("")
+    column_names = {index: column for column, index in column_indices.items()}
+    numeric_columns = [column_names[index] for index in numeric_indices]
+    step_index = column_indices[step_column]
+    timestamp_index = column_indices.get("timestamp")
+    imported_rows = 0
+    imported_metrics: dict[str, None] = {}
+    try:
+        for block in _iter_csv_blocks(csv_path, width, CSV_IMPORT_CHUNK_SIZE):
+            values, present, steps, timestamps = _csv_block_to_columns(
+                block, numeric_indices, step_index, timestamp_index
+            )
+            if not steps:
+                continue
+            SQLiteStorage.bulk_log_columnar(
+                project=project,
+                run=name,
+                columns=numeric_columns,
+                values=values,
+                present=present,
+                steps=steps,
+                timestamps=timestamps,
+            )
+            imported_rows += len(steps)
+            imported_metrics.update(
+                dict.fromkeys(
+                    column
+                    for column, seen in zip(numeric_columns, present.any(axis=0))
+                    if seen
+                )
+            )
+    except Exception:
+        if imported_rows:
+            SQLiteStorage.delete_run(project, name)
+        raise
 
-    if not metrics_list:
+    if not imported_rows:
         raise ValueError(
             f"No numeric metric data found in CSV file: {csv_path}. Columns other "
             "than 'step' and 'timestamp' must contain numeric values."
         )
 
-    SQLiteStorage.bulk_log(
-        project=project,
-        run=name,
-        metrics_list=metrics_list,
-        steps=steps,
-        timestamps=timestamps,
-    )
-
     print(
-        f"* Imported {len(metrics_list)} rows from {csv_path} into project '{project}' as run '{name}'"
+        f"* Imported {imported_rows} rows from {csv_path} into project '{project}' as run '{name}'"
     )
-    print(f"* Metrics found: {', '.join(metrics_list[0].keys())}")
+    print(f"* Metrics found: {', '.join(imported_metrics)}")
 
     space_id, dataset_id, _ = utils.preprocess_space_and_dataset_ids(
         space_id, dataset_id
@@ -154,7 +211,9 @@ def import_csv(
             space_id=space_id, dataset_id=dataset_id, private=private
         )
         deploy.wait_until_space_exists(space_id=space_id)
-        deploy.upload_db_to_space(project=project, space_id=space_id, force=force)
+        deploy.upload_db_to_space(
+            project=project, space_id=space_id, force=force, prefer_hub=True
+        )
         print(
             f"* View dashboard by going to: {deploy.SPACE_URL.format(space_id=space_id)}"
         )
@@ -303,7 +362,7 @@ def import_tf_events(
             space_id, dataset_id=dataset_id, private=private
         )
         deploy.wait_until_space_exists(space_id)
-        deploy.upload_db_to_space(project, space_id, force=force)
+        deploy.upload_db_to_space(project, space_id, force=force, prefer_hub=True)
         print(
             f"* View dashboard by going to: {deploy.SPACE_URL.format(space_id=space_id)}"
         )
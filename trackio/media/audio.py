@@ -1,4 +1,3 @@
-import os
 import shutil
 import subprocess
 import warnings
@@ -82,10 +81,7 @@ class TrackioAudio(TrackioMedia):
                 format=self._format,
             )
         elif isinstance(self._value, str | Path):
-            if os.path.isfile(self._value):
-                shutil.copy(self._value, file_path)
-            else:
-                raise ValueError(f"File not found: {self._value}")
+            shutil.copyfile(self._value, file_path)
 
     @staticmethod
     def ensure_int16_pcm(data: np.ndarray) -> np.ndarray:
@@ -1,4 +1,4 @@
-import os
+import io
 import shutil
 from pathlib import Path
 
@@ -7,7 +7,24 @@ from PIL import Image as PILImage
 
 from trackio.media.media import TrackioMedia
 
-TrackioImageSourceType = str | Path | np.ndarray | PILImage.Image
+TrackioImageSourceType = str | Path | np.ndarray | PILImage.Image | bytes
+
+PNG_NATIVE_MODES = frozenset({"1", "L", "LA", "I", "I;16", "P", "RGB", "RGBA"})
+ENCODED_IMAGE_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", "png"),
+    (b"\xff\xd8\xff", "jpg"),
+    (b"GIF87a", "gif"),
+    (b"GIF89a", "gif"),
+)
+
+
+def _encoded_image_format(data: bytes) -> str | None:
+    for signature, image_format in ENCODED_IMAGE_SIGNATURES:
+        if data.startswith(signature):
+            return image_format
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "webp"
+    return None
 
 
 class TrackioImage(TrackioMedia):
@@ -33,17 +50,24 @@ class TrackioImage(TrackioMedia):
         # Create an image from file path
         image = trackio.Image("path/to/image.jpg", caption="Photo from file")
         trackio.log({"file_image": image})
+
+        # Create an image from already-encoded bytes
+        image = trackio.Image(png_bytes, caption="Image from bytes")
+        trackio.log({"bytes_image": image})
         ```
 
     Args:
-        value (`str`, `Path`, `numpy.ndarray`, or `PIL.Image`, *optional*):
-            A path to an image, a PIL Image, or a numpy array of shape (height, width, channels).
-            If numpy array, should be of type `np.uint8` with RGB values in the range `[0, 255]`.
+        value (`str`, `Path`, `numpy.ndarray`, `PIL.Image`, or `bytes`, *optional*):
+            A path to an image, a PIL Image, a numpy array of shape (height, width, channels),
+            or the encoded bytes of an image file. If numpy array, should be of type `np.uint8`
+            with RGB values in the range `[0, 255]`. PNG, JPEG, GIF, and WebP bytes are
+            stored as-is; other formats readable by Pillow are converted to PNG.
         caption (`str`, *optional*):
             A string caption for the image.
     """
 
     TYPE = "trackio.image"
+    COMPRESS_LEVEL = 1
 
     def __init__(self, value: TrackioImageSourceType, caption: str | None = None):
         super().__init__(value, caption)
@@ -57,6 +81,13 @@ class TrackioImage(TrackioMedia):
             raise ValueError(
                 f"Invalid value dtype, expected np.uint8, got {self._value.dtype}"
             )
+        if isinstance(self._value, bytes):
+            self._format = _encoded_image_format(self._value)
+            if self._format is None:
+                try:
+                    self._value = PILImage.open(io.BytesIO(self._value))
+                except Exception as e:
+                    raise ValueError("Failed to decode image bytes") from e
         if (
             isinstance(self._value, np.ndarray | PILImage.Image)
             and self._format is None
@@ -66,19 +97,30 @@ class TrackioImage(TrackioMedia):
     def _as_pil(self) -> PILImage.Image | None:
         try:
             if isinstance(self._value, np.ndarray):
-                arr = np.asarray(self._value).astype("uint8")
-                return PILImage.fromarray(arr).convert("RGBA")
-            if isinstance(self._value, PILImage.Image):
-                return self._value.convert("RGBA")
+                pil = PILImage.fromarray(self._value)
+            elif isinstance(self._value, PILImage.Image):
+                pil = self._value
+            else:
+                return None
+            if pil.mode not in PNG_NATIVE_MODES:
+                pil = pil.convert("RGBA")
+            return pil
         except Exception as e:
             raise ValueError(f"Failed to process image data: {self._value}") from e
         return None
 
+    def _snapshot_value(self):
+        if isinstance(self._value, PILImage.Image):
+            return self._value.copy()
+        return super()._snapshot_value()
+
     def _save_media(self, file_path: Path):
-        if pil := self._as_pil():
-            pil.save(file_path, format=self._format)
-        elif isinstance(self._value, str | Path):
-            if os.path.isfile(self._value):
-                shutil.copy(self._value, file_path)
+        if isinstance(self._value, bytes):
+            file_path.write_bytes(self._value)
+        elif pil := self._as_pil():
+            if self._format == "png":
+                pil.save(file_path, format="png", compress_level=self.COMPRESS_LEVEL)
             else:
-                raise ValueError(f"File not found: {self._value}")
+                pil.save(file_path, format=self._format)
+        elif isinstance(self._value, str | Path):
+            shutil.copyfile(self._value, file_path)
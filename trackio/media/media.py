@@ -1,10 +1,49 @@
 import os
+import threading
 import uuid
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
 
+import numpy as np
+
 from trackio.media.utils import get_project_media_path
-from trackio.utils import MEDIA_DIR
+from trackio.utils import MEDIA_DIR, _emit_nonfatal_warning
+
+MEDIA_WRITE_WORKERS = min(4, os.cpu_count() or 1)
+
+_media_executor: ThreadPoolExecutor | None = None
+_pending_media_writes: set[Future] = set()
+_media_lock = threading.Lock()
+
+
+def _submit_media_write(fn, *args) -> Future:
+    global _media_executor
+    with _media_lock:
+        if _media_executor is None:
+            _media_executor = ThreadPoolExecutor(
+                max_workers=MEDIA_WRITE_WORKERS, thread_name_prefix="trackio-media"
+            )
+        future = _media_executor.submit(fn, *args)
+        _pending_media_writes.add(future)
+    future.add_done_callback(_finish_media_write)
+    return future
+
+
+def _finish_media_write(future: Future) -> None:
+    with _media_lock:
+        _pending_media_writes.discard(future)
+    if not future.cancelled() and future.exception() is not None:
+        _emit_nonfatal_warning(
+            f"trackio could not save a media file: {future.exception()}"
+        )
+
+
+def wait_for_media_writes() -> None:
+    """Block until every media file queued by a background `_save` is written."""
+    with _media_lock:
+        pending = list(_pending_media_writes)
+    wait(pending)
 
 
 class TrackioMedia(ABC):
@@ -28,6 +67,7 @@ class TrackioMedia(ABC):
         self.caption = caption
         self._value = value
         self._file_path: Path | None = None
+        self._absolute_file_path: Path | None = None
 
         if isinstance(self._value, str | Path):
             if not os.path.isfile(self._value):
@@ -47,11 +87,15 @@ class TrackioMedia(ABC):
         return self._file_path
 
     def _get_absolute_file_path(self) -> Path | None:
-        if self._file_path:
-            return MEDIA_DIR / self._file_path
-        return None
+        return self._absolute_file_path
 
-    def _save(self, project: str, run: str, step: int = 0):
+    def _save(self, project: str, run: str, step: int = 0, background: bool = False):
+        """
+        Writes the media file under the project's media directory. With
+        `background=True`, in-memory values are encoded on a worker thread from a
+        private copy; the file path is assigned immediately and
+        `wait_for_media_writes()` blocks until the file exists.
+        """
         if self._file_path:
             return
 
@@ -59,8 +103,32 @@ class TrackioMedia(ABC):
         filename = f"{uuid.uuid4()}.{self._file_extension()}"
         file_path = media_dir / filename
 
-        self._save_media(file_path)
+        snapshot = self._snapshot_value() if background else None
+        if snapshot is not None:
+            self._value = snapshot
+            _submit_media_write(self._write_file, file_path, project, run, step)
+        else:
+            self._write_file(file_path, project, run, step)
         self._file_path = file_path.relative_to(MEDIA_DIR)
+        self._absolute_file_path = file_path
+
+    def _write_file(self, file_path: Path, project: str, run: str, step: int):
+        try:
+            self._save_media(file_path)
+        except FileNotFoundError:
+            if file_path.parent.exists():
+                raise
+            get_project_media_path(project=project, run=run, step=step)
+            self._save_media(file_path)
+
+    def _snapshot_value(self):
+        """
+        Returns a private copy of an in-memory value that is worth encoding in the
+        background, or None to save synchronously.
+        """
+        if isinstance(self._value, np.ndarray):
+            return self._value.copy()
+        return None
 
     @abstractmethod
     def _save_media(self, file_path: Path):
@@ -1,7 +1,9 @@
 import shutil
+from functools import lru_cache
 from pathlib import Path
 
-from trackio.utils import project_media_dir
+from trackio import utils
+from trackio.utils import canonical_project_name, project_media_dir
 
 
 def check_path(file_path: str | Path) -> None:
@@ -16,13 +18,28 @@ def check_path(file_path: str | Path) -> None:
             )
 
 
+_ffmpeg_found = False
+
+
 def check_ffmpeg_installed() -> None:
-    """Raise an error if ffmpeg is not available on the system PATH."""
+    """
+    Raise an error if ffmpeg is not available on the system PATH. A successful lookup
+    is remembered for the rest of the process; a failed one is retried on the next call.
+    """
+    global _ffmpeg_found
+    if _ffmpeg_found:
+        return
     if shutil.which("ffmpeg") is None:
         raise RuntimeError(
             "ffmpeg is required to write this media format but was not found on your system. "
             "Please install ffmpeg and ensure it is available on your PATH."
         )
+    _ffmpeg_found = True
+
+
+@lru_cache(maxsize=4096)
+def _step_media_dir(media_dir: Path, project: str, run: str, step: int) -> Path:
+    return media_dir / canonical_project_name(project) / run / str(step)
 
 
 def get_project_media_path(
@@ -47,14 +64,15 @@ def get_project_media_path(
     if step is not None and run is None:
         raise ValueError("Uploading files at a specific step requires a run")
 
-    path = project_media_dir(project)
-    if run:
-        path /= run
-        if step is not None:
-            path /= str(step)
+    if run and step is not None:
+        path = _step_media_dir(utils.MEDIA_DIR, project, run, step)
     else:
-        path /= "files"
-        if relative_path:
-            path /= relative_path
+        path = project_media_dir(project)
+        if run:
+            path /= run
+        else:
+            path /= "files"
+            if relative_path:
+                path /= relative_path
     path.mkdir(parents=True, exist_ok=True)
     return path
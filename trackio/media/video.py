@@ -1,6 +1,6 @@
-import os
 import shutil
 import subprocess
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Literal
 
@@ -12,6 +12,11 @@ from trackio.media.utils import check_ffmpeg_installed, check_path
 TrackioVideoSourceType = str | Path | np.ndarray
 TrackioVideoFormatType = Literal["gif", "mp4", "webm"]
 VideoCodec = Literal["h264", "vp9", "gif"]
+VIDEO_FORMAT_CODECS: dict[str, VideoCodec] = {
+    "gif": "gif",
+    "mp4": "h264",
+    "webm": "vp9",
+}
 
 
 class TrackioVideo(TrackioMedia):
@@ -40,7 +45,9 @@ class TrackioVideo(TrackioMedia):
             A path to a video file, or a numpy array.
             If numpy array, should be of type `np.uint8` with RGB values in the range `[0, 255]`.
             It is expected to have shape of either (frames, channels, height, width) or (batch, frames, channels, height, width).
-            For the latter, the videos will be tiled into a grid.
+            Channels-last arrays, (frames, height, width, channels) or (batch, frames, height, width, channels), are also
+            accepted. When the shape fits both layouts (the third-to-last axis is 1, 3, or 4), it is read as channels-first.
+            For batched input, the videos will be tiled into a grid.
         caption (`str`, *optional*):
             A string caption for the video.
         fps (`int`, *optional*):
@@ -50,6 +57,7 @@ class TrackioVideo(TrackioMedia):
     """
 
     TYPE = "trackio.video"
+    _CHANNEL_COUNTS = (1, 3, 4)
 
     def __init__(
         self,
@@ -104,8 +112,19 @@ class TrackioVideo(TrackioMedia):
         arr = np.asarray(video)
         TrackioVideo._check_array_format(arr)
 
-        frames = np.ascontiguousarray(arr)
-        _, height, width, _ = frames.shape
+        _, height, width, _ = arr.shape
+        TrackioVideo._write_frames(file_path, arr, height, width, fps, codec)
+
+    @staticmethod
+    def _write_frames(
+        file_path: str | Path,
+        frames: Iterable[np.ndarray],
+        height: int,
+        width: int,
+        fps: float,
+        codec: VideoCodec,
+    ) -> None:
+        """Pipes (H, W, 3) uint8 frames to ffmpeg one at a time."""
         out_path = str(file_path)
 
         cmd = [
@@ -162,7 +181,7 @@ class TrackioVideo(TrackioMedia):
         proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
         try:
             for frame in frames:
-                proc.stdin.write(frame.tobytes())
+                proc.stdin.write(np.ascontiguousarray(frame))
         finally:
             if proc.stdin:
                 proc.stdin.close()
@@ -176,29 +195,38 @@ class TrackioVideo(TrackioMedia):
                 raise RuntimeError(f"ffmpeg failed with code {ret}\n{stderr}")
 
     @property
-    def _codec(self) -> str:
-        match self._format:
-            case "gif":
-                return "gif"
-            case "mp4":
-                return "h264"
-            case "webm":
-                return "vp9"
-            case _:
-                raise ValueError(f"Unsupported format: {self._format}")
+    def _codec(self) -> VideoCodec:
+        try:
+            return VIDEO_FORMAT_CODECS[self._format]
+        except KeyError:
+            raise ValueError(f"Unsupported format: {self._format}") from None
 
     def _save_media(self, file_path: Path):
         if isinstance(self._value, np.ndarray):
-            video = TrackioVideo._process_ndarray(self._value)
-            TrackioVideo.write_video(file_path, video, fps=self._fps, codec=self._codec)
+            check_ffmpeg_installed()
+            video = TrackioVideo._as_channels_last_batch(self._value)
+            TrackioVideo._check_array_format(video[0])
+            _, _, height, width, _ = video.shape
+            n_rows, n_cols = TrackioVideo._tile_grid(video.shape[0])
+            TrackioVideo._write_frames(
+                file_path,
+                TrackioVideo._iter_tiled_frames(video),
+                n_rows * height,
+                n_cols * width,
+                fps=self._fps,
+                codec=self._codec,
+            )
         elif isinstance(self._value, str | Path):
-            if os.path.isfile(self._value):
-                shutil.copy(self._value, file_path)
-            else:
-                raise ValueError(f"File not found: {self._value}")
+            shutil.copyfile(self._value, file_path)
 
     @staticmethod
     def _process_ndarray(value: np.ndarray) -> np.ndarray:
+        return TrackioVideo._tile_batched_videos(
+            TrackioVideo._as_channels_last_batch(value)
+        )
+
+    @staticmethod
+    def _as_channels_last_batch(value: np.ndarray) -> np.ndarray:
         # Verify value is either 4D (single video) or 5D array (batched videos).
         # Expected format: (frames, channels, height, width) or (batch, frames, channels, height, width)
         if value.ndim < 4:
@@ -212,35 +240,64 @@ class TrackioVideo(TrackioMedia):
         if value.ndim == 4:
             # Reshape to 5D with single batch: (1, frames, channels, height, width)
             value = value[np.newaxis, ...]
-
-        value = TrackioVideo._tile_batched_videos(value)
+        channels_last = (
+            value.shape[-1] == 3 and value.shape[-3] not in TrackioVideo._CHANNEL_COUNTS
+        )
+        if not channels_last:
+            value = np.moveaxis(value, -3, -1)
         return value
 
+    @staticmethod
+    def _tile_grid(batch_size: int) -> tuple[int, int]:
+        grid_size = 1 << (batch_size - 1).bit_length()
+        n_rows = 1 << ((grid_size.bit_length() - 1) // 2)
+        return n_rows, grid_size // n_rows
+
+    @staticmethod
+    def _iter_tiled_frames(video: np.ndarray) -> Iterator[np.ndarray]:
+        """
+        Yields the tiled grid one frame at a time, reusing a single frame buffer.
+
+        Input format: (batch, frames, height, width, channels)
+        Output format: (total_height, total_width, channels) per frame
+        """
+        batch_size, frames, height, width, channels = video.shape
+        if batch_size == 1:
+            yield from video[0]
+            return
+
+        n_rows, n_cols = TrackioVideo._tile_grid(batch_size)
+        tile = np.zeros((n_rows * height, n_cols * width, channels), dtype=video.dtype)
+        for frame in range(frames):
+            for index in range(batch_size):
+                row, col = divmod(index, n_cols)
+                tile[
+                    row * height : (row + 1) * height,
+                    col * width : (col + 1) * width,
+                ] = video[index, frame]
+            yield tile
+
     @staticmethod
     def _tile_batched_videos(video: np.ndarray) -> np.ndarray:
         """
         Tiles a batch of videos into a grid of videos.
 
-        Input format: (batch, frames, channels, height, width) - original FCHW format
+        Input format: (batch, frames, height, width, channels)
         Output format: (frames, total_height, total_width, channels)
         """
-        batch_size, frames, channels, height, width = video.shape
-
-        next_pow2 = 1 << (batch_size - 1).bit_length()
-        if batch_size != next_pow2:
-            pad_len = next_pow2 - batch_size
-            pad_shape = (pad_len, frames, channels, height, width)
-            padding = np.zeros(pad_shape, dtype=video.dtype)
-            video = np.concatenate((video, padding), axis=0)
-            batch_size = next_pow2
-
-        n_rows = 1 << ((batch_size.bit_length() - 1) // 2)
-        n_cols = batch_size // n_rows
-
-        # Reshape to grid layout: (n_rows, n_cols, frames, channels, height, width)
-        video = video.reshape(n_rows, n_cols, frames, channels, height, width)
-
-        # Rearrange dimensions to (frames, total_height, total_width, channels)
-        video = video.transpose(2, 0, 4, 1, 5, 3)
-        video = video.reshape(frames, n_rows * height, n_cols * width, channels)
-        return video
+        batch_size, frames, height, width, channels = video.shape
+        if batch_size == 1:
+            return video[0]
+
+        n_rows, n_cols = TrackioVideo._tile_grid(batch_size)
+        tiled = np.zeros(
+            (frames, n_rows * height, n_cols * width, channels), dtype=video.dtype
+        )
+        for index in range(batch_size):
+            row, col = divmod(index, n_cols)
+            tiled[
+                :,
+                row * height : (row + 1) * height,
+                col * width : (col + 1) * width,
+            ] = video[index]
+        return tiled
@@ -1,5 +1,5 @@
-from collections.abc import Callable
-from pathlib import Path
+import os
+from collections.abc import Callable, Iterator
 from typing import Any
 
 from gradio_client import handle_file
@@ -7,6 +7,8 @@ from gradio_client import handle_file
 from trackio.sqlite_storage import SQLiteStorage
 from trackio.typehints import ARTIFACT_BLOB_UPLOAD_KIND
 
+PENDING_UPLOAD_BATCH_SIZE = 100
+
 
 def classify_pending_uploads(buffered: dict) -> dict:
     """Partition `buffered` (`{"uploads": [...], "ids": [...]}` from
@@ -17,7 +19,7 @@ def classify_pending_uploads(buffered: dict) -> dict:
     missing: dict = {"paths": [], "ids": []}
     for upload, upload_id in zip(buffered["uploads"], buffered["ids"]):
         fp = upload["file_path"]
-        if not Path(fp).exists():
+        if not os.path.exists(fp):
             missing["paths"].append(fp)
             missing["ids"].append(upload_id)
         elif upload.get("kind") == ARTIFACT_BLOB_UPLOAD_KIND:
@@ -46,23 +48,11 @@ def _artifact_blob_upload_entry(upload: dict) -> dict:
     }
 
 
-def group_pending_uploads(buffered: dict) -> dict:
-    """Shape classified rows for the gradio `predict` endpoints."""
-    classified = classify_pending_uploads(buffered)
-    media: dict = {"entries": [], "ids": []}
-    for upload, upload_id in classified["media"]:
-        media["entries"].append(_media_upload_entry(upload))
-        media["ids"].append(upload_id)
-    artifact_blobs: dict[str, dict] = {}
-    for upload, upload_id in classified["artifact_blobs"]:
-        group = artifact_blobs.setdefault(upload["project"], {"entries": [], "ids": []})
-        group["entries"].append(_artifact_blob_upload_entry(upload))
-        group["ids"].append(upload_id)
-    return {
-        "media": media,
-        "artifact_blobs": artifact_blobs,
-        "missing": classified["missing"],
-    }
+def _batched(
+    rows: list[tuple[dict, int]], batch_size: int
+) -> Iterator[list[tuple[dict, int]]]:
+    for i in range(0, len(rows), batch_size):
+        yield rows[i : i + batch_size]
 
 
 def replay_pending_uploads(
@@ -73,34 +63,42 @@ def replay_pending_uploads(
     hf_token: str | None,
     warn_missing: Callable[[int, str], None],
     verbose: bool = False,
+    batch_size: int = PENDING_UPLOAD_BATCH_SIZE,
 ) -> None:
-    """Route grouped `pending_uploads` rows to their endpoints, clearing each
-    group's rows as soon as it is sent.
+    """Route classified `pending_uploads` rows to their endpoints in batches of
+    `batch_size`, clearing each batch's rows as soon as it is sent so an
+    interrupted replay resumes where it stopped.
     """
-    grouped = group_pending_uploads(buffered)
-    missing = grouped["missing"]
+    classified = classify_pending_uploads(buffered)
+    missing = classified["missing"]
     if missing["ids"]:
         warn_missing(len(missing["ids"]), missing["paths"][0])
         SQLiteStorage.clear_pending_uploads(project, missing["ids"])
-    media = grouped["media"]
-    if media["entries"]:
-        if verbose:
-            print(f"  Syncing {len(media['entries'])} media files...")
+    media = classified["media"]
+    if media and verbose:
+        print(f"  Syncing {len(media)} media files...")
+    for batch in _batched(media, batch_size):
         predict(
             api_name="/bulk_upload_media",
-            uploads=media["entries"],
+            uploads=[_media_upload_entry(upload) for upload, _ in batch],
             hf_token=hf_token,
         )
-        SQLiteStorage.clear_pending_uploads(project, media["ids"])
-    for proj, group in grouped["artifact_blobs"].items():
+        SQLiteStorage.clear_pending_uploads(
+            project, [upload_id for _, upload_id in batch]
+        )
+    artifact_blobs: dict[str, list[tuple[dict, int]]] = {}
+    for upload, upload_id in classified["artifact_blobs"]:
+        artifact_blobs.setdefault(upload["project"], []).append((upload, upload_id))
+    for proj, rows in artifact_blobs.items():
         if verbose:
-            print(
-                f"  Syncing {len(group['entries'])} artifact blobs for project '{proj}'..."
+            print(f"  Syncing {len(rows)} artifact blobs for project '{proj}'...")
+        for batch in _batched(rows, batch_size):
+            predict(
+                api_name="/bulk_upload_artifact_blob",
+                project=proj,
+                uploads=[_artifact_blob_upload_entry(upload) for upload, _ in batch],
+                hf_token=hf_token,
+            )
+            SQLiteStorage.clear_pending_uploads(
+                project, [upload_id for _, upload_id in batch]
             )
-        predict(
-            api_name="/bulk_upload_artifact_blob",
-            project=proj,
-            uploads=group["entries"],
-            hf_token=hf_token,
-        )
-        SQLiteStorage.clear_pending_uploads(project, group["ids"])
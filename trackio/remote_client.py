@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import inspect
+import json
 from pathlib import Path
 from typing import Any
 from urllib.parse import urljoin, urlparse
@@ -10,12 +11,14 @@ import huggingface_hub
 from gradio_client import Client as GradioClient
 from huggingface_hub.utils import build_hf_headers
 
+from trackio.compression import REQUEST_ENCODINGS, encode_request_body
 from trackio.utils import parse_trackio_server_url
 
 HTTP_API_VERSION = 1
 FORCE_SYNC_TIMEOUT = 180.0
 
 WRITE_TOKEN_HEADER = "x-trackio-write-token"
+MIN_COMPRESSED_REQUEST_SIZE = 1024
 
 
 def _normalize_src(src: str) -> str:
@@ -99,8 +102,10 @@ class _TrackioHTTPClient:
         hf_token: str | None = None,
         write_token: str | None = None,
         httpx_kwargs: dict[str, Any] | None = None,
+        request_encoding: str | None = None,
     ) -> None:
         self.src = _resolve_src_url(src)
+        self.request_encoding = request_encoding
         self.httpx_kwargs = dict(httpx_kwargs or {})
         self.httpx_kwargs.setdefault("timeout", 60)
         extra = self.httpx_kwargs.pop("headers", None)
@@ -147,10 +152,21 @@ class _TrackioHTTPClient:
         request_kwargs["timeout"] = _request_timeout_for_api(
             request_kwargs.get("timeout"), api_name
         )
+        headers = dict(self.headers)
+        headers["Content-Type"] = "application/json"
+        content = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+        if (
+            self.request_encoding is not None
+            and len(content) >= MIN_COMPRESSED_REQUEST_SIZE
+        ):
+            content = encode_request_body(content, self.request_encoding)
+            headers["Content-Encoding"] = self.request_encoding
         resp = httpx.post(
             urljoin(self.src, f"api/{api_name}"),
-            headers=self.headers,
-            json=payload,
+            headers=headers,
+            content=content,
             **request_kwargs,
         )
         if resp.status_code == 404:
@@ -224,12 +240,13 @@ def _raise_if_space_is_building(space_id: str) -> None:
         raise ConnectionError(f"Space '{space_id}' is still building.")
 
 
-def _supports_http_api(
+def _http_api_info(
     src: str,
     hf_token: str | None = None,
     write_token: str | None = None,
     httpx_kwargs: dict[str, Any] | None = None,
-) -> bool:
+) -> dict[str, Any] | None:
+    """Return the server's `/version` payload if it speaks the HTTP API."""
     url = _resolve_src_url(src)
     headers = _merge_client_headers(hf_token, write_token)
     kwargs = dict(httpx_kwargs or {})
@@ -237,11 +254,18 @@ def _supports_http_api(
     try:
         resp = httpx.get(urljoin(url, "version"), headers=headers, **kwargs)
         if not resp.is_success:
-            return False
+            return None
         data = resp.json()
-        return data.get("api_version") == HTTP_API_VERSION
+        if data.get("api_version") != HTTP_API_VERSION:
+            return None
+        return data
     except Exception:
-        return False
+        return None
+
+
+def _pick_request_encoding(api_info: dict[str, Any]) -> str | None:
+    accepted = api_info.get("request_encodings") or []
+    return next((enc for enc in REQUEST_ENCODINGS if enc in accepted), None)
 
 
 class RemoteClient:
@@ -254,6 +278,7 @@ class RemoteClient:
         verbose: bool = False,
     ) -> None:
         self._space = space
+        self._features: frozenset[str] = frozenset()
         src_for_resolve = space
         hf_effective = hf_token
         wt_effective = write_token
@@ -265,17 +290,20 @@ class RemoteClient:
             if not _host_is_hf_space(_normalize_src(base)):
                 hf_effective = None
         try:
-            if _supports_http_api(
+            api_info = _http_api_info(
                 src_for_resolve,
                 hf_token=hf_effective,
                 write_token=wt_effective,
                 httpx_kwargs=httpx_kwargs,
-            ):
+            )
+            if api_info is not None:
+                self._features = frozenset(api_info.get("features") or ())
                 self._client = _TrackioHTTPClient(
                     src_for_resolve,
                     hf_token=hf_effective,
                     write_token=wt_effective,
                     httpx_kwargs=httpx_kwargs,
+                    request_encoding=_pick_request_encoding(api_info),
                 )
             else:
                 if not src_for_resolve.startswith(("http://", "https://")):
@@ -296,3 +324,7 @@ class RemoteClient:
 
     def predict(self, *args, api_name: str, **kwargs) -> Any:
         return self._client.predict(*args, api_name=api_name, **kwargs)
+
+    def supports(self, feature: str) -> bool:
+        """Whether the server advertised `feature` in its `/version` payload."""
+        return feature in self._features
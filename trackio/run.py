@@ -25,6 +25,7 @@ from trackio.gpu import GpuMonitor, gpu_available
 from trackio.histogram import Histogram
 from trackio.markdown import Markdown
 from trackio.media import TrackioMedia, get_project_media_path
+from trackio.media.media import wait_for_media_writes
 from trackio.pending_uploads import classify_pending_uploads, replay_pending_uploads
 from trackio.remote_client import RemoteClient, is_transient_remote_error
 from trackio.sqlite_storage import SQLiteStorage
@@ -37,6 +38,37 @@ BATCH_SEND_INTERVAL = 0.5
 MAX_BACKOFF = 30
 BUCKET_FLUSH_INTERVAL = 30
 ARTIFACT_LOG_RETRY_BACKOFFS = (0.5, 1.0, 2.0)
+MAX_QUEUED_LOGS = 10_000
+_RESERVED_KEYS = frozenset(utils.RESERVED_KEYS)
+_SCALAR_TYPES = frozenset({int, float, bool, str, type(None)})
+_MEDIA_TYPES = frozenset({"trackio.image", "trackio.video", "trackio.audio"})
+
+
+def _new_entry_id() -> str:
+    return os.urandom(16).hex()
+
+
+def _group_entries_by_run(entries: list[dict]) -> dict[tuple, list[dict]]:
+    if not entries:
+        return {}
+    first = entries[0]
+    project, run, run_id = first["project"], first["run"], first.get("run_id")
+    if all(
+        entry["project"] == project
+        and entry["run"] == run
+        and entry.get("run_id") == run_id
+        for entry in entries
+    ):
+        return {(project, run, run_id): entries}
+    groups: dict[tuple, list[dict]] = {}
+    for entry in entries:
+        key = (entry["project"], entry["run"], entry.get("run_id"))
+        groups.setdefault(key, []).append(entry)
+    return groups
+
+
+def _first_config(entries: list[dict]) -> dict | None:
+    return next((entry["config"] for entry in entries if entry.get("config")), None)
 
 
 class Run:
@@ -106,7 +138,14 @@ class Run:
         """
         self.url = url
         self.project = project
+        # NOTE: `_client_lock` guards the queued entries and the `_client`
+        # assignment and is never held across a network call. `_send_lock`
+        # serializes every remote request made through `_client` together with
+        # the cached `_hf_token` it may reset. Take `_send_lock` first when
+        # both are needed.
         self._client_lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._hf_token: str | None = None
         self._warning_lock = threading.Lock()
         self._warned_failures: set[str] = set()
         self._local_sender_thread: threading.Thread | None = None
@@ -164,6 +203,7 @@ class Run:
         self._queued_uploads: list[UploadEntry] = []
         self._queued_alerts: list[AlertEntry] = []
         self._stop_flag = threading.Event()
+        self._wake_event = threading.Event()
         self._config_logged = False
         max_step = self._safe_get_max_step_for_run()
         self._next_step = 0 if max_step is None else max_step + 1
@@ -221,7 +261,11 @@ class Run:
                 )
 
     def _hf_token_for_remote(self) -> str | None:
-        return huggingface_hub.utils.get_token() if self._space_id else None
+        if not self._space_id:
+            return None
+        if self._hf_token is None:
+            self._hf_token = huggingface_hub.utils.get_token()
+        return self._hf_token
 
     def _remote_source_dict(self) -> dict:
         return {
@@ -290,6 +334,10 @@ class Run:
             )
             return False
 
+    def _wake_sender(self) -> None:
+        if not self._wake_event.is_set():
+            self._wake_event.set()
+
     def _thread_is_alive(self, attr_name: str) -> bool:
         thread = getattr(self, attr_name, None)
         return isinstance(thread, threading.Thread) and thread.is_alive()
@@ -297,39 +345,35 @@ class Run:
     def _flush_queues_inline(self) -> None:
         if self._is_local:
             if self._queued_logs:
-                logs_to_send = self._queued_logs.copy()
-                self._queued_logs.clear()
+                logs_to_send, self._queued_logs = self._queued_logs, []
                 self._write_logs_to_sqlite(logs_to_send)
 
             if self._queued_system_logs:
-                system_logs_to_send = self._queued_system_logs.copy()
-                self._queued_system_logs.clear()
+                system_logs_to_send, self._queued_system_logs = (
+                    self._queued_system_logs,
+                    [],
+                )
                 self._write_system_logs_to_sqlite(system_logs_to_send)
 
             if self._queued_alerts:
-                alerts_to_send = self._queued_alerts.copy()
-                self._queued_alerts.clear()
+                alerts_to_send, self._queued_alerts = self._queued_alerts, []
                 self._write_alerts_to_sqlite(alerts_to_send)
             return
 
         if self._queued_logs:
-            logs_to_send = self._queued_logs.copy()
-            self._queued_logs.clear()
+            logs_to_send, self._queued_logs = self._queued_logs, []
             self._persist_logs_locally(logs_to_send)
 
         if self._queued_system_logs:
-            system_logs_to_send = self._queued_system_logs.copy()
-            self._queued_system_logs.clear()
+            system_logs_to_send, self._queued_system_logs = self._queued_system_logs, []
             self._persist_system_logs_locally(system_logs_to_send)
 
         if self._queued_uploads:
-            uploads_to_send = self._queued_uploads.copy()
-            self._queued_uploads.clear()
+            uploads_to_send, self._queued_uploads = self._queued_uploads, []
             self._persist_uploads_locally(uploads_to_send)
 
         if self._queued_alerts:
-            alerts_to_send = self._queued_alerts.copy()
-            self._queued_alerts.clear()
+            alerts_to_send, self._queued_alerts = self._queued_alerts, []
             self._write_alerts_to_sqlite(alerts_to_send)
 
     def _local_batch_sender(self):
@@ -340,24 +384,25 @@ class Run:
             or len(self._queued_alerts) > 0
         ):
             if not self._stop_flag.is_set():
+                self._wake_event.wait()
+                self._wake_event.clear()
                 self._stop_flag.wait(timeout=BATCH_SEND_INTERVAL)
 
             try:
                 with self._client_lock:
-                    if self._queued_logs:
-                        logs_to_send = self._queued_logs.copy()
-                        self._queued_logs.clear()
-                        self._write_logs_to_sqlite(logs_to_send)
-
-                    if self._queued_system_logs:
-                        system_logs_to_send = self._queued_system_logs.copy()
-                        self._queued_system_logs.clear()
-                        self._write_system_logs_to_sqlite(system_logs_to_send)
-
-                    if self._queued_alerts:
-                        alerts_to_send = self._queued_alerts.copy()
-                        self._queued_alerts.clear()
-                        self._write_alerts_to_sqlite(alerts_to_send)
+                    logs_to_send, self._queued_logs = self._queued_logs, []
+                    system_logs_to_send, self._queued_system_logs = (
+                        self._queued_system_logs,
+                        [],
+                    )
+                    alerts_to_send, self._queued_alerts = self._queued_alerts, []
+
+                if logs_to_send:
+                    self._write_logs_to_sqlite(logs_to_send)
+                if system_logs_to_send:
+                    self._write_system_logs_to_sqlite(system_logs_to_send)
+                if alerts_to_send:
+                    self._write_alerts_to_sqlite(alerts_to_send)
             except Exception as e:
                 self._warn_once(
                     "local-sender-loop",
@@ -399,32 +444,18 @@ class Run:
             )
             return
         try:
-            logs_by_run: dict[tuple, dict] = {}
-            for entry in logs:
-                key = (entry["project"], entry["run"], entry.get("run_id"))
-                if key not in logs_by_run:
-                    logs_by_run[key] = {
-                        "metrics": [],
-                        "steps": [],
-                        "log_ids": [],
-                        "config": None,
-                    }
-                logs_by_run[key]["metrics"].append(entry["metrics"])
-                logs_by_run[key]["steps"].append(entry.get("step"))
-                logs_by_run[key]["log_ids"].append(entry.get("log_id"))
-                if entry.get("config") and logs_by_run[key]["config"] is None:
-                    logs_by_run[key]["config"] = entry["config"]
-
-            for (project, run, run_id), data in logs_by_run.items():
-                has_log_ids = any(lid is not None for lid in data["log_ids"])
+            for (project, run, run_id), entries in _group_entries_by_run(logs).items():
+                log_ids = [entry.get("log_id") for entry in entries]
                 SQLiteStorage.bulk_log(
                     project=project,
                     run=run,
                     run_id=run_id,
-                    metrics_list=data["metrics"],
-                    steps=data["steps"],
-                    config=data["config"],
-                    log_ids=data["log_ids"] if has_log_ids else None,
+                    metrics_list=[entry["metrics"] for entry in entries],
+                    steps=[entry.get("step") for entry in entries],
+                    config=_first_config(entries),
+                    log_ids=log_ids
+                    if any(lid is not None for lid in log_ids)
+                    else None,
                 )
         except Exception as e:
             self._warn_once(
@@ -440,24 +471,17 @@ class Run:
             )
             return
         try:
-            logs_by_run: dict[tuple, dict] = {}
-            for entry in logs:
-                key = (entry["project"], entry["run"], entry.get("run_id"))
-                if key not in logs_by_run:
-                    logs_by_run[key] = {"metrics": [], "timestamps": [], "log_ids": []}
-                logs_by_run[key]["metrics"].append(entry["metrics"])
-                logs_by_run[key]["timestamps"].append(entry.get("timestamp"))
-                logs_by_run[key]["log_ids"].append(entry.get("log_id"))
-
-            for (project, run, run_id), data in logs_by_run.items():
-                has_log_ids = any(lid is not None for lid in data["log_ids"])
+            for (project, run, run_id), entries in _group_entries_by_run(logs).items():
+                log_ids = [entry.get("log_id") for entry in entries]
                 SQLiteStorage.bulk_log_system(
                     project=project,
                     run=run,
                     run_id=run_id,
-                    metrics_list=data["metrics"],
-                    timestamps=data["timestamps"],
-                    log_ids=data["log_ids"] if has_log_ids else None,
+                    metrics_list=[entry["metrics"] for entry in entries],
+                    timestamps=[entry.get("timestamp") for entry in entries],
+                    log_ids=log_ids
+                    if any(lid is not None for lid in log_ids)
+                    else None,
                 )
         except Exception as e:
             self._warn_once(
@@ -479,37 +503,22 @@ class Run:
             self._write_records_to_local_inbox(records, "write-alerts-fragment")
             return
         try:
-            alerts_by_run: dict[tuple, dict] = {}
-            for entry in alerts:
-                key = (entry["project"], entry["run"], entry.get("run_id"))
-                if key not in alerts_by_run:
-                    alerts_by_run[key] = {
-                        "titles": [],
-                        "texts": [],
-                        "levels": [],
-                        "steps": [],
-                        "timestamps": [],
-                        "alert_ids": [],
-                    }
-                alerts_by_run[key]["titles"].append(entry["title"])
-                alerts_by_run[key]["texts"].append(entry.get("text"))
-                alerts_by_run[key]["levels"].append(entry["level"])
-                alerts_by_run[key]["steps"].append(entry.get("step"))
-                alerts_by_run[key]["timestamps"].append(entry.get("timestamp"))
-                alerts_by_run[key]["alert_ids"].append(entry.get("alert_id"))
-
-            for (project, run, run_id), data in alerts_by_run.items():
-                has_alert_ids = any(aid is not None for aid in data["alert_ids"])
+            for (project, run, run_id), entries in _group_entries_by_run(
+                alerts
+            ).items():
+                alert_ids = [entry.get("alert_id") for entry in entries]
                 SQLiteStorage.bulk_alert(
                     project=project,
                     run=run,
                     run_id=run_id,
-                    titles=data["titles"],
-                    texts=data["texts"],
-                    levels=data["levels"],
-                    steps=data["steps"],
-                    timestamps=data["timestamps"],
-                    alert_ids=data["alert_ids"] if has_alert_ids else None,
+                    titles=[entry["title"] for entry in entries],
+                    texts=[entry.get("text") for entry in entries],
+                    levels=[entry["level"] for entry in entries],
+                    steps=[entry.get("step") for entry in entries],
+                    timestamps=[entry.get("timestamp") for entry in entries],
+                    alert_ids=alert_ids
+                    if any(aid is not None for aid in alert_ids)
+                    else None,
                 )
         except Exception as e:
             self._warn_once(
@@ -558,62 +567,74 @@ class Run:
                                 self._queued_alerts.clear()
                         return
 
-                    failed = False
+                    client = self._client
+                    logs_to_send, self._queued_logs = self._queued_logs, []
+                    system_logs_to_send, self._queued_system_logs = (
+                        self._queued_system_logs,
+                        [],
+                    )
+                    uploads_to_send, self._queued_uploads = self._queued_uploads, []
+                    alerts_to_send, self._queued_alerts = self._queued_alerts, []
 
-                    if self._queued_logs:
-                        logs_to_send = self._queued_logs.copy()
-                        self._queued_logs.clear()
-                        try:
-                            self._client.predict(
-                                api_name="/bulk_log",
-                                logs=logs_to_send,
-                                hf_token=self._hf_token_for_remote(),
-                            )
-                        except Exception:
-                            self._persist_logs_locally(logs_to_send)
-                            failed = True
-
-                    if self._queued_system_logs:
-                        system_logs_to_send = self._queued_system_logs.copy()
-                        self._queued_system_logs.clear()
-                        try:
-                            self._client.predict(
-                                api_name="/bulk_log_system",
-                                logs=system_logs_to_send,
-                                hf_token=self._hf_token_for_remote(),
-                            )
-                        except Exception:
-                            self._persist_system_logs_locally(system_logs_to_send)
-                            failed = True
-
-                    if self._queued_uploads:
-                        uploads_to_send = self._queued_uploads.copy()
-                        self._queued_uploads.clear()
-                        try:
-                            self._client.predict(
-                                api_name="/bulk_upload_media",
-                                uploads=uploads_to_send,
-                                hf_token=self._hf_token_for_remote(),
-                            )
-                        except Exception:
-                            self._persist_uploads_locally(uploads_to_send)
-                            failed = True
-
-                    if self._queued_alerts:
-                        alerts_to_send = self._queued_alerts.copy()
-                        self._queued_alerts.clear()
-                        try:
-                            self._client.predict(
-                                api_name="/bulk_alert",
-                                alerts=alerts_to_send,
-                                hf_token=self._hf_token_for_remote(),
-                            )
-                        except Exception:
-                            self._write_alerts_to_sqlite(alerts_to_send)
-                            failed = True
+                with self._send_lock:
+                    failed = False
+                    supports = getattr(client, "supports", None)
+                    if callable(supports) and supports("bulk_ingest"):
+                        failed = not self._send_fused_batch(
+                            client,
+                            logs_to_send,
+                            system_logs_to_send,
+                            uploads_to_send,
+                            alerts_to_send,
+                        )
+                    else:
+                        if logs_to_send:
+                            try:
+                                client.predict(
+                                    api_name="/bulk_log",
+                                    logs=logs_to_send,
+                                    hf_token=self._hf_token_for_remote(),
+                                )
+                            except Exception:
+                                self._persist_logs_locally(logs_to_send)
+                                failed = True
+
+                        if system_logs_to_send:
+                            try:
+                                client.predict(
+                                    api_name="/bulk_log_system",
+                                    logs=system_logs_to_send,
+                                    hf_token=self._hf_token_for_remote(),
+                                )
+                            except Exception:
+                                self._persist_system_logs_locally(system_logs_to_send)
+                                failed = True
+
+                        if uploads_to_send:
+                            try:
+                                client.predict(
+                                    api_name="/bulk_upload_media",
+                                    uploads=uploads_to_send,
+                                    hf_token=self._hf_token_for_remote(),
+                                )
+                            except Exception:
+                                self._persist_uploads_locally(uploads_to_send)
+                                failed = True
+
+                        if alerts_to_send:
+                            try:
+                                client.predict(
+                                    api_name="/bulk_alert",
+                                    alerts=alerts_to_send,
+                                    hf_token=self._hf_token_for_remote(),
+                                )
+                            except Exception:
+                                self._write_alerts_to_sqlite(alerts_to_send)
+                                failed = True
 
                     if failed:
                         consecutive_failures += 1
+                        self._hf_token = None
                     else:
                         consecutive_failures = 0
                         if self._has_local_buffer:
@@ -631,6 +652,39 @@ class Run:
                     f"trackio's remote logging thread hit an internal error: {e}. User code will continue while Trackio retries in the background.",
                 )
 
+    def _send_fused_batch(
+        self,
+        client: Any,
+        logs: list[LogEntry],
+        system_logs: list[SystemLogEntry],
+        uploads: list[UploadEntry],
+        alerts: list[AlertEntry],
+    ) -> bool:
+        if not (logs or system_logs or uploads or alerts):
+            return True
+        try:
+            failed = client.predict(
+                api_name="/bulk_ingest",
+                logs=logs,
+                system_logs=system_logs,
+                uploads=uploads,
+                alerts=alerts,
+                hf_token=self._hf_token_for_remote(),
+            )
+        except Exception:
+            failed = {"logs", "system_logs", "uploads", "alerts"}
+        if not failed:
+            return True
+        if logs and "logs" in failed:
+            self._persist_logs_locally(logs)
+        if system_logs and "system_logs" in failed:
+            self._persist_system_logs_locally(system_logs)
+        if uploads and "uploads" in failed:
+            self._persist_uploads_locally(uploads)
+        if alerts and "alerts" in failed:
+            self._write_alerts_to_sqlite(alerts)
+        return False
+
     def _persist_records_as_fragments(self, records: list[dict], warning_key: str):
         records = self._stamped_records(records)
         if self._bucket_id is not None:
@@ -653,31 +707,15 @@ class Run:
             )
             return
         try:
-            logs_by_run: dict[tuple, dict] = {}
-            for entry in logs:
-                key = (entry["project"], entry["run"], entry.get("run_id"))
-                if key not in logs_by_run:
-                    logs_by_run[key] = {
-                        "metrics": [],
-                        "steps": [],
-                        "log_ids": [],
-                        "config": None,
-                    }
-                logs_by_run[key]["metrics"].append(entry["metrics"])
-                logs_by_run[key]["steps"].append(entry.get("step"))
-                logs_by_run[key]["log_ids"].append(entry.get("log_id"))
-                if entry.get("config") and logs_by_run[key]["config"] is None:
-                    logs_by_run[key]["config"] = entry["config"]
-
-            for (project, run, run_id), data in logs_by_run.items():
+            for (project, run, run_id), entries in _group_entries_by_run(logs).items():
                 SQLiteStorage.bulk_log(
                     project=project,
                     run=run,
                     run_id=run_id,
-                    metrics_list=data["metrics"],
-                    steps=data["steps"],
-                    log_ids=data["log_ids"],
-                    config=data["config"],
+                    metrics_list=[entry["metrics"] for entry in entries],
+                    steps=[entry.get("step") for entry in entries],
+                    log_ids=[entry.get("log_id") for entry in entries],
+                    config=_first_config(entries),
                     space_id=self._remote_storage_key,
                 )
             self._has_local_buffer = True
@@ -697,23 +735,14 @@ class Run:
             )
             return
         try:
-            logs_by_run: dict[tuple, dict] = {}
-            for entry in logs:
-                key = (entry["project"], entry["run"], entry.get("run_id"))
-                if key not in logs_by_run:
-                    logs_by_run[key] = {"metrics": [], "timestamps": [], "log_ids": []}
-                logs_by_run[key]["metrics"].append(entry["metrics"])
-                logs_by_run[key]["timestamps"].append(entry.get("timestamp"))
-                logs_by_run[key]["log_ids"].append(entry.get("log_id"))
-
-            for (project, run, run_id), data in logs_by_run.items():
+            for (project, run, run_id), entries in _group_entries_by_run(logs).items():
                 SQLiteStorage.bulk_log_system(
                     project=project,
                     run=run,
                     run_id=run_id,
-                    metrics_list=data["metrics"],
-                    timestamps=data["timestamps"],
-                    log_ids=data["log_ids"],
+                    metrics_list=[entry["metrics"] for entry in entries],
+                    timestamps=[entry.get("timestamp") for entry in entries],
+                    log_ids=[entry.get("log_id") for entry in entries],
                     space_id=self._remote_storage_key,
                 )
             self._has_local_buffer = True
@@ -822,6 +851,7 @@ class Run:
             self._has_local_buffer = False
             return True
         except Exception as e:
+            self._hf_token = None
             self._warn_once(
                 "flush-local-buffer",
                 f"trackio could not flush buffered remote data for run '{self.name}': {e}. It will retry later if possible.",
@@ -973,7 +1003,7 @@ class Run:
 
     def _drain_pending_uploads(self) -> None:
         """Synchronously flush pending_uploads (both kinds). Raises on failure."""
-        with self._client_lock:
+        with self._send_lock:
             if self._client is None:
                 raise RuntimeError(
                     "trackio remote client not ready; cannot drain pending_uploads"
@@ -1062,12 +1092,19 @@ class Run:
             relative_path=relative_path,
         )
         src = Path(file_path)
-        if src.exists() and str(src.resolve()) != str(Path(media_path).resolve()):
-            shutil.copy(str(src), str(media_path))
+        dest = media_path / src.name
+        if src.exists() and src.resolve() != dest.resolve():
+            shutil.copyfile(src, dest)
 
     def _process_media(self, value: TrackioMedia, step: int | None) -> dict:
-        value._save(self.project, self.name, step if step is not None else 0)
-        if self._space_id or self._server_base_url:
+        remote = bool(self._space_id or self._server_base_url)
+        value._save(
+            self.project,
+            self.name,
+            step if step is not None else 0,
+            background=not remote,
+        )
+        if remote:
             self._queue_upload(value._get_absolute_file_path(), step)
         return value._to_dict()
 
@@ -1075,11 +1112,7 @@ class Run:
         if not self._space_id and not self._server_base_url:
             return
         if isinstance(value, dict):
-            if value.get("_type") in [
-                "trackio.image",
-                "trackio.video",
-                "trackio.audio",
-            ]:
+            if value.get("_type") in _MEDIA_TYPES:
                 file_path = value.get("file_path")
                 if file_path:
                     absolute_path = MEDIA_DIR / file_path
@@ -1118,25 +1151,31 @@ class Run:
 
     def log(self, metrics: dict, step: int | None = None):
         try:
-            renamed_keys = []
-            new_metrics = {}
-
-            for k, v in metrics.items():
-                if k in utils.RESERVED_KEYS or k.startswith("__"):
-                    new_key = f"__{k}"
-                    renamed_keys.append(k)
-                    new_metrics[new_key] = v
-                else:
-                    new_metrics[k] = v
+            if _RESERVED_KEYS.isdisjoint(metrics) and not any(
+                k.startswith("__") for k in metrics
+            ):
+                metrics = dict(metrics)
+            else:
+                renamed_keys = []
+                new_metrics = {}
+                for k, v in metrics.items():
+                    if k in _RESERVED_KEYS or k.startswith("__"):
+                        new_key = f"__{k}"
+                        renamed_keys.append(k)
+                        new_metrics[new_key] = v
+                    else:
+                        new_metrics[k] = v
 
-            if renamed_keys:
-                _emit_nonfatal_warning(
-                    f"Reserved keys renamed: {renamed_keys} → '__{{key}}'"
-                )
+                if renamed_keys:
+                    _emit_nonfatal_warning(
+                        f"Reserved keys renamed: {renamed_keys} → '__{{key}}'"
+                    )
 
-            metrics = new_metrics
+                metrics = new_metrics
             media_step = step if step is not None else self._next_step
             for key, value in metrics.items():
+                if type(value) in _SCALAR_TYPES:
+                    continue
                 if isinstance(value, Table):
                     metrics[key] = value._to_dict(
                         project=self.project, run=self.name, step=media_step
@@ -1185,19 +1224,31 @@ class Run:
                 "metrics": metrics,
                 "step": step,
                 "config": config_to_log,
-                "log_id": uuid.uuid4().hex,
+                "log_id": _new_entry_id(),
             }
 
+            logs_to_spill = None
             with self._client_lock:
                 self._queued_logs.append(log_entry)
+                self._wake_sender()
                 self._ensure_sender_alive()
                 if not self._thread_is_alive(
                     "_local_sender_thread" if self._is_local else "_client_thread"
                 ):
                     self._flush_queues_inline()
+                elif len(self._queued_logs) >= MAX_QUEUED_LOGS:
+                    logs_to_spill, self._queued_logs = self._queued_logs, []
+            if logs_to_spill:
+                self._spill_queued_logs(logs_to_spill)
         except Exception as e:
             _emit_nonfatal_warning(f"trackio.log() failed to process metrics: {e}")
 
+    def _spill_queued_logs(self, logs: list[LogEntry]):
+        if self._is_local:
+            self._write_logs_to_sqlite(logs)
+        else:
+            self._persist_logs_locally(logs)
+
     def _artifact_log_with_retry(self, **kwargs) -> dict:
         manifest = kwargs.get("manifest", [])
         ref_entries = [
@@ -1213,7 +1264,7 @@ class Run:
             if attempt > 0:
                 time.sleep(ARTIFACT_LOG_RETRY_BACKOFFS[attempt - 1])
             try:
-                with self._client_lock:
+                with self._send_lock:
                     record = self._client.predict(api_name="/artifact_log", **kwargs)
             except Exception as e:
                 if attempt == attempts - 1 or not is_transient_remote_error(e):
@@ -1306,7 +1357,7 @@ class Run:
 
             file_entries = [e for e in manifest if not references.is_reference_entry(e)]
             digests = [e["digest"] for e in file_entries]
-            with self._client_lock:
+            with self._send_lock:
                 present_response = self._client.predict(
                     api_name="/check_artifact_blobs",
                     project=self.project,
@@ -1407,7 +1458,7 @@ class Run:
             )
         else:
             self._wait_for_client_ready()
-            with self._client_lock:
+            with self._send_lock:
                 record = self._client.predict(
                     api_name="/get_artifact_manifest",
                     project=project,
@@ -1443,7 +1494,7 @@ class Run:
                     direction="input",
                 )
             else:
-                with self._client_lock:
+                with self._send_lock:
                     self._client.predict(
                         api_name="/log_artifact_use",
                         project=project,
@@ -1484,11 +1535,12 @@ class Run:
                 "level": level.value,
                 "step": step,
                 "timestamp": timestamp,
-                "alert_id": uuid.uuid4().hex,
+                "alert_id": _new_entry_id(),
             }
 
             with self._client_lock:
                 self._queued_alerts.append(alert_entry)
+                self._wake_sender()
                 self._ensure_sender_alive()
                 if not self._thread_is_alive(
                     "_local_sender_thread" if self._is_local else "_client_thread"
@@ -1526,11 +1578,12 @@ class Run:
                 "run_id": self.id,
                 "metrics": metrics,
                 "timestamp": timestamp,
-                "log_id": uuid.uuid4().hex,
+                "log_id": _new_entry_id(),
             }
 
             with self._client_lock:
                 self._queued_system_logs.append(system_log_entry)
+                self._wake_sender()
                 self._ensure_sender_alive()
                 if not self._thread_is_alive(
                     "_local_sender_thread" if self._is_local else "_client_thread"
@@ -1559,7 +1612,9 @@ class Run:
                         f"trackio.finish() could not stop automatic CPU logging cleanly: {e}.",
                     )
 
+            wait_for_media_writes()
             self._stop_flag.set()
+            self._wake_event.set()
 
             if self._is_local:
                 if self._local_sender_thread is not None:
@@ -1570,7 +1625,7 @@ class Run:
                             "Could not flush all logs within 30s. Some data may be buffered locally."
                         )
                 else:
-                    with self._client_lock:
+                    with self._send_lock, self._client_lock:
                         self._flush_queues_inline()
             else:
                 with self._client_lock:
@@ -1584,7 +1639,7 @@ class Run:
                     else:
                         self._client_thread.join(timeout=5)
                     if self._client_thread.is_alive():
-                        with self._client_lock:
+                        with self._send_lock, self._client_lock:
                             if self._client is None:
                                 self._flush_queues_inline()
                         if client_connected or self._bucket_id is None:
@@ -1592,7 +1647,7 @@ class Run:
                                 "Could not flush all logs to the remote server in time. Some data may be buffered locally."
                             )
                 else:
-                    with self._client_lock:
+                    with self._send_lock, self._client_lock:
                         self._flush_queues_inline()
 
                 try:
@@ -919,6 +919,38 @@ def bulk_alert(
             _enqueue_write("bulk_alert", payload)
 
 
+def bulk_ingest(
+    request: Request,
+    hf_token: str | None,
+    logs: list[LogEntry] | None = None,
+    system_logs: list[SystemLogEntry] | None = None,
+    uploads: list[UploadEntry] | None = None,
+    alerts: list[AlertEntry] | None = None,
+) -> dict[str, str]:
+    """
+    Applies one sender tick's worth of logs, system logs, uploads, and alerts.
+
+    Each section is written independently. Returns a mapping from the name of
+    every section that failed to its error message, so the client only
+    re-queues those sections.
+    """
+    assert_can_write_metrics(request, hf_token)
+    failed = {}
+    for section, handler, entries in (
+        ("logs", bulk_log, logs),
+        ("system_logs", bulk_log_system, system_logs),
+        ("uploads", bulk_upload_media, uploads),
+        ("alerts", bulk_alert, alerts),
+    ):
+        if not entries:
+            continue
+        try:
+            handler(request, entries, hf_token)
+        except Exception as e:
+            failed[section] = str(e)
+    return failed
+
+
 def get_alerts(
     project: str,
     run: str | None = None,
@@ -1293,6 +1325,7 @@ def _api_registry() -> dict[str, Any]:
         "bulk_log": bulk_log,
         "bulk_log_system": bulk_log_system,
         "bulk_alert": bulk_alert,
+        "bulk_ingest": bulk_ingest,
         "get_alerts": get_alerts,
         "get_metric_values": get_metric_values,
         "get_runs_for_project": get_runs_for_project,
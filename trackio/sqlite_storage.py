@@ -24,11 +24,13 @@ except ImportError:
     _msvcrt = None
 
 import huggingface_hub as hf
+import numpy as np
 import orjson
 
 from trackio import cas, references
 from trackio.commit_scheduler import CommitScheduler
 from trackio.dummy_commit_scheduler import DummyCommitScheduler
+from trackio.markdown import Markdown
 from trackio.typehints import (
     ARTIFACT_BLOB_UPLOAD_KIND,
     MEDIA_UPLOAD_KIND,
@@ -1651,49 +1653,19 @@ class SQLiteStorage:
                         space_id=space_id,
                     )
                     trace_rows.extend(rows)
-                    if supports_run_ids:
-                        data.append(
-                            (
-                                timestamps[i],
-                                resolved_run_id,
-                                run,
-                                steps[i],
-                                orjson.dumps(serialize_values(clean_metrics)),
-                                lid,
-                                space_id,
-                            )
-                        )
-                    else:
-                        data.append(
-                            (
-                                timestamps[i],
-                                run,
-                                steps[i],
-                                orjson.dumps(serialize_values(clean_metrics)),
-                                lid,
-                                space_id,
-                            )
+                    data.append(
+                        (
+                            timestamps[i],
+                            resolved_run_id,
+                            run,
+                            steps[i],
+                            orjson.dumps(serialize_values(clean_metrics)),
+                            lid,
+                            space_id,
                         )
-
-                if supports_run_ids:
-                    cursor.executemany(
-                        """
-                        INSERT OR IGNORE INTO metrics
-                        (timestamp, run_id, run_name, step, metrics, log_id, space_id)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        data,
-                    )
-                else:
-                    cursor.executemany(
-                        """
-                        INSERT OR IGNORE INTO metrics
-                        (timestamp, run_name, step, metrics, log_id, space_id)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                        """,
-                        data,
                     )
 
+                SQLiteStorage._insert_metrics_rows(cursor, data, supports_run_ids)
                 SQLiteStorage._insert_trace_rows(cursor, trace_rows)
 
                 if config:
@@ -1728,6 +1700,88 @@ class SQLiteStorage:
 
                 conn.commit()
 
+    @staticmethod
+    def _insert_metrics_rows(
+        cursor: sqlite3.Cursor, data: list[tuple], supports_run_ids: bool
+    ):
+        """Insert `(timestamp, run_id, run_name, step, metrics, log_id, space_id)`
+        tuples into the metrics table, dropping `run_id` for legacy schemas."""
+        if supports_run_ids:
+            cursor.executemany(
+                """
+                INSERT OR IGNORE INTO metrics
+                (timestamp, run_id, run_name, step, metrics, log_id, space_id)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                data,
+            )
+        else:
+            cursor.executemany(
+                """
+                INSERT OR IGNORE INTO metrics
+                (timestamp, run_name, step, metrics, log_id, space_id)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                [(row[0], *row[2:]) for row in data],
+            )
+
+    @staticmethod
+    def bulk_log_columnar(
+        project: str,
+        run: str,
+        columns: list[str],
+        values: np.ndarray,
+        present: np.ndarray,
+        steps: list[int],
+        timestamps: list[str],
+        space_id: str | None = None,
+        run_id: str | None = None,
+    ):
+        """
+        Log numeric metrics given column-wise. `values` is a 2D float array with one
+        row per step and one column per name in `columns`, and `present` is a boolean
+        array of the same shape marking which cells hold a value. Unlike `bulk_log`,
+        values are written without trace extraction or per-value serialization, so
+        this is only meant for plain numeric metrics such as imported CSV files.
+        """
+        if len(steps) != len(values) or len(timestamps) != len(values):
+            raise ValueError("values, steps, and timestamps must have the same length")
+        if not len(values):
+            return
+
+        complete_rows = present.all(axis=1).tolist()
+        nonfinite_rows = (~np.isfinite(values) & present).any(axis=1).tolist()
+        payloads = []
+        for row_values, row_mask, complete, nonfinite in zip(
+            values.tolist(), present.tolist(), complete_rows, nonfinite_rows
+        ):
+            if complete:
+                metrics = dict(zip(columns, row_values))
+            else:
+                metrics = {
+                    column: value
+                    for column, value, is_present in zip(columns, row_values, row_mask)
+                    if is_present
+                }
+            if nonfinite:
+                metrics = serialize_values(metrics)
+            payloads.append(orjson.dumps(metrics))
+
+        resolved_run_id = run_id or run
+        data = [
+            (timestamp, resolved_run_id, run, step, payload, None, space_id)
+            for timestamp, step, payload in zip(timestamps, steps, payloads)
+        ]
+
+        db_path = SQLiteStorage.init_db(project)
+        with SQLiteStorage._get_process_lock(project):
+            with SQLiteStorage._get_connection(db_path) as conn:
+                cursor = conn.cursor()
+                SQLiteStorage._insert_metrics_rows(
+                    cursor, data, SQLiteStorage._supports_run_ids(conn)
+                )
+                conn.commit()
+
     @staticmethod
     def bulk_log_system(
         project: str,
@@ -2079,6 +2133,59 @@ class SQLiteStorage:
 
         return out
 
+    @staticmethod
+    def get_system_metric_series(
+        project: str,
+        run: str | None,
+        metric_name: str,
+        run_id: str | None = None,
+    ) -> list[dict]:
+        """Get the values of a single system metric for a run, as
+        `{"timestamp": ..., metric_name: value}` dicts ordered by timestamp. Rows
+        that did not record the metric are skipped, so an empty list means the
+        metric was never logged for the run."""
+        db_path = SQLiteStorage.get_project_db_path(project)
+        if not db_path.exists():
+            return []
+
+        try:
+            with SQLiteStorage._get_connection(db_path) as conn:
+                cursor = conn.cursor()
+                run_identity = SQLiteStorage._resolve_run_identity(
+                    conn, run_name=run, run_id=run_id, table="system_metrics"
+                )
+                if run_identity is None:
+                    return []
+                cursor.execute(
+                    f"""
+                    SELECT s.timestamp, j.type, j.value
+                    FROM system_metrics AS s
+                    JOIN json_each(s.metrics) AS j
+                    WHERE s.{run_identity[0]} = ? AND j.key = ?
+                    ORDER BY s.timestamp
+                    """,
+                    (run_identity[1], metric_name),
+                )
+                rows = cursor.fetchall()
+        except sqlite3.OperationalError as e:
+            if "no such table: system_metrics" in str(e):
+                return []
+            raise
+
+        results = []
+        for row in rows:
+            json_type = row["type"]
+            if json_type in ("object", "array"):
+                value = orjson.loads(row["value"])
+            elif json_type in ("true", "false"):
+                value = json_type == "true"
+            else:
+                value = row["value"]
+            entry = deserialize_values({metric_name: value})
+            entry["timestamp"] = row["timestamp"]
+            results.append(entry)
+        return results
+
     @staticmethod
     def get_all_system_metrics_for_run(
         project: str, run: str | None = None, run_id: str | None = None
@@ -2819,6 +2926,86 @@ class SQLiteStorage:
         """Get list of all runs for a project, ordered by creation time."""
         return [record["name"] for record in SQLiteStorage.get_run_records(project)]
 
+    @staticmethod
+    def run_exists(project: str, run: str) -> bool:
+        """Check whether `run` is one of the names returned by `get_runs`, without
+        listing every run in the project."""
+        SQLiteStorage._ensure_hub_loaded()
+        db_path = SQLiteStorage.get_project_db_path(project)
+        if not db_path.exists():
+            return False
+
+        try:
+            with SQLiteStorage._get_connection(db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT 1 FROM metrics WHERE run_name = ? LIMIT 1", (run,)
+                )
+                if cursor.fetchone() is not None:
+                    return True
+                if not SQLiteStorage._table_columns(conn, "run_artifact_links"):
+                    return False
+                if not SQLiteStorage._supports_run_ids(conn):
+                    cursor.execute(
+                        "SELECT 1 FROM run_artifact_links WHERE run_name = ? LIMIT 1",
+                        (run,),
+                    )
+                    return cursor.fetchone() is not None
+                cursor.execute(
+                    """
+                    SELECT 1 FROM run_artifact_links AS l
+                    WHERE l.run_name = ?
+                      AND (l.run_id IS NULL OR NOT EXISTS (
+                        SELECT 1 FROM metrics m WHERE m.run_id = l.run_id
+                      ))
+                      AND (l.run_id IS NOT NULL OR l.run_name NOT IN (
+                        SELECT run_name FROM run_artifact_links
+                        WHERE run_id IS NOT NULL AND run_name IS NOT NULL
+                      ))
+                    LIMIT 1
+                    """,
+                    (run,),
+                )
+                return cursor.fetchone() is not None
+        except sqlite3.OperationalError as e:
+            if "no such table: metrics" in str(e):
+                return False
+            raise
+
+    @staticmethod
+    def metric_exists(
+        project: str, run: str | None, metric_name: str, run_id: str | None = None
+    ) -> bool:
+        """Check whether `metric_name` was logged in a run, stopping at the first
+        row that contains it."""
+        db_path = SQLiteStorage.get_project_db_path(project)
+        if not db_path.exists():
+            return False
+
+        try:
+            with SQLiteStorage._get_connection(db_path) as conn:
+                cursor = conn.cursor()
+                run_identity = SQLiteStorage._resolve_run_identity(
+                    conn, run_name=run, run_id=run_id
+                )
+                if run_identity is None:
+                    return False
+                cursor.execute(
+                    f"""
+                    SELECT 1
+                    FROM metrics AS m
+                    JOIN json_each(m.metrics) AS j
+                    WHERE m.{run_identity[0]} = ? AND j.key = ?
+                    LIMIT 1
+                    """,
+                    (run_identity[1], metric_name),
+                )
+                return cursor.fetchone() is not None
+        except sqlite3.OperationalError as e:
+            if "no such table: metrics" in str(e):
+                return False
+            raise
+
     @staticmethod
     def _validate_read_only_query(query: str) -> str:
         normalized = query.strip().rstrip(";").strip()
@@ -4046,6 +4233,78 @@ class SQLiteStorage:
                     )
             return result
 
+    @staticmethod
+    def get_reports(
+        project: str,
+        run: str | None = None,
+        report_name: str | None = None,
+        run_id: str | None = None,
+    ) -> list[dict]:
+        """Get markdown report entries for a project, optionally scoped to a run
+        and/or a single report key.
+
+        The markdown payloads are located with SQLite's JSON functions so the rest
+        of each metrics blob is never decoded in Python. Entries are ordered by run
+        creation time, then by timestamp.
+        """
+        db_path = SQLiteStorage.get_project_db_path(project)
+        if not db_path.exists():
+            return []
+
+        try:
+            with SQLiteStorage._get_connection(db_path) as conn:
+                cursor = conn.cursor()
+                run_key = (
+                    "run_id" if SQLiteStorage._supports_run_ids(conn) else "run_name"
+                )
+                conditions = [
+                    "CASE WHEN r.type = 'object' "
+                    "THEN json_extract(r.value, '$._type') END = ?",
+                    "json_type(r.value, '$._value') = 'text'",
+                ]
+                params: list[Any] = [Markdown.TYPE]
+                if run is not None or run_id is not None:
+                    run_identity = SQLiteStorage._resolve_run_identity(
+                        conn, run_name=run, run_id=run_id
+                    )
+                    if run_identity is None:
+                        return []
+                    conditions.append(f"m.{run_identity[0]} = ?")
+                    params.append(run_identity[1])
+                if report_name is not None:
+                    conditions.append("r.key = ?")
+                    params.append(report_name)
+                cursor.execute(
+                    f"""
+                    SELECT m.run_name, m.timestamp, m.step, r.key,
+                           json_extract(r.value, '$._value') AS content
+                    FROM metrics AS m
+                    JOIN (
+                        SELECT {run_key}, MIN(timestamp) AS created_at
+                        FROM metrics
+                        GROUP BY {run_key}
+                    ) AS first_seen ON first_seen.{run_key} = m.{run_key}
+                    JOIN json_each(m.metrics) AS r
+                    WHERE {" AND ".join(conditions)}
+                    ORDER BY first_seen.created_at, m.{run_key}, m.timestamp, m.id
+                    """,
+                    params,
+                )
+                return [
+                    {
+                        "run": row["run_name"],
+                        "report": row["key"],
+                        "step": row["step"],
+                        "timestamp": row["timestamp"],
+                        "content": row["content"],
+                    }
+                    for row in cursor.fetchall()
+                ]
+        except sqlite3.OperationalError as e:
+            if "no such table: metrics" in str(e):
+                return []
+            raise
+
     @staticmethod
     def get_all_metrics_for_run(
         project: str, run: str | None = None, run_id: str | None = None
@@ -5135,31 +5394,56 @@ class SQLiteStorage:
 
     @staticmethod
     def get_all_logs_for_sync(project: str) -> list[dict]:
-        return SQLiteStorage._get_all_for_sync(
+        return [
+            entry
+            for batch in SQLiteStorage.iter_all_logs_for_sync(project)
+            for entry in batch
+        ]
+
+    @staticmethod
+    def iter_all_logs_for_sync(
+        project: str, batch_size: int = 500
+    ) -> Iterator[list[dict]]:
+        return SQLiteStorage._iter_all_for_sync(
             project,
             "metrics",
             order_by="run_name, step",
+            batch_size=batch_size,
             extra_fields=["step"],
             include_config=True,
         )
 
     @staticmethod
     def get_all_system_logs_for_sync(project: str) -> list[dict]:
-        return SQLiteStorage._get_all_for_sync(
-            project, "system_metrics", order_by="run_name, timestamp"
+        return [
+            entry
+            for batch in SQLiteStorage.iter_all_system_logs_for_sync(project)
+            for entry in batch
+        ]
+
+    @staticmethod
+    def iter_all_system_logs_for_sync(
+        project: str, batch_size: int = 500
+    ) -> Iterator[list[dict]]:
+        return SQLiteStorage._iter_all_for_sync(
+            project,
+            "system_metrics",
+            order_by="run_name, timestamp",
+            batch_size=batch_size,
         )
 
     @staticmethod
-    def _get_all_for_sync(
+    def _iter_all_for_sync(
         project: str,
         table: str,
         order_by: str,
+        batch_size: int,
         extra_fields: list[str] | None = None,
         include_config: bool = False,
-    ) -> list[dict]:
+    ) -> Iterator[list[dict]]:
         db_path = SQLiteStorage.get_project_db_path(project)
         if not db_path.exists():
-            return []
+            return
         extra_cols = ", ".join(extra_fields) + ", " if extra_fields else ""
         with SQLiteStorage._get_connection(db_path) as conn:
             cursor = conn.cursor()
@@ -5172,24 +5456,24 @@ class SQLiteStorage:
                     FROM {table} ORDER BY {order_by}"""
                 )
             except sqlite3.OperationalError:
-                return []
-            rows = cursor.fetchall()
-            results = []
-            for row in rows:
-                metrics = deserialize_values(orjson.loads(row["metrics"]))
-                entry = {
-                    "project": project,
-                    "run": row["run_name"],
-                    "run_id": row["run_name"],
-                    "metrics": metrics,
-                    "timestamp": row["timestamp"],
-                    "log_id": row["log_id"],
-                }
-                if "run_id" in row.keys():
-                    entry["run_id"] = row["run_id"]
-                for field in extra_fields or []:
-                    entry[field] = row[field]
-                if include_config:
-                    entry["config"] = None
-                results.append(entry)
-            return results
+                return
+            while rows := cursor.fetchmany(batch_size):
+                batch = []
+                for row in rows:
+                    metrics = deserialize_values(orjson.loads(row["metrics"]))
+                    entry = {
+                        "project": project,
+                        "run": row["run_name"],
+                        "run_id": row["run_name"],
+                        "metrics": metrics,
+                        "timestamp": row["timestamp"],
+                        "log_id": row["log_id"],
+                    }
+                    if "run_id" in row.keys():
+                        entry["run_id"] = row["run_id"]
+                    for field in extra_fields or []:
+                        entry[field] = row[field]
+                    if include_config:
+                        entry["config"] = None
+                    batch.append(entry)
+                yield batch
@@ -1026,6 +1026,9 @@ def generate_embed_code(
     return f'<iframe src="{embed_url}" style="width:1600px; height:500px; border:0;"></iframe>'
 
 
+_PLAIN_JSON_TYPES = frozenset({int, bool, str, type(None)})
+
+
 def serialize_values(metrics):
     """
     Serialize values to make them JSON-compliant.
@@ -1040,6 +1043,11 @@ def serialize_values(metrics):
     """
 
     def _serialize(value):
+        value_type = type(value)
+        if value_type is float and math.isfinite(value):
+            return value
+        if value_type in _PLAIN_JSON_TYPES:
+            return value
         if isinstance(value, dict):
             return {str(key): _serialize(item) for key, item in value.items()}
         if isinstance(value, (list, tuple, set)):